@@ -75,7 +75,7 @@ def start_app(fnames=[], name=[], dims=None, plot_method=None,
               exclude_plugins=rcParams['plugins.exclude'], offline=False,
               pwd=None, script=None, command=None, exec_=True, use_all=False,
               callback=None,
-              opengl_implementation=None):
+              opengl_implementation=None, recipe=None, roi=None):
     """
     Eventually start the QApplication or only make a plot
 
@@ -126,6 +126,20 @@ def start_app(fnames=[], name=[], dims=None, plot_method=None,
         OpenGL implementation to pass to Qt. Possible options are
         'software', 'desktop', 'gles' and 'automatic' (which let's PyQt
         decide).
+    recipe: str
+        The path to a recipe of the plot creator (see
+        :mod:`psyplot_gui.recipes`) that is applied to each of the `fnames`.
+        This requires the `output` parameter, where ``'{stem}'`` is replaced
+        by the name of the file. The files are processed in parallel (see
+        the ``'main.batch_processes'`` configuration value)
+    roi: dict
+        The bounds of a region of interest that is selected from the dataset
+        before the data is read. A mapping from coordinate name (or ``'x'``,
+        ``'y'``, ``'z'`` and ``'t'`` for the coordinates identified by the
+        CF-conventions) to a tuple ``(min, max)`` (see
+        :func:`psyplot_gui.datasets.roi_indexers`). The `dims` then refer to
+        the indices in this region. On the command line, use
+        ``-roi lon,0,30 lat,40,60 t,2000-01,2000-12``
 
     Returns
     -------
@@ -156,8 +170,27 @@ def start_app(fnames=[], name=[], dims=None, plot_method=None,
 
     if dims is not None and not isinstance(dims, dict):
         dims = dict(chain(*map(six.iteritems, dims)))
+    if roi is not None and not isinstance(roi, dict):
+        roi = dict(chain(*map(six.iteritems, roi)))
+
+    if recipe is not None and output is None:
+        warn('The `recipe` parameter is ignored if the `output` parameter is '
+             'not set!')
+    elif recipe is not None:
+        from psyplot_gui.recipes import load_recipe, batch_export
+        batch_export(load_recipe(recipe), fnames, output, engine=engine,
+                     concat_dim=concat_dim, roi=roi)
+        return
 
     if output is not None:
+        if project is None and plot_method is not None:
+            from psyplot_gui.datasets import open_dataset, is_zarr
+            # open the files in parallel (see the 'main.parallel_open' item
+            # of the rcParams), select the region of interest and open zarr
+            # stores with their consolidated metadata
+            if len(fnames) > 1 or roi or any(map(is_zarr, fnames)):
+                fnames = open_dataset(fnames, engine=engine,
+                                      concat_dim=concat_dim, roi=roi)
         return make_plot(
             fnames=fnames, name=name, dims=dims, plot_method=plot_method,
             output=output, project=project, engine=engine,
@@ -204,7 +237,8 @@ def start_app(fnames=[], name=[], dims=None, plot_method=None,
         if callback:
             send_files_to_psyplot(
                 callback, fnames, project, engine, plot_method, name, dims,
-                encoding, enable_post, seaborn_style, concat_dim, chname)
+                encoding, enable_post, seaborn_style, concat_dim, chname,
+                roi)
         return
     elif new_instance:
         rcParams['main.listen_to_port'] = False
@@ -225,7 +259,7 @@ def start_app(fnames=[], name=[], dims=None, plot_method=None,
     else:
         mainwindow = MainWindow.run(fnames, project, engine, plot_method, name,
                                     dims, encoding, enable_post, seaborn_style,
-                                    concat_dim, chname)
+                                    concat_dim, chname, roi)
     if script is not None:
         mainwindow.console.run_script_in_shell(script)
     if command is not None:
@@ -274,6 +308,16 @@ def _get_abs_names(fnames):
     return fnames
 
 
+def _load_roi(s):
+    """Parse the bounds of a region of interest from the command line"""
+    s = s.split(',')
+    if len(s) != 3:
+        raise argparse.ArgumentTypeError(
+            "The region of interest must be specified via coord,min,max, "
+            "not %r!" % ','.join(s))
+    return {s[0]: (s[1] or None, s[2] or None)}
+
+
 def get_parser(create=True):
     """Return a parser to make that can be used to make plots or open files
     from the command line
@@ -324,6 +368,11 @@ def get_parser(create=True):
     parser.update_arg('opengl_implementation', group=gui_grp, short='opengl',
                       choices=['software', 'desktop', 'gles', 'automatic'])
 
+    parser.update_arg('recipe', metavar='recipe.yml')
+
+    parser.update_arg('roi', nargs='+', type=_load_roi,
+                      metavar='coord,min,max')
+
     # add an action to display the GUI plugins
     info_grp = parser.unfinished_arguments['list_plugins'].get('group')
     parser.update_arg(
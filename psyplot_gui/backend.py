@@ -2,6 +2,7 @@
 psyplot gui
 
 This backend is based upon matplotlibs qt4agg and qt5agg backends."""
+from contextlib import contextmanager
 from psyplot_gui.compat.qtcompat import (
     QDockWidget, Qt, QWidget, QVBoxLayout, with_qt5)
 from psyplot_gui.common import DockMixin
@@ -15,6 +16,47 @@ else:
         show, FigureManagerQT, FigureCanvasQTAgg)
 
 
+#: The docks of the figures that have been created within the
+#: :func:`batch_figures` context (or None, if we are not in such a context)
+_pending_docks = None
+
+
+@contextmanager
+def batch_figures():
+    """Context manager to create multiple figures at once
+
+    Within this context, the main window is not repainted and the docks of
+    new figures are only tabified and shown when the context is left (instead
+    of once per figure). Nested contexts are merged into the outermost one.
+    """
+    global _pending_docks
+    from psyplot_gui.main import mainwindow
+    if mainwindow is None or _pending_docks is not None:
+        yield
+        return
+    _pending_docks = pending = []
+    updates = mainwindow.updatesEnabled()
+    mainwindow.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        _pending_docks = None
+        try:
+            for dock in pending:
+                _tabify_figure(mainwindow, dock)
+        finally:
+            mainwindow.setUpdatesEnabled(updates)
+        if pending:
+            mainwindow.show()
+
+
+def _tabify_figure(mainwindow, dock):
+    """Tabify the `dock` of a new figure with the last figure"""
+    if mainwindow.figures:
+        mainwindow.tabifyDockWidget(mainwindow.figures[-1], dock)
+    mainwindow.figures.append(dock)
+
+
 class FiguresDock(QDockWidget):
     """Reimplemented QDockWidget to remove the dock widget when closed
     """
@@ -28,6 +70,10 @@ class FiguresDock(QDockWidget):
             mainwindow.figures.remove(self)
         except Exception:
             pass
+        try:
+            _pending_docks.remove(self)
+        except Exception:
+            pass
         try:
             mainwindow.removeDockWidget(self)
         except Exception:
@@ -74,9 +120,11 @@ class PsyplotCanvasManager(FigureManagerQT):
         self.window = dock = parent_widget.to_dock(
             mainwindow, title="Figure %d" % num, position=Qt.TopDockWidgetArea,
             docktype=None)
-        if mainwindow.figures:
-            mainwindow.tabifyDockWidget(mainwindow.figures[-1], dock)
-        mainwindow.figures.append(dock)
+        batch = _pending_docks is not None
+        if batch:
+            _pending_docks.append(dock)
+        else:
+            _tabify_figure(mainwindow, dock)
         FigureManagerBase.__init__(self, canvas, num)
         self.canvas = canvas
 
@@ -106,7 +154,8 @@ class PsyplotCanvasManager(FigureManagerQT):
         self.canvas.setFocus()
         self.window._destroying = False
 
-        self.main.show()
+        if not batch:
+            self.main.show()
 
         def notify_axes_change(fig):
             # This will be called whenever the current axes is changed
@@ -4,7 +4,10 @@ import six
 import inspect
 import traceback as tb
 from functools import partial
+import os
 import os.path as osp
+import threading
+from collections import OrderedDict
 from psyplot_gui.compat.qtcompat import (
     QDockWidget, QRegExpValidator, QtCore, QErrorMessage, QDesktopWidget,
     QToolButton, QInputDialog, QIcon, QAction)
@@ -38,6 +41,157 @@ def get_icon(name):
     return osp.join(get_module_path('psyplot_gui'), 'icons', name)
 
 
+def get_cache_dir(name):
+    """Get the directory for the files that are cached by the GUI
+
+    Parameters
+    ----------
+    name: str
+        The name of the sub directory in the psyplot configuration directory
+
+    Returns
+    -------
+    str
+        The path to the (existing) directory"""
+    from psyplot.config.rcsetup import get_configdir
+    path = osp.join(get_configdir(), 'gui_cache', name)
+    if not osp.exists(path):
+        os.makedirs(path)
+    return path
+
+
+def get_cache_size():
+    """Get the maximum number of entries of the caches of the GUI
+
+    Returns
+    -------
+    int
+        The ``'main.cache_size'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams`"""
+    from psyplot_gui.config.rcsetup import rcParams
+    return rcParams['main.cache_size']
+
+
+def touch_cache_file(fname):
+    """Mark a file of a cache directory as recently used
+
+    Parameters
+    ----------
+    fname: str
+        The path to the file (see :func:`prune_cache_dir`)"""
+    try:
+        os.utime(fname, None)
+    except OSError:
+        pass
+
+
+def prune_cache_dir(name):
+    """Remove the least recently used files of a cache directory
+
+    Only the :func:`get_cache_size` most recently modified (or touched, see
+    :func:`touch_cache_file`) files are kept
+
+    Parameters
+    ----------
+    name: str
+        The name of the cache directory (see :func:`get_cache_dir`)"""
+    path = get_cache_dir(name)
+    size = get_cache_size()
+    files = [osp.join(path, f) for f in os.listdir(path)]
+    if len(files) <= size:
+        return
+
+    def mtime(fname):
+        try:
+            return osp.getmtime(fname)
+        except OSError:  # removed in the meantime
+            return 0
+
+    files.sort(key=mtime)
+    for fname in files[:len(files) - size]:
+        try:
+            os.remove(fname)
+        except OSError:
+            pass
+
+
+class LRUCache(object):
+    """A thread-safe in-memory cache of the least recently used items
+
+    The cache holds at most :func:`get_cache_size` items. If more are
+    inserted, the least recently used items are removed"""
+
+    def __init__(self):
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = self._data.pop(key)
+            self._data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        size = get_cache_size()
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > size:
+                self._data.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Get an item or `default`, if it is not in the cache"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def clear(self):
+        """Remove all items"""
+        with self._lock:
+            self._data.clear()
+
+
+def file_identity(fname):
+    """Get a hashable identifier of a file that changes with its content
+
+    Parameters
+    ----------
+    fname: str
+        The path to the file
+
+    Returns
+    -------
+    tuple
+        The absolute path, the modification time and the size of the file.
+        For directories (e.g. zarr stores), the latest modification time and
+        the total size of all files and subdirectories in the directory tree
+        are used"""
+    fname = osp.abspath(fname)
+    stat = os.stat(fname)
+    if not osp.isdir(fname):
+        return (fname, stat.st_mtime, stat.st_size)
+    mtime, size = stat.st_mtime, 0
+    for root, dirs, files in os.walk(fname):
+        for name in dirs + files:
+            try:
+                entry_stat = os.stat(osp.join(root, name))
+            except OSError:  # removed in the meantime
+                continue
+            mtime = max(mtime, entry_stat.st_mtime)
+            size += entry_stat.st_size
+    return (fname, mtime, size)
+
+
 class DockMixin(object):
     """A mixin class to define psyplot_gui plugins
 
@@ -263,9 +417,23 @@ class PyErrorMessage(QErrorMessage):
     """Widget designed to display python errors via the :meth:`showTraceback`
     method"""
 
-    def showTraceback(self, header=None):
+    def showTraceback(self, header=None, exc_info=None):
+        """Show the traceback of the last (or the given) exception
+
+        Parameters
+        ----------
+        header: str
+            A header to display before the traceback
+        exc_info: tuple
+            The ``(type, value, traceback)`` tuple of an exception (see
+            :func:`sys.exc_info`). If None, the exception that is currently
+            handled is used. This is useful for exceptions that have been
+            raised in a separate thread (see :class:`WorkerThread`)"""
         s = io.StringIO()
-        tb.print_exc(file=s)
+        if exc_info is None:
+            tb.print_exc(file=s)
+        else:
+            tb.print_exception(*exc_info, file=s)
         last_tb = '<p>' + '<br>'.join(s.getvalue().splitlines()) + \
             '</p>'
         header = header + '\n' if header else ''
@@ -292,6 +460,98 @@ class PyErrorMessage(QErrorMessage):
         self.resize(max(available_width, width), max(available_height, height))
 
 
+class WorkerThread(QtCore.QThread):
+    """A thread to run a long-running job without blocking the GUI
+
+    The job is a callable that accepts the thread as first argument to report
+    its progress via :meth:`report_progress` (which returns False, if the job
+    shall stop because :meth:`cancel` has been called).
+    Whether the job runs in a separate thread or not is determined by the
+    ``'main.background_jobs'`` configuration value"""
+
+    #: A signal that is emitted with the result of the job when it finished
+    result_ready = QtCore.pyqtSignal(object)
+
+    #: A signal that is emitted with the ``(type, value, traceback)`` tuple of
+    #: the exception that has been raised by the job
+    job_error = QtCore.pyqtSignal(object)
+
+    #: A signal that is emitted when the job finished after it has been
+    #: cancelled
+    job_cancelled = QtCore.pyqtSignal()
+
+    #: A signal that is emitted to report the progress of the job. The first
+    #: argument is the number of finished steps, the second one the total
+    #: number of steps (0 if unknown)
+    progress_changed = QtCore.pyqtSignal(int, int)
+
+    #: Boolean that is True if the job shall be stopped
+    cancelled = False
+
+    def __init__(self, func, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        func: callable
+            The job to run. It is called via ``func(self, *args, **kwargs)``
+        ``*args, **kwargs``
+            Any other argument that is passed to `func`"""
+        super(WorkerThread, self).__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result = self.exc_info = None
+
+    def run_job(self):
+        """Run the job in a separate thread or in the current thread"""
+        from psyplot_gui.config.rcsetup import rcParams
+        self.cancelled = False
+        if rcParams['main.background_jobs']:
+            self.start()
+        else:
+            self.run()
+
+    def run(self):
+        """Run the job and emit the corresponding signal"""
+        self.result = self.exc_info = None
+        try:
+            self.result = self.func(self, *self.args, **self.kwargs)
+        except Exception:
+            self.exc_info = sys.exc_info()
+            # an error raised because the job has been interrupted is not
+            # reported
+            if self.cancelled:
+                self.job_cancelled.emit()
+            else:
+                self.job_error.emit(self.exc_info)
+        else:
+            if self.cancelled:
+                self.job_cancelled.emit()
+            else:
+                self.result_ready.emit(self.result)
+
+    def report_progress(self, i, n=0):
+        """Report the progress of the job
+
+        Parameters
+        ----------
+        i: int
+            The number of finished steps
+        n: int
+            The total number of steps (0 if unknown)
+
+        Returns
+        -------
+        bool
+            False, if the job has been cancelled, else True"""
+        self.progress_changed.emit(i, n)
+        return not self.cancelled
+
+    def cancel(self):
+        """Tell the job to stop as soon as possible"""
+        self.cancelled = True
+
+
 class StreamToLogger(object):
     """
     Fake file-like stream object that redirects writes to a logger instance.
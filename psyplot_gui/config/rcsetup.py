@@ -216,6 +216,78 @@ defaultParams = {
         'software', validate_str,
         "The opengl implementation to use. Should be one of 'software', "
         "'desktop', 'gles' or 'automatic'."],
+    'main.background_jobs': [
+        True, validate_bool,
+        "If True, long-running jobs of the GUI (such as exporting data "
+        "frames) are executed in a separate thread to not block the GUI"],
+    'main.parallel_open': [
+        True, validate_bool,
+        "If True and dask is installed, the files of a multi-file dataset are "
+        "opened and decoded concurrently in a thread pool"],
+    'main.open_workers': [
+        0, validate_int,
+        "The number of threads that are used to open multiple files if "
+        "'main.parallel_open' is True. If 0, the number of CPUs is used."],
+    'main.time_cache': [
+        True, validate_bool,
+        "If True, the decoded CF times of opened files are cached in memory "
+        "and on disk such that the calendar is only decoded once"],
+    'main.cache_size': [
+        1000, validate_int,
+        "The maximum number of entries in each of the caches of the GUI (e.g. "
+        "the decoded times and the thumbnails). The least recently used "
+        "entries are removed first, both in memory and on disk."],
+    'main.batch_processes': [
+        0, validate_int,
+        "The number of processes that are used to apply a recipe of the plot "
+        "creator to multiple files. If 0, the number of CPUs is used."],
+    'dataframeeditor.export_chunksize': [
+        100000, validate_int,
+        "The number of rows that are written at once when exporting a "
+        "DataFrame from the DataFrameEditor to a CSV or Parquet file. The "
+        "export progress is updated after each chunk."],
+    'dataframeeditor.csv_sample_rows': [
+        10000, validate_int,
+        "The number of rows that are used to infer the data types when "
+        "opening a csv file in the DataFrameEditor. The inferred schema is "
+        "cached per file."],
+    'dataframeeditor.choose_columns': [
+        True, validate_bool,
+        "If True, the user can select the columns to load when opening a "
+        "csv file through the file dialog of the DataFrameEditor"],
+    'plotcreator.thumbnails': [
+        False, validate_bool,
+        "If True, the variables table of the plot creator shows quick-look "
+        "thumbnails of the variables. They are rendered in the background "
+        "and cached on disk"],
+    'plotcreator.thumbnail_size': [
+        64, validate_int,
+        "The size of the thumbnails in the plot creator in pixels"],
+    'plotcreator.thumbnail_workers': [
+        2, validate_int,
+        "The number of threads that render the thumbnails in the plot "
+        "creator. If 0, the number of CPUs is used."],
+    'plotcreator.prefetch_memory': [
+        256, validate_int,
+        "The maximum memory in MB that is used to load the data of the valid "
+        "arrays in the plot creator in the background, before the plots are "
+        "created. If 0, the data is not prefetched."],
+    'plotcreator.overview_size': [
+        500, validate_int,
+        "The maximum number of cells per dimension of an overview dataset in "
+        "the plot creator. Larger dimensions are coarsened by the "
+        "corresponding integer factor."],
+    'plotcreator.auto_chunk': [
+        True, validate_bool,
+        "If True, the datasets that are opened in the plot creator are "
+        "rechunked with dask such that every chunk contains the full data of "
+        "one or more plots of the selected plot method (e.g. time steps of a "
+        "map)"],
+    'plotcreator.chunk_memory': [
+        128, validate_int,
+        "The maximum size of one chunk in MB for the 'plotcreator.auto_chunk' "
+        "option. Larger chunks are split along the plotted dimensions and "
+        "smaller ones are grouped along the other dimensions."],
     'content.load_tooltips': [
         True, validate_bool,
         "If True, a lazy load is performed on the arrays and data sets and "
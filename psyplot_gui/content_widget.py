@@ -12,6 +12,7 @@ import os.path as osp
 import sip
 import weakref
 from itertools import chain
+from functools import partial
 from psyplot_gui import rcParams
 from psyplot_gui.compat.qtcompat import (
     QToolBox, QListWidget, QListWidgetItem, QAbstractItemView,
@@ -20,8 +21,8 @@ from psyplot_gui.compat.qtcompat import (
 from psyplot.config.rcsetup import safe_list
 from psyplot.compat.pycompat import OrderedDict, map, range
 from psyplot.project import scp, gcp, Project
-from psyplot.data import ArrayList, InteractiveList
-from psyplot.utils import _TempBool
+from psyplot.data import ArrayList, InteractiveList, Signal, get_filename_ds
+from psyplot.utils import _TempBool, is_remote_url
 from psyplot_gui.common import DockMixin
 
 
@@ -32,6 +33,10 @@ class ArrayItem(QListWidgetItem):
     #: :class:`psyplot.data.InteractiveArray` instance
     arr = None
 
+    #: The position of the array in the main project that is used for sorting
+    #: the items
+    sort_key = 0
+
     def __init__(self, ref, *args, **kwargs):
         """
         Parameters
@@ -68,6 +73,15 @@ class ArrayItem(QListWidgetItem):
             arr.onupdate.disconnect(self.set_text_from_array)
         del self.arr
 
+    def __lt__(self, other):
+        # reimplemented to sort the items by their position in the project
+        return self.sort_key < other.sort_key
+
+
+def _arr_key(arr):
+    """Get the key of an array for the :class:`PlotterList`"""
+    return id(arr.psy)
+
 
 class PlotterList(QListWidget):
     """QListWidget showing multiple ArrayItems of one Plotter class"""
@@ -117,6 +131,8 @@ class PlotterList(QListWidget):
         ``gcp(True)`` and ``gcp()``"""
         super(PlotterList, self).__init__(*args, **kwargs)
         self.project_attribute = plotter_type
+        #: A mapping from the id of an array to its :class:`ArrayItem`
+        self._items = {}
         self.setSelectionMode(QAbstractItemView.MultiSelection)
         self.itemSelectionChanged.connect(self.update_cp)
         self.update_from_project(gcp(True))
@@ -154,48 +170,76 @@ class PlotterList(QListWidget):
                 for item in self.array_items:
                     item.setSelected(False)
             elif project.is_main:
-                old_arrays = self.arrays
-                # remove outdated items
-                i = 0
-                for arr in old_arrays:
-                    if arr not in arrays:
-                        item = self.takeItem(i)
-                        item.disconnect_from_array()
-                    else:
-                        i += 1
-                # add new items
-                for arr in arrays:
-                    if arr not in old_arrays:
-                        item = ArrayItem(weakref.ref(arr.psy), parent=self)
-                        self.addItem(item)
-                # resort to match the project
-                for arr in reversed(main_arrays):
-                    for i, item in enumerate(self.array_items):
-                        if item.arr() is arr.psy:
-                            self.insertItem(0, self.takeItem(i))
-            cp = gcp()
+                self._sync_items(arrays, main_arrays)
+            selected = set(map(_arr_key, gcp()))
             for item in self.array_items:
-                item.setSelected(
-                    getattr(item.arr(), 'arr', item.arr()) in cp)
+                is_selected = id(item.arr()) in selected
+                if item.isSelected() != is_selected:
+                    item.setSelected(is_selected)
         self.updated_from_project.emit(self)
 
+    def _sync_items(self, arrays, main_arrays):
+        """Synchronize the items with the `arrays` of the main project
+
+        Only the items of removed arrays are removed and only the items of new
+        arrays are created. Afterwards the items are sorted once to match
+        the order of the `main_arrays`"""
+        new = OrderedDict((_arr_key(arr), arr) for arr in arrays)
+        old_items = self._items
+        self._items = items = {}
+        updates = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            # remove outdated items (from the bottom to keep the rows)
+            for row in range(self.count() - 1, -1, -1):
+                item = self.item(row)
+                arr = item.arr()
+                key = id(arr)
+                if (key in new and old_items.get(key) is item and
+                        new[key].psy is arr):
+                    items[key] = item
+                else:
+                    self.takeItem(row).disconnect_from_array()
+            # add new items
+            for key, arr in six.iteritems(new):
+                if key not in items:
+                    items[key] = ArrayItem(weakref.ref(arr.psy), parent=self)
+            # resort to match the project
+            order = {_arr_key(arr): i for i, arr in enumerate(main_arrays)}
+            n = len(order)
+            for key, item in six.iteritems(items):
+                item.sort_key = order.get(key, n)
+            sort_keys = [self.item(row).sort_key for row in range(
+                self.count())]
+            if sort_keys != sorted(sort_keys):
+                self.sortItems()
+        finally:
+            self.setUpdatesEnabled(updates)
+
     def update_cp(self, *args, **kwargs):
         """Update the current project from what is selected in this list"""
         if not self._no_project_update:
             mp = gcp(True)
-            sp = gcp()
-            selected = [item.arr().arr_name for item in self.selectedItems()]
-            arrays = self.arrays
-            other_selected = [
-                arr.psy.arr_name for arr in sp if arr not in arrays]
+            selected = set(map(id, (item.arr()
+                                    for item in self.selectedItems())))
+            # keep the arrays of the current project that are not in this
+            # list
+            selected.update(key for key in map(_arr_key, gcp())
+                            if key not in self._items)
+            # the array names in the main project are unique, so we bypass
+            # the O(n) name checks of Project.extend and ArrayList.rename
+            # that would make every selection change quadratic
+            sp = mp[:0]
+            list.extend(sp, (arr for arr in mp if _arr_key(arr) in selected))
             with self._no_project_update:
-                scp(mp(arr_name=selected + other_selected))
+                scp(sp)
 
     def disconnect_items(self):
         """Disconnect the items in this list from the arrays"""
         for item in list(self.array_items):
             item.disconnect_from_array()
             self.takeItem(self.indexFromItem(item).row())
+        self._items.clear()
         self.is_empty = True
 
 
@@ -323,6 +367,169 @@ class ProjectContentWidget(QWidget, DockMixin):
         self.setLayout(vbox)
 
 
+class DatasetRegistry(object):
+    """A registry of the datasets in the main project
+
+    This class maintains the descriptions of the datasets of the arrays in the
+    main project (as they are returned by the
+    :meth:`psyplot.project.Project._get_ds_descriptions` method) and updates
+    them incrementally when arrays are added or removed. The
+    :attr:`dataset_registry` of this module is updated whenever the current
+    project changes and it is used by the :class:`DatasetTree` and the
+    :class:`~psyplot_gui.plot_creator.PlotCreator`"""
+
+    #: Signal that is emitted when the base dataset of an array changed
+    onbasechange = Signal('_onbasechange')
+
+    _onbasechange = None
+
+    @property
+    def main(self):
+        """The main project whose datasets are registered"""
+        return self._main()
+
+    def __init__(self):
+        self._main = self._no_main
+        #: A mapping from ``id(arr)`` to a weak reference to the array, the
+        #: number of its dataset and the callback for its
+        #: :attr:`~psyplot.data.InteractiveBase.onbasechange` signal
+        self._arrays = {}
+        #: A mapping from dataset number to its description
+        self._descs = OrderedDict()
+
+    def update(self, project=None):
+        """Synchronize the registry with the main project of `project`
+
+        Only the arrays that have been added or removed since the last update
+        are processed, i.e. only their ids are compared.
+
+        Parameters
+        ----------
+        project: psyplot.project.Project
+            The project whose main project to use. If None, the current main
+            project is used"""
+        main = gcp(True) if project is None else project.main
+        if main is not self.main:
+            self.clear()
+            self._main = weakref.ref(main)
+        arrays = {id(arr): arr for arr in main.arrays}
+        for key in set(self._arrays).difference(arrays):
+            self._remove(key)
+        for key, arr in six.iteritems(arrays):
+            if key in self._arrays and self._arrays[key][0]() is not arr:
+                # the id has been reused by a new array
+                self._remove(key)
+            if key not in self._arrays:
+                self._add(arr)
+
+    @staticmethod
+    def _no_main():
+        return None
+
+    def clear(self):
+        """Remove all datasets from the registry"""
+        for key in list(self._arrays):
+            self._remove(key)
+        self._main = self._no_main
+
+    def _add(self, arr):
+        ds = arr.psy.base
+        num = ds.psy.num
+        desc = self._descs.get(num)
+        if desc is None:
+            fname, store_mod, store_cls = get_filename_ds(ds, dump=False)
+            desc = self._descs[num] = {
+                'ds': weakref.ref(ds), 'num': num,
+                'fname': self._rel_fname(fname),
+                'store': (store_mod, store_cls), 'arr': OrderedDict()}
+        ref = weakref.ref(arr)
+        desc['arr'][id(arr)] = ref
+        callback = partial(self._base_changed, id(arr))
+        arr.psy.onbasechange.connect(callback)
+        self._arrays[id(arr)] = (ref, num, callback)
+
+    def _remove(self, key):
+        ref, num, callback = self._arrays.pop(key)
+        arr = ref()
+        if arr is not None:
+            try:
+                arr.psy.onbasechange.disconnect(callback)
+            except ValueError:
+                pass
+        desc = self._descs[num]
+        del desc['arr'][key]
+        if not desc['arr']:
+            del self._descs[num]
+
+    def _base_changed(self, key):
+        arr = self._arrays[key][0]()
+        self._remove(key)
+        if arr is None:
+            return
+        self._add(arr)
+        self.onbasechange.emit()
+
+    @staticmethod
+    def _rel_fname(fname):
+        """Get the (relative) path of the files of a dataset as in the
+        :meth:`psyplot.data.ArrayList.array_info` method"""
+        def rel(f):
+            if f is None or is_remote_url(f):
+                return f
+            return osp.relpath(f)
+        if fname is None or isinstance(fname, six.string_types):
+            return rel(fname)
+        return tuple(map(rel, fname))
+
+    def get(self, num):
+        """Get the description of one dataset
+
+        Parameters
+        ----------
+        num: int
+            The number of the dataset (see
+            :attr:`psyplot.data.DatasetAccessor.num`)
+
+        Returns
+        -------
+        dict or None
+            The description of the dataset (see :meth:`descriptions`) or None
+            if it is not in the registry"""
+        desc = self._descs.get(num)
+        if desc is None:
+            return None
+        arrays = [ref() for ref in desc['arr'].values()]
+        return dict(desc, ds=desc['ds'](),
+                    arr=[arr for arr in arrays if arr is not None])
+
+    def __contains__(self, arr):
+        return (id(arr) in self._arrays and
+                self._arrays[id(arr)][0]() is arr)
+
+    def descriptions(self, project=None):
+        """Get the descriptions of the registered datasets
+
+        Parameters
+        ----------
+        project: psyplot.project.Project
+            The project whose main project is used. The registry is
+            synchronized with it first (see :meth:`update`)
+
+        Returns
+        -------
+        OrderedDict
+            A mapping from the dataset number to a dictionary with the
+            ``'ds'``, ``'fname'``, ``'num'``, ``'store'`` and ``'arr'`` (the
+            list of arrays in the main project) of the dataset"""
+        self.update(project)
+        return OrderedDict((num, self.get(num)) for num in self._descs)
+
+
+#: The :class:`DatasetRegistry` of the datasets in the main project
+dataset_registry = DatasetRegistry()
+Project.oncpchange.connect(dataset_registry.update)
+
+
 class DatasetTreeItem(QTreeWidgetItem):
     """A QTreeWidgetItem showing informations on one dataset in the main
     project"""
@@ -355,6 +562,8 @@ class DatasetTreeItem(QTreeWidgetItem):
             for i, attr in enumerate(columns, 1):
                 if attr == 'dims':
                     item.setText(i, ', '.join(variable.dims))
+                elif attr == 'chunks':
+                    item.setText(i, self.format_chunks(variable))
                 else:
                     item.setText(i, str(variable.attrs.get(attr, getattr(
                         variable, attr, ''))))
@@ -365,6 +574,26 @@ class DatasetTreeItem(QTreeWidgetItem):
             if rcParams['content.load_tooltips']:
                 item.setToolTip(0, str(variable))
 
+    @staticmethod
+    def format_chunks(variable):
+        """Format the dask chunks of a variable
+
+        Parameters
+        ----------
+        variable: xarray.Variable
+            The variable
+
+        Returns
+        -------
+        str
+            The (maximal) chunk size for each dimension or an empty string, if
+            the variable is not a dask array"""
+        if variable.chunks is None:
+            return ''
+        return ', '.join('%s: %i' % (dim, max(chunks) if chunks else 0)
+                         for dim, chunks in zip(variable.dims,
+                                                variable.chunks))
+
 
 class DatasetTree(QTreeWidget, DockMixin):
     """A QTreeWidget showing informations on all datasets in the main project
@@ -382,6 +611,7 @@ class DatasetTree(QTreeWidget, DockMixin):
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.open_menu)
         Project.oncpchange.connect(self.add_datasets_from_cp)
+        dataset_registry.onbasechange.connect(self.add_datasets_from_cp)
 
     def create_dataset_tree(self):
         """Set up the columns and insert the :class:`DatasetTreeItem`
@@ -389,13 +619,14 @@ class DatasetTree(QTreeWidget, DockMixin):
         self.set_columns()
         self.add_datasets_from_cp(gcp())
 
-    def set_columns(self, columns=['long_name', 'dims', 'shape']):
+    def set_columns(self, columns=['long_name', 'dims', 'shape', 'chunks']):
         """Set up the columns in the DatasetTree.
 
         Parameters
         ----------
         columns: list of str
-            A list of netCDF attributes that shall be shown in columns"""
+            A list of netCDF attributes that shall be shown in columns. The
+            ``'chunks'`` column shows the dask chunks of the variables"""
         self.setColumnCount(len(columns) + 1)
         self.setHeaderLabels(['Dataset'] + list(columns))
         self.attr_columns = columns
@@ -417,10 +648,11 @@ class DatasetTree(QTreeWidget, DockMixin):
         else:
             sp_arrs = project.arrays
             project = project.main
+        sp_arrs = set(map(id, sp_arrs))
         # remove items from the tree
         self.clear()
-        for i, ds_desc in six.iteritems(project._get_ds_descriptions(
-                project.array_info(ds_description='all'))):
+        for i, ds_desc in six.iteritems(
+                dataset_registry.descriptions(project)):
             top_item = DatasetTreeItem(ds_desc['ds'], self.attr_columns, 0)
             if ds_desc['fname'] is not None and not all(
                     s is None for s in ds_desc['fname']):
@@ -429,11 +661,8 @@ class DatasetTree(QTreeWidget, DockMixin):
             else:
                 ds_desc['fname'] = None
             top_item.setText(0, '%s%i: %s' % (
-                '*' if any(any(arr is arr2 for arr2 in sp_arrs)
-                           for arr in ds_desc['arr']) else '',
-                i, ds_desc['fname']))
-            for arr in ds_desc['arr']:
-                arr.psy.onbasechange.connect(self.add_datasets_from_cp)
+                '*' if any(id(arr) in sp_arrs for arr in ds_desc['arr'])
+                else '', i, ds_desc['fname']))
             self.addTopLevelItem(top_item)
 
     def open_menu(self, pos):
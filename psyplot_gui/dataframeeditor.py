@@ -2,6 +2,10 @@
 import os
 import os.path as osp
 import six
+import re
+import json
+import warnings
+import hashlib
 from functools import partial
 import numpy as np
 from psyplot.docstring import docstrings
@@ -9,9 +13,14 @@ from psyplot_gui.compat.qtcompat import (
     QWidget, QHBoxLayout, QVBoxLayout, QtCore, QLineEdit,
     QPushButton, Qt, QToolButton, QIcon, QMenu, QLabel, QtGui, QApplication,
     QCheckBox, QFileDialog, with_qt5, QTableView, QHeaderView,
-    QDockWidget)
+    QDockWidget, QProgressBar, QInputDialog, QDialog, QDialogButtonBox,
+    QListWidget, QListWidgetItem, QDoubleValidator, QAction, QKeySequence,
+    QComboBox)
 from psyplot_gui.common import (DockMixin, get_icon, LoadFromConsoleButton,
-                                PyErrorMessage)
+                                PyErrorMessage, WorkerThread, get_cache_dir,
+                                file_identity, prune_cache_dir,
+                                touch_cache_file, LRUCache)
+from psyplot_gui.config.rcsetup import rcParams
 import pandas as pd
 
 if six.PY2:
@@ -43,6 +52,542 @@ def bool_false_check(value):
     return value
 
 
+#: The formats that are supported by :func:`export_df` with their possible
+#: compressions. The first compression is the default one
+EXPORT_FORMATS = {
+    'csv': [None, 'gzip', 'bz2', 'xz'],
+    'parquet': ['snappy', 'gzip', 'brotli', 'zstd', None],
+    'feather': ['lz4', 'zstd', 'uncompressed'],
+    }
+
+_export_extensions = {
+    '.csv': 'csv', '.txt': 'csv', '.tab': 'csv', '.parquet': 'parquet',
+    '.pq': 'parquet', '.feather': 'feather', '.ft': 'feather'}
+
+_compression_extensions = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+
+
+def _open_compressed(fname, compression=None):
+    """Open a (potentially compressed) text file for writing
+
+    Parameters
+    ----------
+    fname: str
+        The path to the file
+    compression: {None, 'gzip', 'bz2', 'xz'}
+        The compression. If None, it is inferred from the file extension"""
+    if compression is None:
+        compression = _compression_extensions.get(osp.splitext(fname)[1])
+    if compression == 'gzip':
+        import gzip
+        return gzip.open(fname, 'wt', newline='')
+    elif compression == 'bz2':
+        import bz2
+        return bz2.open(fname, 'wt', newline='')
+    elif compression == 'xz':
+        import lzma
+        return lzma.open(fname, 'wt', newline='')
+    elif compression is None:
+        return open(fname, 'w', newline='')
+    raise ValueError("Unknown compression %r" % (compression, ))
+
+
+def _chunk_starts(nrows, chunksize):
+    # we always write at least one chunk to write the header of empty frames
+    return range(0, max(nrows, 1), max(chunksize, 1))
+
+
+def export_df(df, fname, fmt=None, compression=None, chunksize=None,
+              progress=None):
+    """Export a data frame to a CSV, Parquet or Feather file
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The data frame to export
+    fname: str
+        The path of the target file
+    fmt: {None, 'csv', 'parquet', 'feather'}
+        The file format. If None, it is inferred from the extension of
+        `fname` and defaults to ``'csv'``
+    compression: str
+        The compression to use. Possible values depend on the `fmt` (see
+        :attr:`EXPORT_FORMATS`). If None, CSV files are compressed based on
+        the file extension (``.gz``, ``.bz2`` or ``.xz``) and Parquet files
+        are not compressed
+    chunksize: int
+        The number of rows to write at once to CSV and Parquet files. If
+        None, the ``'dataframeeditor.export_chunksize'`` item in the
+        :attr:`psyplot_gui.rcParams` is used
+    progress: callable
+        A function that is called with the number of written rows and the
+        total number of rows after each chunk (see
+        :meth:`psyplot_gui.common.WorkerThread.report_progress`). If it
+        returns False, the export is stopped and the file is removed
+
+    Returns
+    -------
+    bool
+        True if the export finished, False if it has been cancelled"""
+    if fmt is None:
+        base, ext = osp.splitext(fname)
+        if ext in _compression_extensions:
+            ext = osp.splitext(base)[1]
+        fmt = _export_extensions.get(ext.lower(), 'csv')
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError("Unknown export format %r. Possible formats are "
+                         "%s" % (fmt, ', '.join(sorted(EXPORT_FORMATS))))
+    if chunksize is None:
+        chunksize = rcParams['dataframeeditor.export_chunksize']
+    if progress is None:
+        def progress(i, n):
+            return True
+    nrows = len(df)
+
+    if fmt == 'feather':
+        # feather files are written at once and need a default index
+        progress(0, 0)
+        df.reset_index().to_feather(fname, compression=compression)
+        progress(nrows, nrows)
+        return True
+
+    cancelled = False
+    if fmt == 'csv':
+        with _open_compressed(fname, compression) as f:
+            for start in _chunk_starts(nrows, chunksize):
+                df.iloc[start:start + chunksize].to_csv(
+                    f, header=not start)
+                if progress(min(start + chunksize, nrows), nrows) is False:
+                    cancelled = True
+                    break
+    else:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            # use the default engine of pandas and write everything at once
+            progress(0, 0)
+            df.to_parquet(fname, compression=compression)
+            progress(nrows, nrows)
+            return True
+        schema = pa.Schema.from_pandas(df, preserve_index=True)
+        writer = pq.ParquetWriter(fname, schema,
+                                  compression=compression or 'none')
+        try:
+            # one row group per chunk
+            for start in _chunk_starts(nrows, chunksize):
+                writer.write_table(pa.Table.from_pandas(
+                    df.iloc[start:start + chunksize], schema=schema,
+                    preserve_index=True))
+                if progress(min(start + chunksize, nrows), nrows) is False:
+                    cancelled = True
+                    break
+        finally:
+            writer.close()
+    if cancelled:
+        os.remove(fname)
+    return not cancelled
+
+
+#: In-memory cache of the column names and data types of csv files (see
+#: :func:`get_csv_schema`)
+_csv_schemas = LRUCache()
+
+
+def _csv_schema_key(fname, kwargs):
+    return file_identity(fname) + (repr(sorted(kwargs.items())), )
+
+
+def _csv_schema_file(key):
+    return osp.join(get_cache_dir('csv_schemas'), hashlib.sha1(
+        repr(key).encode('utf-8')).hexdigest() + '.json')
+
+
+def _save_csv_schema(key, schema):
+    _csv_schemas[key] = schema
+    try:
+        with open(_csv_schema_file(key), 'w') as f:
+            json.dump(schema, f)
+        prune_cache_dir('csv_schemas')
+    except (IOError, OSError, TypeError, ValueError):
+        # the disk cache is optional
+        pass
+
+
+def get_csv_schema(fname, nrows=None, **kwargs):
+    """Get the column names and data types of a csv file
+
+    The data types are inferred from the first `nrows` rows of the file and
+    cached (in memory and on disk) for the file with the given `kwargs`. The
+    cache is invalidated when the file changes and holds at most
+    ``'main.cache_size'`` schemas (see
+    :func:`psyplot_gui.common.get_cache_size`).
+
+    Parameters
+    ----------
+    fname: str
+        The path to the csv file
+    nrows: int
+        The number of rows to use for the type inference. If None, the
+        ``'dataframeeditor.csv_sample_rows'`` item in the
+        :attr:`psyplot_gui.rcParams` is used
+    ``**kwargs``
+        Any other keyword argument for the :func:`pandas.read_csv` function
+
+    Returns
+    -------
+    dict
+        A mapping with the list of ``'columns'`` and the ``'dtypes'`` (a
+        mapping from column name to the string of the data type)"""
+    key = _csv_schema_key(fname, kwargs)
+    if key in _csv_schemas:
+        return _csv_schemas[key]
+    cache_file = _csv_schema_file(key)
+    if osp.exists(cache_file):
+        try:
+            with open(cache_file) as f:
+                schema = json.load(f)
+        except (IOError, OSError, ValueError):
+            pass
+        else:
+            touch_cache_file(cache_file)
+            _csv_schemas[key] = schema
+            return schema
+    if nrows is None:
+        nrows = rcParams['dataframeeditor.csv_sample_rows']
+    sample = pd.read_csv(fname, nrows=nrows, **kwargs)
+    schema = {'columns': list(map(six.text_type, sample.columns)),
+              'dtypes': {six.text_type(col): str(dtype)
+                         for col, dtype in sample.dtypes.items()}}
+    _save_csv_schema(key, schema)
+    return schema
+
+
+def _use_pyarrow_engine(kwargs):
+    """Check whether the pyarrow engine of pandas can be used for reading
+    a csv file with the given `kwargs`"""
+    from packaging.version import Version
+    sep = kwargs.get('sep', kwargs.get('delimiter')) or ','
+    # the pyarrow engine does not support regular expressions as separators
+    if (Version(pd.__version__) < Version('1.4') or
+            kwargs.get('delim_whitespace') or len(sep) > 1):
+        return False
+    try:
+        import pyarrow
+    except ImportError:
+        return False
+    return True
+
+
+def read_csv(fname, usecols=None, **kwargs):
+    """Read a csv file with the fastest available engine
+
+    This function uses the multi-threaded pyarrow engine of
+    :func:`pandas.read_csv` if it is available and uses the cached data types
+    of :func:`get_csv_schema` such that the type inference is skipped
+
+    Parameters
+    ----------
+    fname: str
+        The path to the csv file
+    usecols: list of str
+        The columns to read. If None, all columns are read
+    ``**kwargs``
+        Any other keyword argument for the :func:`pandas.read_csv` function
+
+    Returns
+    -------
+    pandas.DataFrame
+        The content of `fname`"""
+    schema = get_csv_schema(fname, **kwargs)
+    dtypes = schema['dtypes']
+    if usecols is not None:
+        usecols = list(usecols)
+        dtype = {col: dtypes[col] for col in usecols if col in dtypes}
+    else:
+        dtype = dtypes.copy()
+    read_kws = kwargs.copy()
+    if _use_pyarrow_engine(kwargs):
+        read_kws['engine'] = 'pyarrow'
+    try:
+        df = pd.read_csv(fname, usecols=usecols, dtype=dtype, **read_kws)
+    except (ValueError, TypeError):
+        # the sample has not been representative for the entire file, so we
+        # let pandas infer the data types
+        df = pd.read_csv(fname, usecols=usecols, **read_kws)
+    # update the cache with the data types of the entire file
+    new_dtypes = {six.text_type(col): str(dtype)
+                  for col, dtype in df.dtypes.items()}
+    if any(dtypes.get(col) != dtype for col, dtype in new_dtypes.items()):
+        dtypes.update(new_dtypes)
+        _save_csv_schema(_csv_schema_key(fname, kwargs), schema)
+    return df
+
+
+def _iter_matches(df, pattern, regex=False, case=True, tol=None,
+                  index=True):
+    """Iterate over the columns of a data frame and their matches
+
+    Numeric columns match if `pattern` is a number that equals the value
+    (with the tolerance `tol`), all other columns match if their string
+    representation contains `pattern`.
+
+    Yields
+    ------
+    int
+        The column in the :class:`DataFrameView` (0 for the index)
+    pandas.Series
+        The data of the column
+    numpy.ndarray
+        The boolean mask of the matches
+    bool
+        True, if the column has been compared numerically"""
+    try:
+        number = complex(pattern)
+    except ValueError:
+        number = None
+    else:
+        if not number.imag:
+            number = number.real
+    if not regex and not case:
+        # pandas does not support case insensitive matches without regex
+        pattern = re.escape(pattern)
+        regex = True
+    columns = [(0, df.index.to_series())] if index else []
+    columns.extend((i + 1, df.iloc[:, i]) for i in range(df.shape[1]))
+    for col, series in columns:
+        if (pd.api.types.is_numeric_dtype(series) and
+                not pd.api.types.is_bool_dtype(series)):
+            if number is None:
+                continue
+            values = series.to_numpy()
+            if values.dtype.kind not in 'iufc':  # nullable extension types
+                values = series.astype(float).to_numpy()
+            mask = np.isclose(values, number, rtol=0, atol=tol or 0)
+            yield col, series, mask, True
+        else:
+            with warnings.catch_warnings():
+                # ignore the warning about match groups
+                warnings.simplefilter('ignore', UserWarning)
+                mask = series.astype(six.text_type).str.contains(
+                    pattern, case=case, regex=regex, na=False).to_numpy()
+            yield col, series, mask & series.notnull().to_numpy(), False
+
+
+def find_in_df(df, pattern, regex=False, case=True, tol=None):
+    """Find the cells of a data frame that match a pattern
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The data frame to search
+    pattern: str
+        The string to search for. Numeric columns are compared
+        numerically if `pattern` is a number
+    regex: bool
+        If True, `pattern` is interpreted as a regular expression
+    case: bool
+        If True, the search is case sensitive
+    tol: float
+        The absolute tolerance for numeric comparisons
+
+    Returns
+    -------
+    numpy.ndarray
+        The ``(row, column)`` pairs of the matches as an array of shape
+        ``(N, 2)``, sorted by row and column. Column 0 corresponds to the
+        index, column ``i + 1`` to the ``i``-th column of `df`"""
+    rows = []
+    cols = []
+    for col, series, mask, numeric in _iter_matches(df, pattern, regex, case,
+                                                    tol):
+        irows = np.nonzero(mask)[0]
+        rows.append(irows)
+        cols.append(np.full(len(irows), col, dtype=int))
+    if not rows:
+        return np.zeros((0, 2), dtype=int)
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    order = np.lexsort((cols, rows))
+    return np.c_[rows[order], cols[order]]
+
+
+def replace_in_df(df, pattern, repl, regex=False, case=True, tol=None):
+    """Compute the replacements of a pattern in the columns of a data frame
+
+    The replacement is done vectorized for each column with matches (see
+    :func:`find_in_df`). The index is not modified. `df` itself is not
+    modified either, such that this function can run in a background thread.
+    The new columns are set with :func:`set_columns`.
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The data frame to search
+    pattern: str
+        The pattern to replace
+    repl: str
+        The replacement. It is converted to a number for numeric columns
+    regex: bool
+        If True, `pattern` is interpreted as a regular expression and `repl`
+        may contain back references
+    case: bool
+        If True, the search is case sensitive
+    tol: float
+        The absolute tolerance for numeric comparisons
+
+    Returns
+    -------
+    dict
+        A mapping from the position of a modified column to the new
+        :class:`pandas.Series`
+    int
+        The number of cells that have been modified"""
+    columns = {}
+    nreplaced = 0
+    value = None
+    # case insensitive literal replacements have to go through the regex
+    # path of pandas
+    sub_pattern, sub_repl, sub_regex = pattern, repl, regex
+    if not regex and not case:
+        sub_pattern, sub_regex = re.escape(pattern), True
+        sub_repl = repl.replace('\\', r'\\')
+    for col, series, mask, numeric in _iter_matches(
+            df, pattern, regex, case, tol, index=False):
+        if not mask.any():
+            continue
+        if numeric:
+            if value is None:
+                value = pd.to_numeric(pd.Series([repl])).iloc[0]
+            new = series.mask(mask, value)
+        else:
+            new = series.copy()
+            new[mask] = series[mask].astype(six.text_type).str.replace(
+                sub_pattern, sub_repl, case=case, regex=sub_regex).to_numpy()
+        columns[col - 1] = new
+        nreplaced += mask.sum()
+    return columns, int(nreplaced)
+
+
+def set_columns(df, columns):
+    """Set columns of a data frame (in place)
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The data frame to modify
+    columns: dict
+        A mapping from the position of a column to the new values (see
+        :func:`replace_in_df`)"""
+    for i, new in six.iteritems(columns):
+        try:
+            df.isetitem(i, new)
+        except AttributeError:  # pandas < 1.5
+            df.iloc[:, i] = new
+
+
+def eval_column(df, expr):
+    """Evaluate an assignment expression for a new column of a data frame
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The data frame whose columns are used in the expression
+    expr: str
+        The expression of the form ``'<name> = <expression>'``, e.g.
+        ``'ratio = a / b * 100'``. The expression is evaluated with
+        :meth:`pandas.DataFrame.eval` (and therefore with numexpr if it is
+        installed). Column names with spaces can be quoted with backticks
+
+    Returns
+    -------
+    str
+        The name of the column
+    numpy.ndarray
+        The values of the column"""
+    m = re.match(r'\s*(`[^`]+`|[^=`]+?)\s*=(?!=)(.+)$', expr, re.DOTALL)
+    if m is None:
+        raise ValueError(
+            "Expression must be of the form '<name> = <expression>', "
+            "not %r" % (expr, ))
+    name, rhs = m.group(1).strip('`'), m.group(2).strip()
+    result = df.eval(rhs)
+    if isinstance(result, pd.Series):
+        result = result.to_numpy()
+    else:
+        result = np.repeat(result, len(df))
+    return name, result
+
+
+class ColumnChooser(QDialog):
+    """A dialog to select the columns of a file that shall be loaded"""
+
+    @property
+    def selected_columns(self):
+        """The list of checked columns"""
+        items = map(self.list_widget.item, range(self.list_widget.count()))
+        return [item.text() for item in items
+                if item.checkState() == Qt.Checked]
+
+    def __init__(self, columns, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        columns: list of str
+            The column names to choose from
+        ``*args, **kwargs``
+            Determined by the :class:`QDialog` class"""
+        super(ColumnChooser, self).__init__(*args, **kwargs)
+        self.setWindowTitle('Select the columns to load')
+        self.cb_select_all = QCheckBox('Select all')
+        self.cb_select_all.setChecked(True)
+        self.list_widget = QListWidget()
+        for col in columns:
+            item = QListWidgetItem(col)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.list_widget.addItem(item)
+        self.bbox = QDialogButtonBox(QDialogButtonBox.Ok |
+                                     QDialogButtonBox.Cancel)
+
+        vbox = QVBoxLayout()
+        vbox.addWidget(self.cb_select_all)
+        vbox.addWidget(self.list_widget)
+        vbox.addWidget(self.bbox)
+        self.setLayout(vbox)
+
+        self.cb_select_all.stateChanged.connect(self.toggle_all)
+        self.bbox.accepted.connect(self.accept)
+        self.bbox.rejected.connect(self.reject)
+
+    def toggle_all(self, state):
+        """Check or uncheck all columns"""
+        for i in range(self.list_widget.count()):
+            self.list_widget.item(i).setCheckState(state)
+
+    @classmethod
+    def get_columns(cls, columns, parent=None):
+        """Let the user select the columns
+
+        Parameters
+        ----------
+        columns: list of str
+            The column names to choose from
+        parent: QWidget
+            The parent widget of the dialog
+
+        Returns
+        -------
+        list of str
+            The selected columns
+        bool
+            True if the user accepted the dialog"""
+        dialog = cls(columns, parent)
+        ok = dialog.exec_()
+        return dialog.selected_columns, bool(ok)
+
+
 class DataFrameModel(QtCore.QAbstractTableModel):
     """ DataFrame Table Model"""
 
@@ -277,6 +822,62 @@ class DataFrameModel(QtCore.QAbstractTableModel):
             self.cols_loaded += items_to_fetch
             self.endInsertColumns()
 
+    def fetch_until(self, row=None, column=None):
+        """Make sure that a cell is loaded into the model
+
+        Parameters
+        ----------
+        row: int
+            The row that shall be loaded
+        column: int
+            The column (in the table, i.e. 0 is the index) that shall be
+            loaded"""
+        if row is not None and self.rows_loaded <= row < self.total_rows:
+            nrows = min(self.total_rows, self.ROWS_TO_LOAD * (
+                row // self.ROWS_TO_LOAD + 1))
+            self.beginInsertRows(QtCore.QModelIndex(), self.rows_loaded,
+                                 nrows - 1)
+            self.rows_loaded = nrows
+            self.endInsertRows()
+        if column is not None and self.cols_loaded < column <= \
+                self.total_cols:
+            ncols = min(self.total_cols, self.COLS_TO_LOAD * (
+                column // self.COLS_TO_LOAD + 1))
+            self.beginInsertColumns(QtCore.QModelIndex(),
+                                    self.cols_loaded + 1, ncols)
+            self.cols_loaded = ncols
+            self.endInsertColumns()
+
+    def insert_column(self, name, values):
+        """Append a new column (or update an existing one)
+
+        Other than :meth:`reset`, this method only notifies the views about
+        the new column such that they do not have to reload the entire table.
+
+        Parameters
+        ----------
+        name: str
+            The column name
+        values: numpy.ndarray
+            The values of the column"""
+        if name in self.df_header:
+            self.df[name] = values
+            icol = self.df_header.index(name) + 1
+            self.dataChanged.emit(self.index(0, icol),
+                                  self.index(self.rowCount() - 1, icol))
+            return
+        # only notify the views if the column would be visible
+        notify = self.cols_loaded == self.total_cols
+        if notify:
+            self.beginInsertColumns(QtCore.QModelIndex(), self.total_cols + 1,
+                                    self.total_cols + 1)
+        self.df[name] = values
+        self.df_header.append(name)
+        self.total_cols += 1
+        if notify:
+            self.cols_loaded += 1
+            self.endInsertColumns()
+
     def columnCount(self, index=QtCore.QModelIndex()):
         """DataFrame column number"""
         # This is done to implement series
@@ -295,6 +896,10 @@ class DataFrameModel(QtCore.QAbstractTableModel):
         self.beginResetModel()
         self.endResetModel()
 
+    def view_row(self, row):
+        """Get the row in the table of the given row in the :attr:`df`"""
+        return row
+
     def insertRow(self, irow):
         """Insert one row into the :attr:`df`
 
@@ -354,6 +959,251 @@ class DataFrameModel(QtCore.QAbstractTableModel):
         self._parent.rows_inserted.emit(irow, nrows)
 
 
+class GroupedDataFrameModel(DataFrameModel):
+    """A read-only model that groups a DataFrame by its outer index levels
+
+    The outer levels of the :class:`pandas.MultiIndex` are displayed as
+    collapsible group rows and only the rows of the expanded groups are shown.
+    The groups are computed once via :meth:`pandas.DataFrame.groupby` and
+    stored as offset tables, such that collapsing and expanding a group only
+    inserts or removes the rows of this group"""
+
+    #: The aggregation function for the group rows
+    aggregate = None
+
+    _aggregated = _aggregated_cols = None
+
+    docstrings.keep_params('DataFrameModel.parameters', 'df', 'parent')
+
+    @docstrings.dedent
+    def __init__(self, df, parent=None, *args, **kwargs):
+        """
+        Parameters
+        ----------
+        %(DataFrameModel.parameters.df|parent)s
+        aggregate: str
+            The name of a function to aggregate the values of the groups
+            (e.g. ``'mean'`` or ``'max'``). If None, the cells of the group
+            rows are empty
+
+        Other Parameters
+        ----------------
+        ``*args, **kwargs``
+            Any other parameter for the :class:`DataFrameModel` is ignored
+            because the model is not editable"""
+        aggregate = kwargs.pop('aggregate', None)
+        super(GroupedDataFrameModel, self).__init__(
+            df, parent, index_editable=False, dtypes_changeable=False)
+        nlevels = df.index.nlevels
+        outer = list(range(nlevels - 1)) if nlevels > 2 else 0
+        try:
+            self.grouper = df.groupby(level=outer, sort=False, dropna=False)
+        except TypeError:  # pandas < 1.1
+            self.grouper = df.groupby(level=outer, sort=False)
+        indices = self.grouper.indices
+        keys = list(indices)
+        vals = list(indices.values())
+        # sort the groups by their first appearance in the data frame
+        order = np.argsort([v[0] for v in vals], kind='mergesort')
+        self.group_keys = [keys[i] for i in order]
+        #: The sizes of the groups
+        self.group_sizes = np.array([len(vals[i]) for i in order], dtype=int)
+        #: The positions of the rows in the :attr:`df`, sorted by group
+        self.positions = np.concatenate(
+            [vals[i] for i in order]) if vals else np.zeros(0, dtype=int)
+        #: The start of each group in :attr:`positions`
+        self.group_offsets = np.r_[0, np.cumsum(self.group_sizes)[:-1]].astype(
+            int)
+        #: Boolean array that is True for the expanded groups
+        self.expanded = np.zeros(len(self.group_keys), dtype=bool)
+        self.inner_labels = df.index.get_level_values(-1) if nlevels > 1 \
+            else None
+        self._inverse_positions = None
+        self._update_offsets()
+        self.set_aggregate(aggregate, reset=False)
+
+    def _update_offsets(self):
+        """Update the offsets of the group rows in the table"""
+        nrows = 1 + self.group_sizes * self.expanded
+        #: The row of each group in the table
+        self.row_offsets = np.r_[0, np.cumsum(nrows)[:-1]].astype(int)
+        self.total_rows = self.rows_loaded = int(nrows.sum())
+
+    def set_aggregate(self, aggregate, reset=True):
+        """Set the function to aggregate the groups
+
+        Parameters
+        ----------
+        aggregate: str
+            The name of a function to aggregate the values of the groups
+            (e.g. ``'mean'`` or ``'max'``). If None, the cells of the group
+            rows are empty
+        reset: bool
+            If True, reset the model"""
+        self.aggregate = aggregate or None
+        self._aggregated = None
+        if self.aggregate is not None and len(self.group_keys):
+            try:
+                agg = self.grouper.agg(self.aggregate)
+            except (TypeError, ValueError):
+                agg = self.grouper.agg(self.aggregate, numeric_only=True)
+            if isinstance(self.group_keys[0], tuple):
+                keys = pd.MultiIndex.from_tuples(self.group_keys)
+            else:
+                keys = pd.Index(self.group_keys)
+            # align the aggregated frame with the groups and columns
+            self._aggregated_cols = np.asarray(
+                self.df.columns.isin(agg.columns))
+            self._aggregated = agg.reindex(
+                index=keys, columns=self.df.columns)
+        if reset:
+            self.reset()
+
+    def get_group(self, row):
+        """Get the group and the position in the group of a row in the table
+
+        Parameters
+        ----------
+        row: int
+            The row in the table
+
+        Returns
+        -------
+        int
+            The group index
+        int
+            The index of the row in the group or -1 for the group row"""
+        group = int(self.row_offsets.searchsorted(row, 'right')) - 1
+        return group, row - self.row_offsets[group] - 1
+
+    def group_label(self, group):
+        """Get the label of a group row"""
+        key = self.group_keys[group]
+        if isinstance(key, tuple):
+            key = ', '.join(map(six.text_type, key))
+        return u'%s %s (%i)' % (
+            '-' if self.expanded[group] else '+', key,
+            self.group_sizes[group])
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell content"""
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            column = index.column()
+            group, member = self.get_group(index.row())
+            if member < 0:
+                if column == 0:
+                    return self.group_label(group)
+                elif (self._aggregated is None or
+                      not self._aggregated_cols[column - 1]):
+                    return ''
+                value = self._aggregated.iat[group, column - 1]
+            else:
+                row = self.positions[self.group_offsets[group] + member]
+                if column == 0:
+                    return u'    ' + six.text_type(
+                        self.inner_labels[row]
+                        if self.inner_labels is not None else
+                        self.df_index[row])
+                value = self.get_value(row, column - 1)
+            if isinstance(value, float):
+                try:
+                    return self._format % value
+                except (ValueError, TypeError):
+                    return DataFrameModel._format % value
+            return six.text_type(value)
+        elif role == Qt.FontRole and index.column() == 0:
+            if self.get_group(index.row())[1] < 0:
+                font = QtGui.QFont()
+                font.setBold(True)
+                return font
+
+    def flags(self, index):
+        """Reimplemented to make the table read-only"""
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, *args, **kwargs):
+        """Reimplemented to make the table read-only"""
+        return False
+
+    def sort(self, column, order=Qt.AscendingOrder, return_check=False,
+             report=True):
+        """Reimplemented because sorting is not supported"""
+        return False if return_check else None
+
+    def insertRows(self, irow, nrows=1):
+        """Reimplemented because inserting rows is not supported"""
+        return False
+
+    def toggle_group(self, group, expand=None):
+        """Expand or collapse a group
+
+        Parameters
+        ----------
+        group: int
+            The index of the group
+        expand: bool
+            If True, expand the group, if False collapse it. If None, the
+            group is toggled"""
+        if expand is None:
+            expand = not self.expanded[group]
+        if expand == self.expanded[group]:
+            return
+        start = self.row_offsets[group] + 1
+        end = start + self.group_sizes[group] - 1
+        if expand:
+            self.beginInsertRows(QtCore.QModelIndex(), start, end)
+        else:
+            self.beginRemoveRows(QtCore.QModelIndex(), start, end)
+        self.expanded[group] = expand
+        self._update_offsets()
+        if expand:
+            self.endInsertRows()
+        else:
+            self.endRemoveRows()
+        row = start - 1
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+
+    def toggle_row(self, row):
+        """Expand or collapse the group of the given row in the table"""
+        group, member = self.get_group(row)
+        self.toggle_group(group, False if member >= 0 else None)
+
+    def expand_all(self, expand=True):
+        """Expand or collapse all groups"""
+        self.expanded[:] = expand
+        self._update_offsets()
+        self.reset()
+
+    def view_row(self, row):
+        """Get the row in the table of the given row in the :attr:`df`
+
+        The group of the row is expanded if necessary"""
+        if self._inverse_positions is None:
+            self._inverse_positions = inv = np.empty_like(self.positions)
+            inv[self.positions] = np.arange(len(self.positions))
+        pos = self._inverse_positions[row]
+        group = int(self.group_offsets.searchsorted(pos, 'right')) - 1
+        self.toggle_group(group, True)
+        return int(self.row_offsets[group] + 1 + pos -
+                   self.group_offsets[group])
+
+    def fetch_more(self, rows=False, columns=False):
+        """Reimplemented to only fetch more columns"""
+        super(GroupedDataFrameModel, self).fetch_more(columns=columns)
+
+    def fetch_until(self, row=None, column=None):
+        """Reimplemented to only fetch more columns"""
+        super(GroupedDataFrameModel, self).fetch_until(column=column)
+
+    def insert_column(self, name, values):
+        """Reimplemented to update the aggregations"""
+        super(GroupedDataFrameModel, self).insert_column(name, values)
+        if self.aggregate is not None:
+            self.set_aggregate(self.aggregate)
+
+
 class FrozenTableView(QTableView):
     """This class implements a table with its first column frozen
     For more information please see:
@@ -387,6 +1237,16 @@ class FrozenTableView(QTableView):
         parent.verticalScrollBar().valueChanged.connect(
             self.verticalScrollBar().setValue)
 
+    def setModel(self, model):
+        """Reimplemented to hide the columns that are inserted into the model
+        """
+        QTableView.setModel(self, model)
+        model.columnsInserted.connect(self._hide_inserted_columns)
+
+    def _hide_inserted_columns(self, parent, first, last):
+        for col in range(max(first, 1), last + 1):
+            self.setColumnHidden(col, True)
+
     def update_geometry(self):
         """Update the frozen column size when an update occurs in its parent
         table"""
@@ -444,6 +1304,20 @@ class DataFrameView(QTableView):
                         lambda val: self.load_more_data(val, columns=True))
         self.verticalScrollBar().valueChanged.connect(
                         lambda val: self.load_more_data(val, rows=True))
+        self.doubleClicked.connect(self.toggle_group)
+        self.frozen_table_view.doubleClicked.connect(self.toggle_group)
+
+    @property
+    def grouped(self):
+        """True if the table shows the index levels as groups"""
+        return isinstance(self.model(), GroupedDataFrameModel)
+
+    def toggle_group(self, index):
+        """Expand or collapse the group of the given index
+
+        This method does nothing, if the table is not :attr:`grouped`"""
+        if self.grouped and index.isValid():
+            self.model().toggle_row(index.row())
 
     def update_section_width(self, logical_index, old_size, new_size):
         """Update the horizontal width of the frozen column when a
@@ -487,6 +1361,24 @@ class DataFrameView(QTableView):
             self.horizontalScrollBar().setValue(new_value)
         return current
 
+    def scroll_to_cell(self, row, column):
+        """Select a cell and scroll to it
+
+        Parameters
+        ----------
+        row: int
+            The row of the cell
+        column: int
+            The column of the cell (0 is the index)"""
+        model = self.model()
+        row = model.view_row(row)
+        model.fetch_until(row, column)
+        index = model.index(row, column)
+        self.setCurrentIndex(index)
+        # we use the method of QTableView because our :meth:`scrollTo` does
+        # not scroll to the frozen columns
+        QTableView.scrollTo(self, index, QTableView.PositionAtCenter)
+
     def scrollTo(self, index, hint):
         """Scroll the table.
 
@@ -583,8 +1475,19 @@ class DataFrameView(QTableView):
         Parameters
         ----------
         %(DataFrameModel.parameters.no_parent)s
+        grouped: bool
+            If True, the outer index levels are shown as collapsible groups
+            (see :class:`GroupedDataFrameModel`)
+        aggregate: str
+            The aggregation function for the groups if `grouped` is True
         """
-        model = DataFrameModel(df, self.parent(), *args, **kwargs)
+        grouped = kwargs.pop('grouped', False)
+        aggregate = kwargs.pop('aggregate', None)
+        if grouped:
+            model = GroupedDataFrameModel(df, self.parent(), *args,
+                                          aggregate=aggregate, **kwargs)
+        else:
+            model = DataFrameModel(df, self.parent(), *args, **kwargs)
         self.setModel(model)
         self.frozen_table_view.setModel(model)
 
@@ -603,6 +1506,8 @@ class DataFrameView(QTableView):
             nrows, 's' if nrows - 1 else ''))
         self.insert_row_above_action.setEnabled(model.index_editable)
         self.insert_row_below_action.setEnabled(model.index_editable)
+        self.set_index_action.setEnabled(not self.grouped)
+        self.append_index_action.setEnabled(not self.grouped)
         self.menu.popup(event.globalPos())
         event.accept()
 
@@ -660,6 +1565,15 @@ class DataFrameView(QTableView):
             col_min = 1
             index = True
         df = self.model().df
+        if self.grouped:
+            # copy what is displayed
+            model = self.model()
+            contents = '\n'.join(
+                '\t'.join(model.data(model.index(row, col)) for col in range(
+                    min(cols), col_max + 1))
+                for row in range(row_min, row_max + 1))
+            QApplication.clipboard().setText(contents)
+            return
         if col_max == 0:  # To copy indices
             contents = '\n'.join(map(str, df.index.tolist()[slice(row_min,
                                                             row_max+1)]))
@@ -737,6 +1651,21 @@ class DataFrameEditor(DockMixin, QWidget):
         # A checkbox for enabling and disabling sorting
         self.cb_enable_sort = QCheckBox('Enable sorting')
 
+        # A checkbox to group the rows by the outer index levels
+        self.cb_group_index = QCheckBox('Group index')
+        self.cb_group_index.setToolTip(
+            'Show the outer levels of the MultiIndex as collapsible groups. '
+            'Double-click a group to expand or collapse it.')
+        self.cb_group_index.setEnabled(False)
+
+        # A combobox to select the aggregation of the groups
+        self.combo_aggregate = QComboBox()
+        self.combo_aggregate.addItems(
+            ['', 'count', 'sum', 'mean', 'median', 'min', 'max'])
+        self.combo_aggregate.setToolTip(
+            'The function to aggregate the values of each group')
+        self.combo_aggregate.setVisible(False)
+
         # A button to open a dataframe from the file
         self.btn_open_df = QToolButton(parent=self)
         self.btn_open_df.setIcon(QIcon(get_icon('run_arrow.png')))
@@ -745,6 +1674,19 @@ class DataFrameEditor(DockMixin, QWidget):
         self.btn_from_console = LoadFromConsoleButton(pd.DataFrame)
         self.btn_from_console.setToolTip('Show a DataFrame from the console')
 
+        # A button to export the dataframe to a file
+        self.btn_export_df = QToolButton(parent=self)
+        self.btn_export_df.setText('Export')
+        self.btn_export_df.setToolTip(
+            'Export the DataFrame (as it is currently sorted) to a file')
+        self.btn_export_df.setPopupMode(QToolButton.InstantPopup)
+        self.export_menu = QMenu(self)
+        for fmt, label in [('csv', 'CSV'), ('parquet', 'Parquet'),
+                           ('feather', 'Feather')]:
+            self.export_menu.addAction(
+                'Export to %s' % label, partial(self._export_df, fmt))
+        self.btn_export_df.setMenu(self.export_menu)
+
         # The table to display the DataFrame
         self.table = DataFrameView(pd.DataFrame(), self)
 
@@ -756,6 +1698,17 @@ class DataFrameEditor(DockMixin, QWidget):
         self.btn_change_format = QPushButton('Update')
         self.btn_change_format.setEnabled(False)
 
+        # line edit and button for computing new columns
+        self.txt_expression = QLineEdit()
+        self.txt_expression.setPlaceholderText('ratio = a / b * 100')
+        self.txt_expression.setToolTip(
+            'Compute a new column via <code>&lt;name&gt; = '
+            '&lt;expression&gt;</code>. The expression is evaluated with '
+            '<code>DataFrame.eval</code>')
+        self.btn_add_column = QPushButton('Add column')
+        self.btn_add_column.setToolTip(
+            'Compute a new column from the expression')
+
         # table clearing button
         self.btn_clear = QPushButton('Clear')
         self.btn_clear.setToolTip(
@@ -770,6 +1723,62 @@ class DataFrameEditor(DockMixin, QWidget):
         self.btn_close = QPushButton('Close')
         self.btn_close.setToolTip('Close this widget permanentely')
 
+        # progress bar and cancel button for jobs in the background
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.btn_cancel_job = QToolButton()
+        self.btn_cancel_job.setIcon(QIcon(get_icon('invalid.png')))
+        self.btn_cancel_job.setToolTip('Cancel the running job')
+        self.btn_cancel_job.setVisible(False)
+
+        #: The :class:`psyplot_gui.common.WorkerThread` of the current job
+        self.worker = None
+
+        # ---------------------------------------------------------------------
+        # ------------------------ find bar -----------------------------------
+        # ---------------------------------------------------------------------
+        self.btn_find = QToolButton(parent=self)
+        self.btn_find.setText('Find')
+        self.btn_find.setToolTip('Show the find bar (%s)' % (
+            QKeySequence(QKeySequence.Find).toString(), ))
+        self.btn_find.setCheckable(True)
+        self.find_action = QAction('Find', self)
+        self.find_action.setShortcut(QKeySequence.Find)
+        self.addAction(self.find_action)
+
+        self.find_bar = QWidget(self)
+        self.txt_find = QLineEdit()
+        self.txt_find.setPlaceholderText('Find')
+        self.cb_regex = QCheckBox('Regex')
+        self.cb_match_case = QCheckBox('Match case')
+        self.txt_tolerance = QLineEdit()
+        self.txt_tolerance.setValidator(QDoubleValidator(0, 1e300, 100))
+        self.txt_tolerance.setPlaceholderText('Numeric tolerance')
+        self.txt_tolerance.setToolTip(
+            'The absolute tolerance when searching numbers in numeric columns')
+        self.btn_find_prev = QToolButton()
+        self.btn_find_prev.setIcon(QIcon(get_icon('previous.png')))
+        self.btn_find_prev.setToolTip('Go to the previous match')
+        self.btn_find_next = QToolButton()
+        self.btn_find_next.setIcon(QIcon(get_icon('next.png')))
+        self.btn_find_next.setToolTip('Go to the next match')
+        self.lbl_hits = QLabel()
+        self.txt_replace = QLineEdit()
+        self.txt_replace.setPlaceholderText('Replace with')
+        self.btn_replace_all = QPushButton('Replace all')
+        self.btn_replace_all.setToolTip(
+            'Replace all matches in the columns of the DataFrame')
+
+        #: The ``(row, column)`` pairs of the matches of the last search (see
+        #: :func:`find_in_df`)
+        self.hits = None
+
+        #: The position of the current match in :attr:`hits`
+        self.current_hit = -1
+
+        #: The search settings that have been used for :attr:`hits`
+        self._last_search = None
+
         # ---------------------------------------------------------------------
         # ------------------------ layout --------------------------------
         # ---------------------------------------------------------------------
@@ -778,16 +1787,38 @@ class DataFrameEditor(DockMixin, QWidget):
         hbox.addWidget(self.cb_index_editable)
         hbox.addWidget(self.cb_dtypes_changeable)
         hbox.addWidget(self.cb_enable_sort)
+        hbox.addWidget(self.cb_group_index)
+        hbox.addWidget(self.combo_aggregate)
         hbox.addWidget(self.lbl_size)
         hbox.addStretch(0)
         hbox.addWidget(self.btn_open_df)
         hbox.addWidget(self.btn_from_console)
+        hbox.addWidget(self.btn_export_df)
+        hbox.addWidget(self.btn_find)
         vbox.addLayout(hbox)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.addWidget(self.txt_find)
+        hbox.addWidget(self.cb_regex)
+        hbox.addWidget(self.cb_match_case)
+        hbox.addWidget(self.txt_tolerance)
+        hbox.addWidget(self.btn_find_prev)
+        hbox.addWidget(self.btn_find_next)
+        hbox.addWidget(self.lbl_hits)
+        hbox.addWidget(self.txt_replace)
+        hbox.addWidget(self.btn_replace_all)
+        self.find_bar.setLayout(hbox)
+        self.find_bar.setVisible(False)
+        vbox.addWidget(self.find_bar)
         vbox.addWidget(self.table)
         self.bottom_hbox = hbox = QHBoxLayout()
         hbox.addWidget(self.format_editor)
         hbox.addWidget(self.btn_change_format)
+        hbox.addWidget(self.txt_expression)
+        hbox.addWidget(self.btn_add_column)
         hbox.addStretch(0)
+        hbox.addWidget(self.progress_bar)
+        hbox.addWidget(self.btn_cancel_job)
         hbox.addWidget(self.btn_clear)
         hbox.addWidget(self.btn_close)
         hbox.addWidget(self.btn_refresh)
@@ -809,12 +1840,26 @@ class DataFrameEditor(DockMixin, QWidget):
         self.btn_close.clicked.connect(lambda: self.close())
         self.btn_refresh.clicked.connect(self.table.reset_model)
         self.btn_open_df.clicked.connect(self._open_dataframe)
+        self.btn_cancel_job.clicked.connect(self.cancel_job)
+        self.btn_find.toggled.connect(self.toggle_find_bar)
+        self.find_action.triggered.connect(
+            lambda: self.btn_find.setChecked(True))
+        self.txt_find.returnPressed.connect(self.find_next)
+        self.btn_find_next.clicked.connect(self.find_next)
+        self.btn_find_prev.clicked.connect(self.find_previous)
+        self.btn_replace_all.clicked.connect(self._replace_all)
+        self.txt_expression.returnPressed.connect(self._add_column)
+        self.btn_add_column.clicked.connect(self._add_column)
+        self.cleared.connect(self.clear_hits)
         self.table.set_index_action.triggered.connect(
             self.update_index_editable)
         self.table.append_index_action.triggered.connect(
             self.update_index_editable)
         self.cb_enable_sort.stateChanged.connect(
             self.table.setSortingEnabled)
+        self.cb_group_index.stateChanged.connect(self.set_grouped)
+        self.combo_aggregate.currentIndexChanged[str].connect(
+            self.set_aggregate)
 
     def update_index_editable(self):
         model = self.table.model()
@@ -851,14 +1896,31 @@ class DataFrameEditor(DockMixin, QWidget):
         %(DataFrameModel.parameters.no_parent)s
         show: bool
             If True (default), show and raise_ the editor
+        grouped: bool
+            If True, show the outer levels of a :class:`pandas.MultiIndex` as
+            collapsible groups. If None, the state of the
+            :attr:`cb_group_index` checkbox is used
         """
         show = kwargs.pop('show', True)
-        self.table.set_df(df, *args, **kwargs)
+        multiindex = len(df.index.names) > 1
+        grouped = kwargs.pop('grouped', None)
+        if grouped is None:
+            grouped = self.cb_group_index.isChecked()
+        grouped = grouped and multiindex
+        if grouped:
+            kwargs['aggregate'] = self.combo_aggregate.currentText()
+        self.table.set_df(df, *args, grouped=grouped, **kwargs)
         self.set_lbl_size_text(*df.shape)
         model = self.table.model()
         self.cb_dtypes_changeable.setChecked(model.dtypes_changeable)
 
-        if len(model.df.index.names) > 1:
+        self.cb_group_index.blockSignals(True)
+        self.cb_group_index.setEnabled(multiindex)
+        self.cb_group_index.setChecked(grouped)
+        self.cb_group_index.blockSignals(False)
+        self.combo_aggregate.setVisible(grouped)
+        self.cb_dtypes_changeable.setEnabled(not grouped)
+        if multiindex:
             model.index_editable = False
             self.cb_index_editable.setEnabled(False)
         else:
@@ -869,6 +1931,21 @@ class DataFrameEditor(DockMixin, QWidget):
             self.show_plugin()
             self.dock.raise_()
 
+    def set_grouped(self, state):
+        """Show or hide the groups of the MultiIndex"""
+        self.set_df(self.table.model().df, grouped=state == Qt.Checked,
+                    show=False)
+
+    def set_aggregate(self, aggregate):
+        """Set the aggregation function of the groups"""
+        if self.table.grouped:
+            try:
+                self.table.model().set_aggregate(aggregate)
+            except Exception:
+                self.error_msg.showTraceback(
+                    '<b>Could not aggregate the groups with %s</b>' % (
+                        aggregate, ))
+
     def set_index_editable(self, state):
         """Set the :attr:`DataFrameModel.index_editable` attribute"""
         self.table.model().index_editable = state == Qt.Checked
@@ -905,8 +1982,21 @@ class DataFrameEditor(DockMixin, QWidget):
     def _open_dataframe(self):
         self.open_dataframe()
 
-    def open_dataframe(self, fname=None, *args, **kwargs):
-        """Opens a file dialog and the dataset that has been inserted"""
+    def open_dataframe(self, fname=None, usecols=None, *args, **kwargs):
+        """Opens a file dialog and the dataset that has been inserted
+
+        Parameters
+        ----------
+        fname: str or pandas.DataFrame
+            The path to the file or the DataFrame to show. If None, a file
+            dialog is opened
+        usecols: list of str
+            The columns to load from a csv file. If None and `fname` is None,
+            the user can select the columns if the
+            ``'dataframeeditor.choose_columns'`` item in the
+            :attr:`psyplot_gui.rcParams` is True, otherwise all columns are
+            loaded"""
+        choose_columns = fname is None and usecols is None
         if fname is None:
             fname = QFileDialog.getOpenFileName(
                 self, 'Open dataset', os.getcwd(),
@@ -926,20 +2016,340 @@ class DataFrameEditor(DockMixin, QWidget):
             open_funcs = {
                 '.xls': pd.read_excel, '.xlsx': pd.read_excel,
                 '.json': pd.read_json,
-                '.tab': partial(pd.read_csv, delimiter='\t'),
-                '.dat': partial(pd.read_csv, delim_whitespace=True),
+                '.tab': partial(read_csv, delimiter='\t'),
+                '.dat': partial(read_csv, sep=r'\s+'),
                 }
-            open_func = open_funcs.get(ext, pd.read_csv)
-            try:
-                df = open_func(fname)
-            except Exception:
-                self.error_msg.showTraceback(
-                    '<b>Could not open DataFrame %s with %s</b>' % (
-                        fname, open_func))
-                return
-            self.set_df(df)
+            open_func = open_funcs.get(ext, read_csv)
+            if isinstance(open_func, partial):
+                csv_kws = open_func.keywords
+                is_csv = open_func.func is read_csv
+            else:
+                csv_kws = {}
+                is_csv = open_func is read_csv
+            if is_csv:
+                if choose_columns and rcParams[
+                        'dataframeeditor.choose_columns']:
+                    try:
+                        columns = get_csv_schema(fname, **csv_kws)['columns']
+                    except Exception:
+                        self.error_msg.showTraceback(
+                            '<b>Could not read the columns of %s</b>' % (
+                                fname, ))
+                        return
+                    if len(columns) > 1:
+                        usecols, ok = ColumnChooser.get_columns(columns, self)
+                        if not ok or not usecols:
+                            return
+                        if len(usecols) == len(columns):
+                            usecols = None
+                open_func = partial(open_func, usecols=usecols)
+
+            def read(worker):
+                return open_func(fname)
+
+            self.run_job(
+                read, on_result=self.set_df,
+                error_header='<b>Could not open DataFrame %s with %s</b>' % (
+                    fname, open_func))
+
+    @property
+    def job_running(self):
+        """True if a job of this editor is currently running"""
+        return self.worker is not None and self.worker.isRunning()
+
+    def run_job(self, func, args=(), kwargs={}, on_result=None,
+                error_header=None):
+        """Run a job in a :class:`~psyplot_gui.common.WorkerThread`
+
+        Parameters
+        ----------
+        func: callable
+            The job. It is called via ``func(worker, *args, **kwargs)``
+        args: tuple
+            The arguments for `func`
+        kwargs: dict
+            The keyword arguments for `func`
+        on_result: callable
+            A function that is called with the result of `func`
+        error_header: str
+            The header for the error message if `func` fails
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker or None if another job is already running"""
+        if self.job_running:
+            self.error_msg.showMessage(
+                'Please wait until the current job has finished!')
+            return
+        self.worker = worker = WorkerThread(func, *args, **kwargs)
+        worker.progress_changed.connect(self._update_progress)
+        worker.result_ready.connect(self._job_finished)
+        worker.job_cancelled.connect(self._job_finished)
+        worker.job_error.connect(self._job_finished)
+        worker.job_error.connect(partial(self._show_job_error, error_header))
+        if on_result is not None:
+            worker.result_ready.connect(on_result)
+        self.table.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
+        self.btn_cancel_job.setVisible(True)
+        worker.run_job()
+        return worker
+
+    def cancel_job(self):
+        """Cancel the current job"""
+        if self.worker is not None:
+            self.worker.cancel()
+
+    def toggle_find_bar(self, show):
+        """Show or hide the find bar"""
+        self.find_bar.setVisible(show)
+        if show:
+            self.txt_find.setFocus()
+            self.txt_find.selectAll()
+
+    @property
+    def search_settings(self):
+        """The pattern, regex, case and tolerance of the find bar"""
+        tol = self.txt_tolerance.text().strip()
+        return (self.txt_find.text(), self.cb_regex.isChecked(),
+                self.cb_match_case.isChecked(), float(tol) if tol else None)
+
+    def _get_search_settings(self, *args):
+        """Fill the given search settings with the ones from the find bar"""
+        return tuple(val if val is not None else default
+                     for val, default in zip(args, self.search_settings))
+
+    def clear_hits(self):
+        """Clear the matches of the last search"""
+        self.hits = self._last_search = None
+        self.current_hit = -1
+        self.lbl_hits.setText('')
+
+    def find(self, pattern=None, regex=None, case=None, tol=None):
+        """Search the DataFrame in the background
+
+        The matches are stored in the :attr:`hits` attribute and the table
+        scrolls to the first match.
+
+        Parameters
+        ----------
+        pattern: str
+            The pattern to search. If None, the text of the find bar is used
+        regex: bool
+            Whether `pattern` is a regular expression. If None, the find bar
+            setting is used
+        case: bool
+            Whether the search is case sensitive. If None, the find bar
+            setting is used
+        tol: float
+            The tolerance for numeric comparisons. If None, the value of the
+            find bar is used
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that runs the search
+
+        See Also
+        --------
+        find_in_df"""
+        settings = self._get_search_settings(pattern, regex, case, tol)
+        if not settings[0]:
+            self.clear_hits()
+            return
+        df = self.table.model().df
+
+        def search(worker):
+            return find_in_df(df, *settings)
+
+        def show_hits(hits):
+            self.hits = hits
+            self._last_search = settings
+            self.current_hit = -1
+            if len(hits):
+                self.goto_hit(0)
+            else:
+                self.lbl_hits.setText('No matches')
+
+        return self.run_job(search, on_result=show_hits,
+                            error_header='<b>Search failed!</b>')
+
+    def goto_hit(self, i):
+        """Scroll to the `i`-th match in :attr:`hits`"""
+        self.current_hit = i = i % len(self.hits)
+        self.table.scroll_to_cell(*self.hits[i])
+        self.lbl_hits.setText('%i of %i' % (i + 1, len(self.hits)))
+
+    def _step_hit(self, step):
+        if self.hits is None or self._last_search != self.search_settings:
+            self.find()
+        elif len(self.hits):
+            self.goto_hit(self.current_hit + step)
+
+    def find_next(self):
+        """Go to the next match or start the search"""
+        self._step_hit(1)
+
+    def find_previous(self):
+        """Go to the previous match or start the search"""
+        self._step_hit(-1)
+
+    def _replace_all(self):
+        self.replace_all()
+
+    def replace_all(self, repl=None, pattern=None, regex=None, case=None,
+                    tol=None):
+        """Replace all matches in the columns of the DataFrame
+
+        Parameters
+        ----------
+        repl: str
+            The replacement. If None, the text of the find bar is used
+        pattern, regex, case, tol
+            The search settings (see :meth:`find`)
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that runs the replacement
+
+        See Also
+        --------
+        replace_in_df"""
+        if repl is None:
+            repl = self.txt_replace.text()
+        settings = self._get_search_settings(pattern, regex, case, tol)
+        if not settings[0]:
+            return
+        model = self.table.model()
+        df = model.df
+
+        def replace(worker):
+            return replace_in_df(df, settings[0], repl, *settings[1:])
+
+        def update(result):
+            # the columns are set here in the GUI thread
+            columns, nreplaced = result
+            set_columns(df, columns)
+            self.clear_hits()
+            model.reset()
+            self.show_status_message('Replaced %i values' % nreplaced)
+
+        return self.run_job(replace, on_result=update,
+                            error_header='<b>Replacement failed!</b>')
+
+    def _add_column(self):
+        self.add_column()
+
+    def add_column(self, expr=None):
+        """Compute a new column in the background and add it to the table
+
+        Parameters
+        ----------
+        expr: str
+            The expression of the form ``'<name> = <expression>'`` (see
+            :func:`eval_column`). If None, the text of the
+            :attr:`txt_expression` is used
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that evaluates the expression"""
+        if expr is None:
+            expr = self.txt_expression.text()
+        if not expr.strip():
+            return
+        model = self.table.model()
+        df = model.df
+
+        def compute(worker):
+            return eval_column(df, expr)
+
+        def insert(result):
+            model.insert_column(*result)
+            self.set_lbl_size_text(*df.shape)
+
+        return self.run_job(
+            compute, on_result=insert,
+            error_header='<b>Could not evaluate %s</b>' % (expr, ))
+
+    def _update_progress(self, i, n):
+        self.progress_bar.setRange(0, n)
+        self.progress_bar.setValue(i)
+
+    def _job_finished(self, *args):
+        self.table.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self.btn_cancel_job.setVisible(False)
+
+    def _show_job_error(self, header, exc_info):
+        self.error_msg.showTraceback(header, exc_info)
+
+    def _export_df(self, fmt):
+        filters = {
+            'csv': 'Comma separated files (*.csv *.csv.gz *.csv.bz2 '
+                   '*.csv.xz)',
+            'parquet': 'Parquet files (*.parquet *.pq)',
+            'feather': 'Feather files (*.feather *.ft)'}
+        fname = QFileDialog.getSaveFileName(
+            self, 'Export DataFrame', os.getcwd(),
+            filters[fmt] + ';;All files (*)')
+        if with_qt5:  # the filter is passed as well
+            fname = fname[0]
+        if not fname:
+            return
+        choices = [str(c) for c in EXPORT_FORMATS[fmt]]
+        if fmt == 'csv':
+            choices[0] = 'infer from extension'
+        compression, ok = QInputDialog.getItem(
+            self, 'Compression', 'Select the compression', choices,
+            editable=False)
+        if not ok:
+            return
+        compression = EXPORT_FORMATS[fmt][choices.index(compression)]
+        self.export_df(fname, fmt, compression)
+
+    def export_df(self, fname, fmt=None, compression=None, chunksize=None):
+        """Export the data frame in the background
+
+        The data frame is exported as it is shown in the table (i.e.
+        including the current sorting).
+
+        Parameters
+        ----------
+        fname: str
+            The target file name
+        fmt: {None, 'csv', 'parquet', 'feather'}
+            The format (see :func:`export_df`)
+        compression: str
+            The compression (see :func:`export_df`)
+        chunksize: int
+            The number of rows to write at once (see :func:`export_df`)
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that runs the export"""
+        df = self.table.model().df
+
+        def export(worker):
+            return export_df(df, fname, fmt, compression, chunksize,
+                             progress=worker.report_progress)
+
+        def show_result(finished):
+            if finished:
+                self.show_status_message('DataFrame exported to ' + fname)
+
+        return self.run_job(
+            export, on_result=show_result,
+            error_header='<b>Could not export DataFrame to %s</b>' % fname)
 
     def close(self, *args, **kwargs):
+        if self.job_running:
+            self.worker.cancel()
+            self.worker.wait()
         if self.dock is not None:
             self.dock.close(*args, **kwargs)  # removes the dock window
             del self.dock
@@ -0,0 +1,1474 @@
+"""Functions to open datasets for the psyplot GUI
+
+The functions in this module do not create any widgets. They are used by the
+:class:`~psyplot_gui.plot_creator.PlotCreator` (and therefore by the
+:meth:`psyplot_gui.main.MainWindow.open_external_files` method) to open one
+or more files, usually within a :class:`~psyplot_gui.common.WorkerThread`,
+and by the :func:`psyplot_gui.start_app` function to open the files for the
+`output`"""
+import os
+import os.path as osp
+import threading
+import hashlib
+import json
+import zipfile
+import logging
+from contextlib import contextmanager
+from collections import OrderedDict
+from itertools import chain
+import six
+import numpy as np
+import xarray as xr
+import psyplot.project as psy
+from psyplot_gui.config.rcsetup import rcParams
+from psyplot_gui.common import (
+    get_cache_dir, file_identity, prune_cache_dir, touch_cache_file, LRUCache)
+
+
+logger = logging.getLogger(__name__)
+
+
+class OpenCancelled(Exception):
+    """Exception that is raised when opening a dataset has been cancelled"""
+    pass
+
+
+def _has_dask():
+    try:
+        import dask  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@contextmanager
+def open_scheduler(workers=None):
+    """Context manager to use a local threaded dask scheduler
+
+    Parameters
+    ----------
+    workers: int
+        The number of threads. If None, the ``'main.open_workers'`` item of
+        the :attr:`~psyplot_gui.config.rcsetup.rcParams` is used and if this
+        is 0, the number of CPUs"""
+    import dask
+    if workers is None:
+        workers = rcParams['main.open_workers']
+    workers = workers or os.cpu_count() or 1
+    with dask.config.set(scheduler='threads', num_workers=workers):
+        yield
+
+
+# -----------------------------------------------------------------------------
+# ---------------------- coordinate consistency checks ------------------------
+# -----------------------------------------------------------------------------
+
+
+#: In-memory cache for the coordinate fingerprints of files (see
+#: :func:`get_coord_fingerprint`)
+_coord_fingerprints = LRUCache()
+
+
+def _fingerprint_key(fname, concat_dim):
+    return file_identity(fname) + (concat_dim, )
+
+
+def _fingerprint_file(key):
+    return osp.join(get_cache_dir('coord_fingerprints'), hashlib.sha1(
+        repr(key).encode('utf-8')).hexdigest() + '.json')
+
+
+def coord_fingerprint(ds, concat_dim):
+    """Compute a hash of the coordinates that do not depend on `concat_dim`
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset of one file
+    concat_dim: str
+        The dimension along which the files are concatenated
+
+    Returns
+    -------
+    str
+        The hex digest of the names, dimensions and values of the coordinates
+        that are identical in all files of a consistent multi-file dataset"""
+    sha = hashlib.sha1()
+    for name in sorted(map(str, ds.coords)):
+        coord = ds.coords[name]
+        if concat_dim in coord.dims:
+            continue
+        sha.update(repr((name, coord.dims, str(coord.dtype))).encode('utf-8'))
+        values = np.asarray(coord.values)
+        if values.dtype.hasobject:
+            sha.update(repr(values.tolist()).encode('utf-8'))
+        else:
+            sha.update(np.ascontiguousarray(values).tobytes())
+    return sha.hexdigest()
+
+
+def get_coord_fingerprint(fname, concat_dim):
+    """Get the cached coordinate fingerprint of a file
+
+    Parameters
+    ----------
+    fname: str
+        The path to the file
+    concat_dim: str
+        The dimension along which the files are concatenated
+
+    Returns
+    -------
+    str or None
+        The fingerprint (see :func:`coord_fingerprint`) or None, if it has not
+        yet been computed for the current version of the file"""
+    try:
+        key = _fingerprint_key(fname, concat_dim)
+    except (IOError, OSError):
+        return None
+    try:
+        return _coord_fingerprints[key]
+    except KeyError:
+        pass
+    cache_file = _fingerprint_file(key)
+    try:
+        with open(cache_file) as f:
+            ret = _coord_fingerprints[key] = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    touch_cache_file(cache_file)
+    return ret
+
+
+def save_coord_fingerprint(fname, concat_dim, fingerprint):
+    """Store the coordinate fingerprint of a file in memory and on disk"""
+    key = _fingerprint_key(fname, concat_dim)
+    _coord_fingerprints[key] = fingerprint
+    try:
+        with open(_fingerprint_file(key), 'w') as f:
+            json.dump(fingerprint, f)
+        prune_cache_dir('coord_fingerprints')
+    except (IOError, OSError, TypeError, ValueError):
+        # the disk cache is optional
+        pass
+
+
+def coords_consistent(fnames, concat_dim):
+    """Check with the cached fingerprints whether the coordinates match
+
+    Returns
+    -------
+    bool
+        True, if the fingerprints of all `fnames` are known and equal. In this
+        case, the coordinates do not have to be compared when the files are
+        combined"""
+    if not isinstance(concat_dim, six.string_types):
+        return False
+    fingerprints = set()
+    for fname in fnames:
+        fingerprint = get_coord_fingerprint(fname, concat_dim)
+        if fingerprint is None:
+            return False
+        fingerprints.add(fingerprint)
+        if len(fingerprints) > 1:
+            return False
+    return True
+
+
+# -----------------------------------------------------------------------------
+# ----------------------------- time decoding ---------------------------------
+# -----------------------------------------------------------------------------
+
+
+#: In-memory cache for the decoded time coordinates (see
+#: :func:`decode_times_cached`)
+_decoded_times = LRUCache()
+
+
+def _time_variables(ds, coords=True):
+    """Get the names of the encoded CF times in the coordinates (or all
+    variables, if `coords` is False) of `ds`"""
+    variables = ds.coords if coords else ds.variables
+    return [name for name, var in six.iteritems(variables)
+            if ' since ' in str(var.attrs.get('units', '')) and
+            np.issubdtype(var.dtype, np.number)]
+
+
+def _decode_timedelta():
+    """The `decode_timedelta` value that xarray uses if the times are decoded
+
+    This is used when the files are opened with ``decode_times=False``, such
+    that the timedeltas are still decoded as with the default settings."""
+    try:
+        return xr.coders.CFTimedeltaCoder()
+    except AttributeError:  # xarray < 2025.01 follows `decode_times`
+        return True
+
+
+def _decode_cf_times(variables):
+    """Decode the CF times of the given variables with
+    :func:`xarray.decode_cf`"""
+    decoded = xr.decode_cf(xr.Dataset(variables), decode_coords=False,
+                           mask_and_scale=False, concat_characters=False)
+    return {name: decoded.variables[name].to_base_variable()
+            for name in variables}
+
+
+def _time_key(variables):
+    """Compute a hash of the raw time `variables`"""
+    sha = hashlib.sha1()
+    for name, var in sorted(variables.items()):
+        sha.update(repr((name, var.dims, str(var.dtype), sorted(
+            var.attrs.items()))).encode('utf-8'))
+        sha.update(np.ascontiguousarray(var.values).tobytes())
+    return sha.hexdigest()
+
+
+def _decoded_times_file(key):
+    return osp.join(get_cache_dir('decoded_times'), key + '.npz')
+
+
+def _json_default(obj):
+    """Convert the numpy objects in the encoding of a variable for json"""
+    if isinstance(obj, np.dtype):
+        return obj.str
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError('%r is not JSON serializable' % (obj, ))
+
+
+def _save_decoded_times(key, decoded):
+    """Save the decoded time variables as plain data in the disk cache
+
+    The values are stored in a numpy ``.npz`` file together with the
+    dimensions, attributes and encoding as json. Arrays of ``cftime`` objects
+    cannot be stored without pickling, so they are only cached in memory"""
+    arrays = {}
+    meta = None
+    if decoded is not None:
+        if any(var.dtype.kind == 'O' for var in decoded.values()):
+            return
+        meta = []
+        for i, (name, var) in enumerate(sorted(decoded.items())):
+            meta.append([name, list(var.dims), var.attrs, var.encoding])
+            arrays['values%i' % i] = var.values
+    try:
+        meta = json.dumps(meta, default=_json_default)
+    except (TypeError, ValueError):
+        return
+    fname = _decoded_times_file(key)
+    # write to a temporary file first, because the files of a multi-file
+    # dataset are decoded in parallel
+    tmp = '%s.%i.tmp.npz' % (fname[:-4], threading.current_thread().ident)
+    try:
+        np.savez(tmp, meta=np.array(meta), **arrays)
+        os.replace(tmp, fname)
+        prune_cache_dir('decoded_times')
+    except (IOError, OSError):
+        # the disk cache is optional
+        logger.debug('Could not cache the decoded times', exc_info=True)
+
+
+def _load_decoded_times(key):
+    """Load the decoded time variables from the disk cache
+
+    Returns
+    -------
+    dict or None
+        The decoded variables or None, if the times could not be decoded
+
+    Raises
+    ------
+    IOError
+        If the times of `key` are not in the disk cache"""
+    fname = _decoded_times_file(key)
+    with np.load(fname, allow_pickle=False) as f:
+        meta = json.loads(six.text_type(f['meta']))
+        if meta is None:
+            ret = None
+        else:
+            ret = {}
+            for i, (name, dims, attrs, encoding) in enumerate(meta):
+                if 'dtype' in encoding:
+                    encoding['dtype'] = np.dtype(encoding['dtype'])
+                ret[name] = xr.Variable(dims, f['values%i' % i], attrs,
+                                        encoding)
+    touch_cache_file(fname)
+    return ret
+
+
+def decode_time_variables(variables):
+    """Decode the CF times of raw variables with the cache
+
+    Parameters
+    ----------
+    variables: dict
+        A mapping from variable name to the raw :class:`xarray.Variable`, i.e.
+        a time coordinate and its bounds
+
+    Returns
+    -------
+    dict or None
+        The decoded `variables` or None, if the times cannot be decoded"""
+    key = _time_key(variables)
+    try:
+        return _decoded_times[key]
+    except KeyError:
+        pass
+    try:
+        ret = _decoded_times[key] = _load_decoded_times(key)
+    except Exception:
+        pass
+    else:
+        return ret
+    try:
+        ret = _decode_cf_times(variables)
+    except Exception:
+        logger.debug('Could not decode the times of %s', list(variables),
+                     exc_info=True)
+        ret = None
+    _decoded_times[key] = ret
+    _save_decoded_times(key, ret)
+    return ret
+
+
+def decode_times_cached(ds):
+    """Decode the CF times of a dataset that has been opened without
+
+    The time coordinates and their bounds are decoded with
+    :func:`xarray.decode_cf`. The decoded values are cached in memory and on
+    disk with a hash of the raw values and attributes as key (see
+    :func:`decode_time_variables`), such that the calendar of a file is
+    decoded only once. Other variables with CF times are decoded lazily
+    without the cache.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset that has been opened with ``decode_times=False``
+
+    Returns
+    -------
+    xarray.Dataset
+        The dataset with the decoded times. Times that cannot be decoded are
+        left as they are"""
+    updates = {}
+    done = set()
+
+    def update(variables, decoded):
+        for key, var in six.iteritems(decoded):
+            var = var.copy(deep=False)
+            var.encoding = dict(variables[key].encoding, **var.encoding)
+            updates[key] = var
+
+    for name in _time_variables(ds):
+        variables = {name: ds.variables[name]}
+        bounds = ds.variables[name].attrs.get('bounds')
+        if bounds in ds.variables:
+            variables[bounds] = ds.variables[bounds]
+        done.update(variables)
+        decoded = decode_time_variables(variables)
+        if decoded is not None:
+            update(variables, decoded)
+    for name in _time_variables(ds, coords=False):
+        if name in done:
+            continue
+        variables = {name: ds.variables[name]}
+        try:
+            decoded = _decode_cf_times(variables)
+        except Exception:
+            logger.debug('Could not decode the times of %s', name,
+                         exc_info=True)
+        else:
+            update(variables, decoded)
+    if updates:
+        ds = ds.copy()
+        ds.update(updates)
+    # decode the absolute times of psyplot
+    return psy.CFDecoder.decode_ds(ds, decode_coords=False,
+                                   decode_times=True)
+
+
+# -----------------------------------------------------------------------------
+# ---------------------------- opening datasets -------------------------------
+# -----------------------------------------------------------------------------
+
+
+#: The files in the root of a zarr store that identify the store
+ZARR_METADATA = ['.zmetadata', '.zgroup', 'zarr.json']
+
+
+def zarr_path(fname):
+    """Get the path of a zarr store
+
+    Parameters
+    ----------
+    fname: str
+        The path to the store or to one of the :attr:`ZARR_METADATA` files in
+        the root of the store (as it is selected in a file dialog)
+
+    Returns
+    -------
+    str
+        The path to the directory or zip file of the store"""
+    if osp.basename(fname) in ZARR_METADATA:
+        return osp.dirname(fname)
+    return fname.rstrip('/' + os.sep) or fname
+
+
+def _store_names(fname):
+    """Get the names in the root of a directory or zip file or None"""
+    if osp.isdir(fname):
+        return os.listdir(fname)
+    # only probe zip files, such that other files (e.g. netCDF) are not opened
+    elif (fname.lower().endswith('.zip') and osp.isfile(fname) and
+            zipfile.is_zipfile(fname)):
+        with zipfile.ZipFile(fname) as f:
+            return f.namelist()
+    return None
+
+
+def is_zarr(fname):
+    """Check whether a path is a zarr store
+
+    Parameters
+    ----------
+    fname: str
+        The path to check (see :func:`zarr_path`)
+
+    Returns
+    -------
+    bool
+        True, if `fname` ends with ``'.zarr'`` or ``'.zarr.zip'`` or is a
+        directory or zip file with one of the :attr:`ZARR_METADATA` files in
+        its root"""
+    if not isinstance(fname, six.string_types):
+        return False
+    fname = zarr_path(fname)
+    if fname.endswith(('.zarr', '.zarr.zip')):
+        return True
+    names = _store_names(fname)
+    return names is not None and any(f in names for f in ZARR_METADATA)
+
+
+def zarr_consolidated(fname):
+    """Check whether a zarr store has consolidated metadata
+
+    Parameters
+    ----------
+    fname: str
+        The path to the directory or zip file of the store
+
+    Returns
+    -------
+    bool or None
+        True, if the store has consolidated metadata (i.e. it can be opened
+        by reading one file), False if it is a zarr v2 store without, and
+        None if it is unknown"""
+    names = _store_names(fname)
+    if names is None:
+        return None
+    elif '.zmetadata' in names:
+        return True
+    elif '.zgroup' in names:
+        return False
+    return None
+
+
+def zarr_kwargs(fnames, kwargs):
+    """Update the keyword arguments to open zarr stores
+
+    Parameters
+    ----------
+    fnames: list of str
+        The paths to open
+    kwargs: dict
+        The keyword arguments for the :func:`psyplot.data.open_dataset` or
+        :func:`psyplot.data.open_mfdataset` function. They are updated in
+        place to use the ``'zarr'`` engine with consolidated metadata (if
+        available) and dask chunks of the size of the zarr chunks
+
+    Returns
+    -------
+    list of str
+        The paths to the stores (see :func:`zarr_path`)
+
+    Raises
+    ------
+    ValueError
+        If zarr stores are combined with other files"""
+    stores = list(map(is_zarr, fnames))
+    if not any(stores) or kwargs.get('engine') not in [None, 'zarr']:
+        return fnames
+    elif not all(stores):
+        raise ValueError(
+            'Zarr stores cannot be combined with other files: %s' % (
+                fnames, ))
+    fnames = list(map(zarr_path, fnames))
+    kwargs['engine'] = 'zarr'
+    consolidated = set(map(zarr_consolidated, fnames))
+    if len(consolidated) == 1:
+        kwargs['backend_kwargs'] = dict(
+            {'consolidated': consolidated.pop()},
+            **(kwargs.get('backend_kwargs') or {}))
+    if _has_dask():
+        kwargs.setdefault('chunks', {})
+    return fnames
+
+
+def use_time_cache(kwargs):
+    """Check whether the times should be decoded with the cache
+
+    Parameters
+    ----------
+    kwargs: dict
+        The keyword arguments to open a dataset
+
+    Returns
+    -------
+    bool
+        True, if the ``'main.time_cache'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` is True and the
+        `kwargs` do not disable the CF decoding"""
+    return (rcParams['main.time_cache'] and
+            kwargs.get('decode_cf', True) is not False and
+            kwargs.get('decode_times', True) is not False)
+
+
+#: Keyword arguments of :func:`xarray.open_mfdataset` that are not accepted
+#: by :func:`xarray.open_dataset`
+MFDATASET_KWARGS = ['combine', 'concat_dim', 'compat', 'coords', 'data_vars',
+                    'join', 'preprocess', 'combine_attrs', 'attrs_file']
+
+
+def probe_decode_times(fname, *args, **kwargs):
+    """Check whether the times in a file can be decoded
+
+    Parameters
+    ----------
+    fname: str
+        The path to the file
+    ``*args, **kwargs``
+        Any other argument for the :func:`psyplot.data.open_dataset` function
+
+    Returns
+    -------
+    xarray.Dataset
+        The dataset of `fname`
+    bool
+        True, if the times could be decoded, else False
+
+    Notes
+    -----
+    If `decode_times` is not specified and the ``'main.time_cache'`` item of
+    the :attr:`~psyplot_gui.config.rcsetup.rcParams` is True, the file is
+    opened without decoding the times and they are decoded with the cache (see
+    :func:`decode_times_cached`)"""
+    if kwargs.get('decode_times') is None and use_time_cache(kwargs):
+        kwargs['decode_times'] = False
+        kwargs.setdefault('decode_timedelta', _decode_timedelta())
+        ds = decode_times_cached(psy.open_dataset(fname, *args, **kwargs))
+        return ds, not _time_variables(ds, coords=False)
+    if kwargs.get('decode_times') is not None:
+        return psy.open_dataset(fname, *args, **kwargs), kwargs['decode_times']
+    try:
+        return psy.open_dataset(fname, *args, **kwargs), True
+    except Exception:
+        logger.debug('Could not decode the times in %s', fname,
+                     exc_info=True)
+    kwargs['decode_times'] = False
+    return psy.open_dataset(fname, *args, **kwargs), False
+
+
+def open_dataset(fnames, *args, **kwargs):
+    """Open one or more files as a dataset
+
+    Zarr stores (directories or zip files, see :func:`is_zarr`) are opened
+    with the ``'zarr'`` engine and their consolidated metadata, if available
+    (see :func:`zarr_kwargs`).
+
+    In contrast to :func:`psyplot.data.open_mfdataset`, the time decoding is
+    checked only once with the first file (see :func:`probe_decode_times`),
+    the decoded times are cached (see :func:`decode_times_cached`) and the
+    progress of opening multiple files can be monitored and cancelled.
+
+    Multiple files are opened concurrently by a local threaded dask scheduler
+    (see :func:`open_scheduler`). The coordinates of each file that do not
+    depend on the `concat_dim` are fingerprinted and cached. If the cached
+    fingerprints of all files are equal, the coordinates are not compared
+    again when the files are combined.
+
+    Parameters
+    ----------
+    fnames: list of str
+        The paths to the files or zarr stores
+    progress: callable
+        A function that is called with the number of opened files and the
+        total number of files. If it returns False, the opening is cancelled
+        and an :class:`OpenCancelled` error is raised. The
+        :meth:`psyplot_gui.common.WorkerThread.report_progress` method can be
+        used here
+    parallel: bool
+        Open the files concurrently with dask (only the metadata is read).
+        If None, this is enabled if dask is installed and the
+        ``'main.parallel_open'`` item in the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` is True
+    workers: int
+        The number of threads for `parallel`. If None, the
+        ``'main.open_workers'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` is used
+    roi: dict
+        The bounds of a region of interest that is selected from the dataset
+        (see :func:`subset_dataset`)
+    overview: dict
+        Keyword arguments for the :func:`coarsen_dataset` function to open a
+        coarsened overview of the dataset (after selecting the `roi`)
+    ``*args, **kwargs``
+        Any other argument for the :func:`psyplot.data.open_dataset` or
+        :func:`psyplot.data.open_mfdataset` function
+
+    Returns
+    -------
+    xarray.Dataset
+        The opened dataset"""
+    progress = kwargs.pop('progress', None)
+    parallel = kwargs.pop('parallel', None)
+    workers = kwargs.pop('workers', None)
+    roi = kwargs.pop('roi', None)
+    overview = kwargs.pop('overview', None)
+    if roi or overview is not None:
+        ds = open_dataset(fnames, *args, progress=progress, parallel=parallel,
+                          workers=workers, **kwargs)
+        if roi:
+            ds = subset_dataset(ds, roi)
+        if overview is not None:
+            ds = coarsen_dataset(ds, **overview)
+        return ds
+    if isinstance(fnames, six.string_types):
+        fnames = [fnames]
+    fnames = zarr_kwargs(list(fnames), kwargs)
+    # one step for the probe and one for each file in a multi-file dataset
+    n = len(fnames) + 1 if len(fnames) > 1 else 1
+
+    def report(i):
+        if progress is not None and progress(i, n) is False:
+            raise OpenCancelled('Opening %s has been cancelled' % (fnames, ))
+
+    report(0)
+    time_cache = (kwargs.get('decode_times') is None and
+                  use_time_cache(kwargs))
+    ds, decode_times = probe_decode_times(
+        fnames[0], *args, **{key: val for key, val in six.iteritems(kwargs)
+                             if key not in MFDATASET_KWARGS})
+    report(1)
+    if n == 1:
+        return ds
+    ds.close()
+    # with the time cache, the files are opened without decoding the times
+    # and they are decoded in the preprocessing of each file
+    kwargs['decode_times'] = decode_times and not time_cache
+    if time_cache:
+        kwargs.setdefault('decode_timedelta', _decode_timedelta())
+
+    lock = threading.Lock()
+    counter = [1]
+    preprocess = kwargs.pop('preprocess', None)
+    concat_dim = kwargs.get('concat_dim')
+    consistent = coords_consistent(fnames, concat_dim)
+    if consistent:
+        kwargs.setdefault('coords', 'minimal')
+        kwargs.setdefault('compat', 'override')
+
+    def count_files(ds):
+        # this is called for every file, in parallel mode from multiple
+        # threads
+        fname = ds.encoding.get('source')
+        if (not consistent and fname and
+                isinstance(concat_dim, six.string_types)):
+            save_coord_fingerprint(
+                fname, concat_dim, coord_fingerprint(ds, concat_dim))
+        with lock:
+            counter[0] += 1
+            i = counter[0]
+        report(i)
+        if time_cache and decode_times:
+            ds = decode_times_cached(ds)
+        return ds if preprocess is None else preprocess(ds)
+
+    if parallel is None:
+        parallel = rcParams['main.parallel_open'] and _has_dask()
+    if not parallel:
+        return psy.open_mfdataset(fnames, *args, preprocess=count_files,
+                                  **kwargs)
+    with open_scheduler(workers):
+        return psy.open_mfdataset(fnames, *args, preprocess=count_files,
+                                  parallel=True, **kwargs)
+
+
+# -----------------------------------------------------------------------------
+# ----------------------------- loading data ----------------------------------
+# -----------------------------------------------------------------------------
+
+
+class LoadCancelled(OpenCancelled):
+    """Exception that is raised when loading data has been cancelled"""
+    pass
+
+
+def _iter_variables(arrays):
+    """Iterate over the variables of the data arrays and their coordinates
+
+    Instances of :class:`psyplot.data.InteractiveList` are expanded"""
+    for arr in arrays:
+        if isinstance(arr, list):
+            for var in _iter_variables(arr):
+                yield var
+        else:
+            yield arr.variable
+            for coord in arr.coords.values():
+                yield coord.variable
+
+
+def load_arrays(arrays, progress=None, workers=None):
+    """Load the data of multiple arrays concurrently into memory
+
+    The data of all arrays is computed within one call of
+    :func:`dask.compute` using a local threaded scheduler (see
+    :func:`open_scheduler`). Variables that are not backed by dask (e.g.
+    lazily indexed netCDF variables) are loaded within the same scheduler.
+    The arrays are modified in place, similar to the
+    :meth:`xarray.DataArray.load` method.
+
+    Parameters
+    ----------
+    arrays: list of xarray.DataArray
+        The arrays to load. :class:`psyplot.data.InteractiveList` instances
+        are expanded
+    progress: callable
+        A function that is called with the number of finished tasks and the
+        total number of tasks. If it returns False, the loading is cancelled
+        and a :class:`LoadCancelled` error is raised. The
+        :meth:`psyplot_gui.common.WorkerThread.report_progress` method can be
+        used here
+    workers: int
+        The number of threads. If None, the ``'main.open_workers'`` item of
+        the :attr:`~psyplot_gui.config.rcsetup.rcParams` is used
+
+    Returns
+    -------
+    list of xarray.DataArray
+        The given `arrays`"""
+    import dask
+    from dask.callbacks import Callback
+
+    seen = set()
+    variables = []
+    for var in _iter_variables(arrays):
+        # coordinates are often shared among the arrays
+        # note that the ``data`` attribute would load non-dask variables
+        if id(var) not in seen and not getattr(var, '_in_memory', False):
+            seen.add(id(var))
+            variables.append(var)
+    if not variables:
+        if progress is not None and progress(1, 1) is False:
+            raise LoadCancelled('Loading the data has been cancelled')
+        return arrays
+
+    def load(var):
+        var.load()
+        return var.data
+
+    lazy = [var.data if var.chunks is not None else
+            dask.delayed(load, pure=False)(var) for var in variables]
+
+    class ProgressCallback(Callback):
+
+        def _start_state(self, dsk, state):
+            self._ntasks = sum(
+                len(state[key]) for key in ['ready', 'waiting', 'running',
+                                            'finished'])
+            self._report(state)
+
+        def _posttask(self, key, result, dsk, state, worker_id):
+            self._report(state)
+
+        def _report(self, state):
+            if progress(len(state['finished']), self._ntasks) is False:
+                raise LoadCancelled('Loading the data has been cancelled')
+
+    with open_scheduler(workers):
+        if progress is None:
+            loaded = dask.compute(*lazy)
+        else:
+            with ProgressCallback():
+                loaded = dask.compute(*lazy)
+    for var, data in zip(variables, loaded):
+        var.data = data
+    return arrays
+
+
+# -----------------------------------------------------------------------------
+# ---------------------------- prefetching data -------------------------------
+# -----------------------------------------------------------------------------
+
+
+class Prefetcher(object):
+    """Load the data of array selections in the background into a cache
+
+    The selections are loaded in a thread pool and kept in a least recently
+    used cache whose total size is limited by :attr:`max_bytes`. Requests
+    that are not needed anymore can be cancelled via :meth:`cancel`"""
+
+    @property
+    def max_bytes(self):
+        """The maximum size of the cache in bytes. If None, the
+        ``'plotcreator.prefetch_memory'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` (in MB) is used"""
+        if self._max_bytes is None:
+            return int(rcParams['plotcreator.prefetch_memory'] * 1024 ** 2)
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        self._max_bytes = value
+
+    @property
+    def nbytes(self):
+        """The size of the cached data in bytes"""
+        return sum(arr.nbytes for arr in self._cache.values())
+
+    def __init__(self, max_bytes=None, workers=None, background=None):
+        """
+        Parameters
+        ----------
+        max_bytes: int
+            The maximum size of the cache in bytes (see :attr:`max_bytes`)
+        workers: int
+            The number of threads. If None, the ``'main.open_workers'`` item
+            of the :attr:`~psyplot_gui.config.rcsetup.rcParams` is used and
+            if this is 0, the number of CPUs
+        background: bool
+            If True, load the data in a thread pool. Otherwise it is loaded
+            directly in :meth:`request`. If None, the
+            ``'main.background_jobs'`` item of the
+            :attr:`~psyplot_gui.config.rcsetup.rcParams` is used"""
+        self._max_bytes = max_bytes
+        self.workers = workers
+        self.background = background
+        self._cache = OrderedDict()
+        self._futures = {}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(ds, name, dims):
+        """Get the key of a selection
+
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            The dataset containing the variable
+        name: str
+            The name of the variable
+        dims: dict
+            The indexers for :meth:`xarray.DataArray.isel`
+
+        Returns
+        -------
+        tuple
+            The hashable key for :meth:`request`, :meth:`get` and
+            :meth:`cancel`"""
+        return (id(ds), name, repr(sorted(dims.items(), key=str)))
+
+    def request(self, ds, name, dims):
+        """Request the data of a selection
+
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            The dataset containing the variable
+        name: str
+            The name of the variable
+        dims: dict
+            The indexers for :meth:`xarray.DataArray.isel`
+
+        Returns
+        -------
+        tuple
+            The key of the request (see :meth:`key`)"""
+        key = self.key(ds, name, dims)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return key
+            if key in self._futures:
+                return key
+        arr = ds[name].isel(**dims)
+        if arr.size * arr.dtype.itemsize > self.max_bytes:
+            return key
+        background = self.background
+        if background is None:
+            background = rcParams['main.background_jobs']
+        if not background:
+            self._futures[key] = None
+            self._load(key, arr)
+            return key
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            workers = self.workers or rcParams['main.open_workers'] or \
+                os.cpu_count() or 1
+            self._executor = ThreadPoolExecutor(workers)
+        with self._lock:
+            self._futures[key] = self._executor.submit(self._load, key, arr)
+        return key
+
+    def _load(self, key, arr):
+        try:
+            arr = arr.load()
+        except Exception:
+            logger.debug('Could not prefetch %s', key, exc_info=True)
+            with self._lock:
+                self._futures.pop(key, None)
+            return
+        with self._lock:
+            # the request might have been cancelled in the meantime
+            if self._futures.pop(key, False) is False:
+                return
+            self._cache[key] = arr
+            nbytes = self.nbytes
+            max_bytes = self.max_bytes
+            while nbytes > max_bytes and self._cache:
+                nbytes -= self._cache.popitem(last=False)[1].nbytes
+
+    def get(self, key):
+        """Get the prefetched data
+
+        Parameters
+        ----------
+        key: tuple
+            The key of the selection (see :meth:`key`)
+
+        Returns
+        -------
+        xarray.DataArray or None
+            The loaded selection or None, if it has not (yet) been loaded"""
+        with self._lock:
+            ret = self._cache.get(key)
+            if ret is not None:
+                self._cache.move_to_end(key)
+        return ret
+
+    def cancel(self, keys=None):
+        """Cancel requests and remove their data from the cache
+
+        Parameters
+        ----------
+        keys: list of tuple
+            The keys of the selections. If None, all requests are cancelled
+            and the cache is cleared"""
+        with self._lock:
+            if keys is None:
+                keys = list(self._futures) + list(self._cache)
+            for key in keys:
+                future = self._futures.pop(key, None)
+                if future is not None:
+                    future.cancel()
+                self._cache.pop(key, None)
+
+    def shutdown(self):
+        """Cancel all requests and stop the thread pool"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# -----------------------------------------------------------------------------
+# ----------------------------- size estimates --------------------------------
+# -----------------------------------------------------------------------------
+
+
+def _selected_indices(n, idx):
+    """Get the selected indices of a dimension with length `n`"""
+    if isinstance(idx, slice):
+        return np.arange(n)[idx]
+    return np.atleast_1d(np.arange(n)[idx])
+
+
+def _chunk_bounds(var):
+    """Get the chunk boundaries of a variable for each dimension
+
+    Returns
+    -------
+    list of numpy.ndarray or None
+        For each dimension the (exclusive) upper boundaries of the chunks or
+        None, if the variable is not chunked"""
+    if var.chunks is not None:  # dask array
+        return [np.cumsum(c) for c in var.chunks]
+    chunksizes = var.encoding.get('chunksizes') or var.encoding.get('chunks')
+    if not chunksizes or var.encoding.get('contiguous'):
+        return None
+    return [np.minimum(np.arange(c, n + c, c), n)
+            for c, n in zip(chunksizes, var.shape)]
+
+
+def _compression_ratio(var, ds):
+    """Estimate the ratio of the compressed to the uncompressed size"""
+    enc = var.encoding
+    compressed = enc.get('zlib') or enc.get('compressor') or enc.get(
+        'compression')
+    fname = enc.get('source') or ds.encoding.get('source')
+    if not compressed or not fname or not osp.isfile(fname):
+        return 1.
+    total = sum(v.size * v.dtype.itemsize for v in ds.variables.values())
+    if not total:
+        return 1.
+    return min(1., os.path.getsize(fname) / total)
+
+
+def estimate_bytes(ds, name, dims={}):
+    """Estimate the memory and the I/O of a selection
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset containing the variable
+    name: str
+        The name of the variable
+    dims: dict
+        The indexers for :meth:`xarray.DataArray.isel` (integers, lists of
+        integers or slices)
+
+    Returns
+    -------
+    int
+        The number of bytes of the loaded selection
+    int
+        The estimated number of bytes that are read from the disk. For
+        chunked variables, all chunks that are touched by the selection are
+        read and for compressed variables, the size is scaled by the
+        compression ratio of the file"""
+    var = ds.variables[name]
+    itemsize = var.dtype.itemsize
+    indices = [_selected_indices(n, dims.get(dim, slice(None)))
+               for dim, n in zip(var.dims, var.shape)]
+    nbytes = int(np.prod([len(ind) for ind in indices])) * itemsize
+    bounds = _chunk_bounds(var)
+    if bounds is None:
+        read = nbytes
+    else:
+        read = itemsize
+        for ind, b in zip(indices, bounds):
+            touched = np.unique(np.searchsorted(b, ind, side='right'))
+            sizes = np.diff(np.r_[0, b])
+            read *= int(sizes[touched].sum())
+    return nbytes, int(read * _compression_ratio(var, ds))
+
+
+def available_memory():
+    """Get the available memory of the system
+
+    Returns
+    -------
+    int or None
+        The available memory in bytes (via :mod:`psutil` if installed) or
+        None, if it cannot be determined"""
+    try:
+        import psutil
+    except ImportError:
+        try:
+            return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+        except (AttributeError, ValueError, OSError):
+            return None
+    return psutil.virtual_memory().available
+
+
+def format_bytes(nbytes):
+    """Format a number of bytes as a human readable string"""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if abs(nbytes) < 1024. or unit == 'TB':
+            break
+        nbytes /= 1024.
+    if unit == 'B':
+        return '%i %s' % (nbytes, unit)
+    return '%1.1f %s' % (nbytes, unit)
+
+
+# -----------------------------------------------------------------------------
+# --------------------------- region of interest ------------------------------
+# -----------------------------------------------------------------------------
+
+
+def _roi_coord(ds, name):
+    """Get the coordinate of a dataset for the bounds of a region
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    name: str
+        The name of a coordinate in `ds` or one of ``'x', 'y', 'z', 't'``
+        to use the coordinate that the :class:`psyplot.data.CFDecoder`
+        identifies for the first variable in `ds`
+
+    Returns
+    -------
+    xarray.Variable
+        The coordinate"""
+    if name in ds.variables:
+        return ds.variables[name]
+    if name in ['x', 'y', 'z', 't']:
+        for vname in ds.data_vars:
+            var = ds[vname]
+            coord = getattr(var.psy.decoder, 'get_' + name)(
+                var, coords=ds.coords)
+            if coord is not None and coord.name in ds.variables:
+                return ds.variables[coord.name]
+    raise KeyError("Could not find a coordinate for %r!" % (name, ))
+
+
+def _roi_bound(val, values):
+    """Convert the bound of a region to the data type of the coordinate"""
+    if val is None or (isinstance(val, six.string_types) and
+                       not val.strip()):
+        return None
+    if values.dtype.kind in 'mM':
+        return np.asarray(val, dtype=values.dtype)
+    if isinstance(val, six.string_types):
+        return float(val)
+    return val
+
+
+def _roi_range(values, start, stop):
+    """Get the index ranges of the values within the given bounds
+
+    Returns
+    -------
+    list of tuple
+        The start and (exclusive) stop index for each dimension of
+        `values`"""
+    if values.ndim == 1 and (
+            values.dtype.kind in 'iufmM' and len(values) > 1 and (
+                np.all(values[1:] >= values[:-1]) or
+                np.all(values[1:] <= values[:-1]))):
+        # binary search in monotonic coordinates
+        n = len(values)
+        descending = values[0] > values[-1]
+        if descending:
+            values = values[::-1]
+        i0 = 0 if start is None else np.searchsorted(values, start, 'left')
+        i1 = n if stop is None else np.searchsorted(values, stop, 'right')
+        if descending:
+            i0, i1 = n - i1, n - i0
+        return [(int(i0), int(i1))]
+    # non-monotonic or multi-dimensional (curvilinear) coordinates: use the
+    # bounding box of the matching cells
+    mask = np.ones(values.shape, dtype=bool)
+    if start is not None:
+        mask &= values >= start
+    if stop is not None:
+        mask &= values <= stop
+    ret = []
+    for axis in range(values.ndim):
+        other = tuple(i for i in range(values.ndim) if i != axis)
+        ind = np.nonzero(mask.any(axis=other) if other else mask)[0]
+        ret.append((int(ind[0]), int(ind[-1]) + 1) if len(ind) else (0, 0))
+    return ret
+
+
+def roi_indexers(ds, bounds):
+    """Get the indexers for a region of interest
+
+    Only the (usually small) coordinates are read to compute the indexers.
+    The indices of monotonic one-dimensional coordinates are found with a
+    binary search, for other coordinates the bounding box of all matching
+    cells is used.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    bounds: dict
+        A mapping from coordinate name to a tuple ``(start, stop)`` with the
+        inclusive bounds of the region. The bounds may be None (i.e. no
+        bound) or strings. For datetime coordinates, strings like
+        ``'2000-01'`` are accepted. Instead of a coordinate name, one of
+        ``'x', 'y', 'z', 't'`` may be used (see :func:`_roi_coord`). For
+        dimensions without coordinate, the bounds are interpreted as indices
+
+    Returns
+    -------
+    dict
+        A mapping from dimension to slice for the :meth:`xarray.Dataset.isel`
+        method"""
+    ranges = {}
+    for name, (start, stop) in six.iteritems(bounds):
+        if name in ds.dims and name not in ds.variables:
+            # dimension without coordinate: the bounds are indices
+            values = np.arange(ds.sizes[name])
+            ranges_ = {name: _roi_range(values, _roi_bound(start, values),
+                                        _roi_bound(stop, values))[0]}
+        else:
+            coord = _roi_coord(ds, name)
+            values = np.asarray(coord.values)
+            ranges_ = dict(zip(coord.dims, _roi_range(
+                values, _roi_bound(start, values), _roi_bound(stop, values))))
+        for dim, (i0, i1) in six.iteritems(ranges_):
+            # intersect with the bounds of other coordinates
+            if dim in ranges:
+                i0 = max(i0, ranges[dim][0])
+                i1 = min(i1, ranges[dim][1])
+            ranges[dim] = (i0, max(i0, i1))
+    return {dim: slice(i0, i1) for dim, (i0, i1) in six.iteritems(ranges)}
+
+
+def subset_dataset(ds, bounds):
+    """Select a region of interest from a dataset
+
+    The subset is selected with :meth:`xarray.Dataset.isel` (see
+    :func:`roi_indexers`) such that no data is read and only the data of
+    the region is read when the arrays are loaded or plotted
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    bounds: dict
+        The bounds of the region (see :func:`roi_indexers`)
+
+    Returns
+    -------
+    xarray.Dataset
+        The subset of `ds`
+
+    Raises
+    ------
+    ValueError
+        If the region does not contain any values"""
+    indexers = roi_indexers(ds, bounds)
+    empty = [dim for dim, sl in six.iteritems(indexers)
+             if sl.start >= sl.stop]
+    if empty:
+        raise ValueError(
+            "The region of interest does not contain any values along %s!" % (
+                ', '.join(map(str, empty))))
+    return ds.isel(**indexers)
+
+
+# -----------------------------------------------------------------------------
+# ------------------------------- overviews -----------------------------------
+# -----------------------------------------------------------------------------
+
+
+def overview_factors(ds, size=None, exclude=[]):
+    """Get the coarsening factors for an overview of a dataset
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    size: int
+        The maximum number of cells per dimension. If None, the
+        ``'plotcreator.overview_size'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` is used
+    exclude: list of str
+        Dimensions that shall not be coarsened
+
+    Returns
+    -------
+    dict
+        A mapping from dimension to the integer factor for all dimensions that
+        are longer than `size`"""
+    if size is None:
+        size = rcParams['plotcreator.overview_size']
+    if not size:
+        return {}
+    return {dim: int(np.ceil(n / float(size)))
+            for dim, n in six.iteritems(ds.sizes)
+            if n > size and dim not in exclude}
+
+
+def coarsen_dataset(ds, size=None, freq=None, how='mean'):
+    """Coarsen a dataset for an overview plot
+
+    The numeric variables of the dataset are coarsened by an integer factor
+    along all dimensions that are longer than `size` (see
+    :func:`overview_factors`) and resampled along the time dimension. If
+    dask is installed, the dataset is rechunked such that every chunk is
+    reduced independently. The reduction is therefore lazy and computed
+    chunk-wise in parallel when the data is loaded or plotted.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    size: int
+        The maximum number of cells per dimension
+    freq: str
+        The pandas frequency (e.g. ``'1D'``) to resample the time coordinate
+        (see :func:`_roi_coord`). If None, the time dimension is coarsened
+        like any other dimension
+    how: {'mean', 'max'}
+        The reduction for the coarsened cells
+
+    Returns
+    -------
+    xarray.Dataset
+        The coarsened dataset without the non-numeric variables"""
+    if how not in ['mean', 'max']:
+        raise ValueError("Unknown reduction %r! Use 'mean' or 'max'" % (
+            how, ))
+    orig = ds
+    names = [v for v in ds.data_vars if ds[v].dtype.kind in 'biuf']
+    ds = ds[names]
+    tdim = None
+    if freq:
+        tdim = _roi_coord(ds, 't').dims[0]
+    factors = overview_factors(ds, size, exclude=[tdim])
+    if _has_dask():
+        # align the chunks with the coarsened cells and use roughly four
+        # chunks per reduced dimension
+        chunks = {dim: f * int(np.ceil(np.ceil(ds.sizes[dim] / float(f)) / 4))
+                  for dim, f in six.iteritems(factors)}
+        if tdim is not None:
+            chunks[tdim] = int(np.ceil(ds.sizes[tdim] / 4.))
+        ds = ds.chunk(chunks)
+    if factors:
+        ds = getattr(ds.coarsen(boundary='trim', **factors), how)()
+    if tdim is not None:
+        ds = getattr(ds.resample(**{tdim: freq}), how)()
+    # restore the meta data
+    ds.attrs.update(orig.attrs)
+    for name, var in six.iteritems(ds.variables):
+        if name in orig.variables and not var.attrs:
+            var.attrs.update(orig.variables[name].attrs)
+    return ds
+
+
+# -----------------------------------------------------------------------------
+# -------------------------------- chunking -----------------------------------
+# -----------------------------------------------------------------------------
+
+
+def plotted_dims(ds, name, plot_method, dims={}):
+    """Get the dimensions of a variable that are visualized by a plot method
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    name: str
+        The name of the variable in `ds`
+    plot_method: psyplot.project._PlotterInterface
+        The plot method
+    dims: dict
+        The indexers of the array
+
+    Returns
+    -------
+    list of str
+        The dimensions that are not fixed by the `dims`, the default
+        dimensions and the default slice of the `plot_method` (see
+        :meth:`psyplot.project._PlotterInterface.check_data`)"""
+    from psyplot.data import CFDecoder
+    var = ds[name]
+    corrected = CFDecoder.get_decoder(ds, var).correct_dims(var, dict(chain(
+        six.iteritems(plot_method._default_dims), six.iteritems(dims))))
+    default = plot_method._default_slice
+    if default is None:
+        default = slice(None)
+    ret = []
+    for dim in var.dims:
+        val = corrected.get(dim, default)
+        if isinstance(val, slice) or (np.ndim(val) and len(val) > 1):
+            ret.append(dim)
+    return ret
+
+
+def infer_chunks(ds, plot_method, names=None, max_bytes=None):
+    """Infer the chunks of a dataset from the access pattern of a plot method
+
+    A plot method reads the full extent of the plotted dimensions (e.g.
+    the horizontal dimensions of a map plot) and one step of every other
+    dimension (e.g. one time step). Therefore every chunk covers the
+    plotted dimensions. If such a chunk is larger than `max_bytes`, the
+    outermost plotted dimensions are split. Otherwise, multiple steps of the
+    other dimensions (starting with the innermost one) are grouped into one
+    chunk as long as it does not exceed `max_bytes`, to avoid a large number
+    of tiny chunks.
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    plot_method: psyplot.project._PlotterInterface
+        The plot method (see :func:`plotted_dims`)
+    names: list of str
+        The variables that are plotted. If None, all data variables
+    max_bytes: int
+        The maximum size of one chunk. If None, the
+        ``'plotcreator.chunk_memory'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` (in MB) is used
+
+    Returns
+    -------
+    dict
+        A mapping from dimension to chunk size"""
+    if names is None:
+        names = [v for v in ds.data_vars if ds[v].ndim]
+    if max_bytes is None:
+        max_bytes = rcParams['plotcreator.chunk_memory'] * 1024 ** 2
+    plotted = []
+    for name in names:
+        for dim in plotted_dims(ds, name, plot_method):
+            if dim not in plotted:
+                plotted.append(dim)
+    chunks = {dim: n if dim in plotted else 1
+              for dim, n in six.iteritems(ds.sizes)}
+    if not names or not max_bytes:
+        return chunks
+    itemsize = max(ds[name].dtype.itemsize for name in names)
+    for dim in plotted:
+        nbytes = itemsize * int(np.prod([chunks[d] for d in plotted]))
+        if nbytes <= max_bytes:
+            break
+        factor = int(np.ceil(nbytes / float(max_bytes)))
+        chunks[dim] = max(1, int(np.ceil(chunks[dim] / float(factor))))
+    nbytes = itemsize * int(np.prod([chunks[d] for d in plotted]))
+    # the number of steps of the other dimensions that fit into one chunk
+    nsteps = max_bytes // nbytes
+    for dim in reversed([d for d in ds.sizes if d not in plotted]):
+        if nsteps <= 1:
+            break
+        chunks[dim] = min(ds.sizes[dim], nsteps)
+        nsteps //= chunks[dim]
+    return chunks
+
+
+def rechunk_for_plot(ds, plot_method, names=None):
+    """Rechunk a dataset for a plot method
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset
+    plot_method: psyplot.project._PlotterInterface
+        The plot method (see :func:`infer_chunks`)
+    names: list of str
+        The variables that are plotted. If None, all data variables
+
+    Returns
+    -------
+    xarray.Dataset
+        The dataset with the chunks of :func:`infer_chunks` (or `ds`, if
+        dask is not installed). No data is read"""
+    if not _has_dask():
+        return ds
+    ret = ds.chunk(infer_chunks(ds, plot_method, names))
+    # the data is the same, so we can keep the reference to the file
+    fname = ds.psy._filename
+    if fname is not None:
+        ret.psy.filename = fname
+    return ret
@@ -883,13 +883,19 @@ class MainWindow(QMainWindow):
                             plot_method=None, name=None, dims=None,
                             encoding=None, enable_post=False,
                             seaborn_style=None, concat_dim=get_default_value(
-                                xr.open_mfdataset, 'concat_dim'), chname={}):
+                                xr.open_mfdataset, 'concat_dim'), chname={},
+                            roi=None):
         """
         Open external files
 
         Parameters
         ----------
         %(make_plot.parameters.fnames|project|engine|plot_method|name|dims|encoding|enable_post|seaborn_style|concat_dim|chname)s
+        roi: dict
+            The bounds of a region of interest that is selected from the
+            dataset before the arrays are inserted (see
+            :func:`psyplot_gui.datasets.roi_indexers`). The `dims` then refer
+            to the indices in this region
         """
         if seaborn_style is not None:
             import seaborn as sns
@@ -910,30 +916,37 @@ class MainWindow(QMainWindow):
             return True
         else:
             self.new_plots(False)
-            self.plot_creator.open_dataset(fnames, engine=engine,
-                                           concat_dim=concat_dim)
-            if name == 'all':
-                ds = self.plot_creator.get_ds()
-                name = sorted(set(ds.variables) - set(ds.coords))
-            self.plot_creator.insert_array(
-                list(filter(None, psy.safe_list(name))))
-            if dims is not None:
-                ds = self.plot_creator.get_ds()
-                dims = {key: ', '.join(
-                    map(str, val)) for key, val in six.iteritems(
-                        dims)}
-                for i, vname in enumerate(
-                        self.plot_creator.array_table.vnames):
-                    self.plot_creator.array_table.selectRow(i)
+
+            def on_open(ds):
+                name_ = name
+                if name_ == 'all':
+                    name_ = sorted(set(ds.variables) - set(ds.coords))
+                self.plot_creator.insert_array(
+                    list(filter(None, psy.safe_list(name_))))
+                if dims is not None:
+                    dims_ = {key: ', '.join(
+                        map(str, val)) for key, val in six.iteritems(
+                            dims)}
+                    for i, vname in enumerate(
+                            self.plot_creator.array_table.vnames):
+                        self.plot_creator.array_table.selectRow(i)
+                        self.plot_creator.array_table.update_selected(
+                            )
+                    self.plot_creator.array_table.selectAll()
+                    var = ds[vname[0]]
                     self.plot_creator.array_table.update_selected(
-                        )
-                self.plot_creator.array_table.selectAll()
-                var = ds[vname[0]]
-                self.plot_creator.array_table.update_selected(
-                    dims=var.psy.decoder.correct_dims(var, dims.copy()))
-            if plot_method:
-                self.plot_creator.pm_combo.setCurrentIndex(
-                    self.plot_creator.pm_combo.findText(plot_method))
+                        dims=var.psy.decoder.correct_dims(var, dims_.copy()))
+                if plot_method:
+                    self.plot_creator.pm_combo.setCurrentIndex(
+                        self.plot_creator.pm_combo.findText(plot_method))
+
+            # the dataset is opened in the background and the arrays are
+            # inserted as soon as it is available
+            if roi:
+                self.plot_creator.region_selector.set_bounds(roi)
+            self.plot_creator.open_dataset(fnames, engine=engine,
+                                           concat_dim=concat_dim,
+                                           on_open=on_open, roi=roi)
             self.plot_creator.exec_()
             return True
 
@@ -947,7 +960,7 @@ class MainWindow(QMainWindow):
             name=None, dims=None, encoding=None, enable_post=False,
             seaborn_style=None,
             concat_dim=get_default_value(xr.open_mfdataset, 'concat_dim'),
-            chname={}, show=True):
+            chname={}, roi=None, show=True):
         """
         Create a mainwindow and open the given files or project
 
@@ -974,7 +987,7 @@ class MainWindow(QMainWindow):
         if fnames or project:
             mainwindow.open_external_files(
                 fnames, project, engine, plot_method, name, dims, encoding,
-                enable_post, seaborn_style, concat_dim, chname)
+                enable_post, seaborn_style, concat_dim, chname, roi)
         psyplot.with_gui = True
         return mainwindow
 
@@ -11,9 +11,9 @@ import types
 import xarray
 from functools import partial
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, Counter
 from math import floor
-from itertools import chain, product, cycle, repeat, starmap
+from itertools import chain, product, cycle, repeat, starmap, count
 import matplotlib as mpl
 import six
 from psyplot.utils import _temp_bool_prop
@@ -24,16 +24,179 @@ from psyplot_gui.compat.qtcompat import (
     QLabel, QValidator, QStyledItemDelegate, QLineEdit, QCheckBox, isstring,
     QTableWidget, QTableWidgetItem, QGridLayout, QIntValidator, QMenu, QAction,
     QInputDialog, QTabWidget, QDoubleValidator, QGraphicsScene, asstring,
-    QGraphicsRectItem, QGraphicsView, QDialog, QDialogButtonBox, QSplitter)
+    QGraphicsRectItem, QGraphicsView, QDialog, QDialogButtonBox, QSplitter,
+    QTableView, QProgressBar, QtGui)
 from psyplot_gui.common import (get_icon, ListValidator, PyErrorMessage,
-                                LoadFromConsoleButton)
+                                LoadFromConsoleButton, WorkerThread)
+from psyplot_gui.datasets import (
+    open_dataset, load_arrays, Prefetcher, estimate_bytes, format_bytes,
+    available_memory, subset_dataset, coarsen_dataset, rechunk_for_plot)
+from psyplot_gui.config.rcsetup import rcParams
 from psyplot_gui.preferences import RcParamsTree
+from psyplot_gui.content_widget import dataset_registry
 import psyplot.project as psy
 
 
 logger = logging.getLogger(__name__)
 
 
+class CoordListModel(QtCore.QAbstractListModel):
+    """A lazy list model for the values of a coordinate
+
+    The first row is empty and the following rows represent the values (or
+    the indices) of the coordinate. The strings for the values are only
+    computed when they are displayed and then cached in blocks of
+    :attr:`BLOCKSIZE` values that are formatted at once"""
+
+    #: The number of values that are formatted at once
+    BLOCKSIZE = 1000
+
+    def __init__(self, parent=None):
+        super(CoordListModel, self).__init__(parent)
+        self.values = None
+        self.size = 0
+        self._blocks = {}
+        self.check_states = {}
+        self._loaded = self._sorted = False
+
+    def set_values(self, values=None, size=None):
+        """Set the values of the model
+
+        Parameters
+        ----------
+        values: numpy.ndarray
+            The values of the coordinate. If None, the indices are shown
+        size: int
+            The number of indices to show if `values` is None. If both are
+            None, the model is emptied"""
+        self.beginResetModel()
+        self.values = values
+        self.size = len(values) if values is not None else (size or 0)
+        self._loaded = values is not None or size is not None
+        self._sorted = values is not None and values.dtype.kind in 'iufM' \
+            and bool((values[1:] >= values[:-1]).all())
+        self._blocks.clear()
+        self.check_states.clear()
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """Reimplemented to return the number of values plus one"""
+        return self.size + 1 if self._loaded else 0
+
+    def format_block(self, block):
+        """Convert a block of values to strings
+
+        Parameters
+        ----------
+        block: int
+            The block number (i.e. the values from
+            ``block * BLOCKSIZE`` to ``(block + 1) * BLOCKSIZE``
+
+        Returns
+        -------
+        list of str
+            The formatted values"""
+        start = block * self.BLOCKSIZE
+        stop = min(start + self.BLOCKSIZE, self.size)
+        if self.values is None:
+            return list(map(str, range(start, stop)))
+        values = self.values[start:stop]
+        if values.dtype.kind == 'M':
+            return np.datetime_as_string(values, unit='auto').tolist()
+        elif values.dtype.kind == 'O':  # e.g. cftime objects
+            return list(map(str, values))
+        return values.astype(str).tolist()
+
+    def get_text(self, i):
+        """Get the string of the `i`-th value (without the empty first row)
+        """
+        block, pos = divmod(i, self.BLOCKSIZE)
+        try:
+            strings = self._blocks[block]
+        except KeyError:
+            strings = self._blocks[block] = self.format_block(block)
+        return strings[pos]
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Reimplemented to format the values on demand"""
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in [Qt.DisplayRole, Qt.EditRole]:
+            return self.get_text(row - 1) if row else ''
+        elif role == Qt.CheckStateRole:
+            return self.check_states.get(row)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Reimplemented to allow changing the check state"""
+        if role == Qt.CheckStateRole:
+            self.check_states[index.row()] = value
+            self.dataChanged.emit(index, index)
+            return True
+        return False
+
+    def flags(self, index):
+        """Reimplemented to make the items checkable"""
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def find_row(self, text):
+        """Find the row of the value that is represented by a string
+
+        For numeric and datetime coordinates, the closest value is searched
+        (with a binary search if the coordinate is sorted). If the model shows
+        the indices, `text` is interpreted as the index, otherwise the first
+        value whose string starts with `text` is used.
+
+        Parameters
+        ----------
+        text: str
+            The string to search for
+
+        Returns
+        -------
+        int or None
+            The row in the model or None, if no value could be found"""
+        text = text.strip()
+        if not text or not self.size:
+            return None
+        values = self.values
+        if values is None:
+            try:
+                i = int(text)
+            except ValueError:
+                return None
+            return min(max(i, 0), self.size - 1) + 1
+        target = None
+        if values.dtype.kind == 'M':
+            try:
+                target = np.datetime64(text).astype(values.dtype)
+            except ValueError:
+                pass
+        elif values.dtype.kind in 'iuf':
+            try:
+                target = float(text)
+            except ValueError:
+                pass
+        if target is not None:
+            if self._sorted:
+                i = int(values.searchsorted(target))
+                if i == len(values) or (i and abs(values[i - 1] - target) <=
+                                        abs(values[i] - target)):
+                    i -= 1
+            else:
+                i = int(np.abs(values - target).argmin())
+            return i + 1
+        # search the strings block-wise
+        nblocks = int(np.ceil(self.size / self.BLOCKSIZE))
+        for block in range(nblocks):
+            self.get_text(block * self.BLOCKSIZE)
+            found = np.nonzero(np.char.startswith(
+                np.asarray(self._blocks[block], dtype=str), text))[0]
+            if len(found):
+                return block * self.BLOCKSIZE + int(found[0]) + 1
+        return None
+
+
 class CoordComboBox(QComboBox):
     """Combobox showing coordinate information of a dataset
 
@@ -59,13 +222,17 @@ class CoordComboBox(QComboBox):
             The parent widget"""
         super(CoordComboBox, self).__init__(parent)
         self.dim = dim
-        self._is_empty = True
         self.get_ds = ds_func
         self._changed = False
         self._right_clicked = False
+        self.coord_model = CoordListModel(self)
+        self.setModel(self.coord_model)
 
         # modify the view
         view = self.view()
+        # all items have the same size which avoids the computation of the
+        # size for every (potentially unformatted) value
+        view.setUniformItemSizes(True)
         # We allow the selection of multiple items with a left-click
         view.setSelectionMode(QListView.ExtendedSelection)
         # The following modifications will cause this behaviour:
@@ -97,6 +264,43 @@ class CoordComboBox(QComboBox):
         view.pressed.connect(self.handleItemPressed)
         view.doubleClicked.connect(self.hide_anyway)
 
+        # add a line edit to the popup to jump to a value
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText('Jump to...')
+        self.search_edit.setToolTip(
+            'Enter a value (or index) to jump to the closest value')
+        self.search_edit.textChanged.connect(self.jump_to)
+        container_layout = view.parentWidget().layout()
+        if container_layout is not None:
+            container_layout.insertWidget(0, self.search_edit)
+
+    @property
+    def _is_empty(self):
+        return not self.coord_model._loaded
+
+    @_is_empty.setter
+    def _is_empty(self, value):
+        if value:
+            self.coord_model.set_values()
+
+    def clear(self):
+        """Reimplemented to clear the :attr:`coord_model`"""
+        self.coord_model.set_values()
+
+    def jump_to(self, text):
+        """Scroll the popup to the value that matches the given `text`
+
+        See Also
+        --------
+        CoordListModel.find_row"""
+        row = self.coord_model.find_row(text)
+        if row is not None:
+            index = self.coord_model.index(row)
+            view = self.view()
+            view.scrollTo(index, QAbstractItemView.PositionAtTop)
+            selection_model = view.selectionModel()
+            selection_model.setCurrentIndex(index, selection_model.NoUpdate)
+
     def eventFilter(self, obj, event):
         """Reimplemented to filter right-click events on the view()"""
         ret = ((event.type() == QtCore.QEvent.MouseButtonPress) and
@@ -106,11 +310,11 @@ class CoordComboBox(QComboBox):
     def handleItemPressed(self, index):
         """Function to be called when an item is pressed to make sure that
         we know whether anything changed before closing the popup"""
-        item = self.model().itemFromIndex(index)
-        if item.checkState() == Qt.Checked:
-            item.setCheckState(Qt.Unchecked)
+        model = self.coord_model
+        if model.data(index, Qt.CheckStateRole) == Qt.Checked:
+            model.setData(index, Qt.Unchecked, Qt.CheckStateRole)
         else:
-            item.setCheckState(Qt.Checked)
+            model.setData(index, Qt.Checked, Qt.CheckStateRole)
         self.setCurrentIndex(0)
         self._changed = True
 
@@ -152,12 +356,10 @@ class CoordComboBox(QComboBox):
         it (if it is empty)"""
         if self._is_empty:
             ds = self.get_ds()
-            self.addItem('')
             if self.use_coords:
-                self.addItems(ds[self.dim].astype(str).values)
+                self.coord_model.set_values(np.asarray(ds[self.dim].values))
             else:
-                self.addItems(list(map(str, range(len(ds[self.dim])))))
-            self._is_empty = False
+                self.coord_model.set_values(size=len(ds[self.dim]))
 
 
 class ArrayNameValidator(QValidator):
@@ -218,20 +420,367 @@ class VariableItemDelegate(QStyledItemDelegate):
         return editor
 
 
-class VariablesTable(QTableWidget):
-    """Table to display the variables of a dataset"""
+class ThumbnailLoader(QtCore.QObject):
+    """Render the thumbnails of variables in a thread pool
+
+    The thumbnails are rendered via the
+    :func:`psyplot_gui.thumbnails.get_thumbnail` function and the resulting
+    PNG images are emitted with the :attr:`thumbnail_ready` signal (i.e. they
+    are converted to pixmaps in the GUI thread). If the
+    ``'main.background_jobs'`` configuration value is False, the thumbnails
+    are rendered directly when they are requested"""
+
+    #: A signal that is emitted with the dataset, the variable name and the
+    #: PNG image (or None) when a thumbnail has been rendered
+    thumbnail_ready = QtCore.pyqtSignal(object, object, object)
+
+    def __init__(self, workers=None, parent=None):
+        """
+        Parameters
+        ----------
+        workers: int
+            The number of threads. If None, the
+            ``'plotcreator.thumbnail_workers'`` configuration value is used
+        parent: PyQt5.QtCore.QObject
+            The parent of the loader"""
+        super(ThumbnailLoader, self).__init__(parent)
+        self.workers = workers
+        self._executor = None
+        self._futures = {}
+
+    def request(self, ds, vname, size):
+        """Request the thumbnail of a variable
+
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            The dataset containing the variable
+        vname: str
+            The name of the variable
+        size: int
+            The size of the thumbnail in pixels"""
+        key = (id(ds), vname, size)
+        if key in self._futures:
+            return
+        if not rcParams['main.background_jobs']:
+            self._render(ds, vname, size)
+            return
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            workers = self.workers or rcParams[
+                'plotcreator.thumbnail_workers'] or os.cpu_count() or 1
+            self._executor = ThreadPoolExecutor(workers)
+        future = self._executor.submit(self._render, ds, vname, size)
+        self._futures[key] = future
+        future.add_done_callback(
+            lambda f: self._futures.pop(key, None))
+
+    def _render(self, ds, vname, size):
+        from psyplot_gui.thumbnails import get_thumbnail
+        try:
+            png = get_thumbnail(ds, vname, size)
+        except Exception:
+            logger.debug('Could not render the thumbnail of %s', vname,
+                         exc_info=True)
+            png = None
+        try:
+            self.thumbnail_ready.emit(ds, vname, png)
+        except RuntimeError:  # the loader has already been deleted
+            pass
+
+    def cancel(self):
+        """Cancel the thumbnails that have not yet been started"""
+        for future in list(self._futures.values()):
+            future.cancel()
+        self._futures.clear()
+
+    def shutdown(self):
+        """Cancel the pending thumbnails and stop the thread pool"""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class VariablesModel(QtCore.QAbstractTableModel):
+    """A model for the variables of a dataset
+
+    The attributes of the variables are only read for the rows that are
+    displayed and then cached. The model can be filtered via
+    :meth:`set_filter`. Optionally, the last column shows thumbnails of the
+    variables that are rendered in the background by a
+    :class:`ThumbnailLoader` (see :meth:`set_thumbnails`)"""
+
+    #: The label of the thumbnail column
+    THUMBNAIL_LABEL = 'preview'
+
+    def __init__(self, columns=['long_name', 'dims', 'shape'], parent=None):
+        """
+        Parameters
+        ----------
+        columns: list of str
+            The attribute that will be used as columns for the variables
+        parent: PyQt5.QtCore.QObject
+            The parent of the model"""
+        super(VariablesModel, self).__init__(parent)
+        self.column_labels = list(columns)
+        self.ds = None
+        #: The names of all variables in the dataset
+        self.variables = []
+        #: The indices of the displayed variables in :attr:`variables`
+        self.rows = np.zeros(0, dtype=int)
+        self.filter_text = ''
+        self._cache = {}
+        self._search_strings = None
+        #: Whether to show thumbnails of the variables in the last column
+        self.thumbnails = False
+        #: The size of the thumbnails in pixels
+        self.thumbnail_size = 64
+        self._pixmaps = {}
+        self._thumbnail_loader = None
+
+    @property
+    def thumbnail_loader(self):
+        """The :class:`ThumbnailLoader` to render the thumbnails"""
+        if self._thumbnail_loader is None:
+            self._thumbnail_loader = ThumbnailLoader(parent=self)
+            self._thumbnail_loader.thumbnail_ready.connect(
+                self._set_thumbnail)
+        return self._thumbnail_loader
+
+    @property
+    def thumbnail_col(self):
+        """The column of the thumbnails or None, if they are not shown"""
+        return len(self.column_labels) + 1 if self.thumbnails else None
+
+    @property
+    def filtered_variables(self):
+        """The names of the displayed variables"""
+        return [self.variables[i] for i in self.rows]
+
+    def set_dataset(self, ds):
+        """Show the variables of the given dataset
 
-    #: The variables in the dataset
-    variables = []
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            The dataset. If None, the model is emptied"""
+        self.beginResetModel()
+        if self._thumbnail_loader is not None:
+            self._thumbnail_loader.cancel()
+        self._pixmaps.clear()
+        self.ds = ds
+        if ds is None:
+            self.variables = []
+        else:
+            coords = set(ds.coords)
+            self.variables = [v for v in ds.variables if v not in coords]
+        self.rows = np.arange(len(self.variables))
+        self.filter_text = ''
+        self._cache.clear()
+        self._search_strings = None
+        self.endResetModel()
+
+    def set_columns(self, columns):
+        """Set the attributes that are displayed as columns"""
+        self.beginResetModel()
+        self.column_labels = list(columns)
+        self._cache.clear()
+        self.endResetModel()
+
+    def set_thumbnails(self, show, size=None):
+        """Show or hide the thumbnail column
+
+        Parameters
+        ----------
+        show: bool
+            If True, the thumbnails are shown in the last column
+        size: int
+            The size of the thumbnails in pixels. If None, the current
+            :attr:`thumbnail_size` is used"""
+        self.beginResetModel()
+        self.thumbnails = bool(show)
+        if size is not None and size != self.thumbnail_size:
+            self.thumbnail_size = size
+            self._pixmaps.clear()
+        if not show and self._thumbnail_loader is not None:
+            self._thumbnail_loader.cancel()
+        self.endResetModel()
+
+    def thumbnail(self, row):
+        """Get the thumbnail of the variable in the given row
+
+        If the thumbnail has not yet been rendered, it is requested from the
+        :attr:`thumbnail_loader`
+
+        Parameters
+        ----------
+        row: int
+            The row in the model
+
+        Returns
+        -------
+        PyQt5.QtGui.QPixmap or None
+            The thumbnail or None, if it is not (yet) available"""
+        vname = self.variables[self.rows[row]]
+        try:
+            return self._pixmaps[vname]
+        except KeyError:
+            pass
+        self._pixmaps[vname] = None  # mark as requested
+        self.thumbnail_loader.request(self.ds, vname, self.thumbnail_size)
+        return self._pixmaps.get(vname)
+
+    def shutdown(self):
+        """Stop rendering the thumbnails"""
+        if self._thumbnail_loader is not None:
+            self._thumbnail_loader.shutdown()
+
+    def _set_thumbnail(self, ds, vname, png):
+        if ds is not self.ds or vname not in self._pixmaps:
+            return
+        if png is None:
+            return
+        pixmap = QtGui.QPixmap()
+        pixmap.loadFromData(png, 'PNG')
+        self._pixmaps[vname] = pixmap
+        column = self.thumbnail_col
+        if column is None:
+            return
+        ivar = self.variables.index(vname)
+        rows = np.where(self.rows == ivar)[0]
+        if len(rows):
+            index = self.index(int(rows[0]), column)
+            self.dataChanged.emit(index, index)
+
+    @property
+    def search_strings(self):
+        """The lower-case names and long names of the variables that are
+        used for filtering"""
+        if self.ds is None:
+            return np.array([], dtype=six.text_type)
+        if self._search_strings is None:
+            variables = self.ds.variables
+            self._search_strings = np.array([
+                (asstring(v) + '\n' + asstring(
+                    variables[v].attrs.get('long_name', ''))).lower()
+                for v in self.variables], dtype=six.text_type)
+        return self._search_strings
+
+    def set_filter(self, text):
+        """Only show the variables whose name or long name contains `text`
+
+        If `text` extends the previous filter, only the currently displayed
+        variables are checked
+
+        Parameters
+        ----------
+        text: str
+            The (case-insensitive) text to filter the variables"""
+        text = asstring(text).strip().lower()
+        self.beginResetModel()
+        if not text:
+            self.rows = np.arange(len(self.variables))
+        else:
+            if self.filter_text and text.startswith(self.filter_text):
+                candidates = self.rows
+            else:
+                candidates = np.arange(len(self.variables))
+            found = np.char.find(self.search_strings[candidates], text) >= 0
+            self.rows = candidates[found]
+        self.filter_text = text
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.column_labels) + 1 + bool(self.thumbnails)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return (['variable'] + self.column_labels +
+                    [self.THUMBNAIL_LABEL])[section]
+
+    def get_text(self, row, column):
+        """Get the text of a cell
+
+        Parameters
+        ----------
+        row: int
+            The row in the model
+        column: int
+            The column in the model
+
+        Returns
+        -------
+        str
+            The variable name (for `column` 0) or the attribute"""
+        ivar = self.rows[row]
+        key = (ivar, column)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        vname = self.variables[ivar]
+        if column == 0:
+            ret = asstring(vname)
+        else:
+            attr = self.column_labels[column - 1]
+            variable = self.ds.variables[vname]
+            if attr == 'dims':
+                ret = ', '.join(variable.dims)
+            else:
+                ret = str(variable.attrs.get(attr, getattr(
+                    variable, attr, '')))
+        self._cache[key] = ret
+        return ret
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.column() == self.thumbnail_col:
+            if role == Qt.DecorationRole:
+                return self.thumbnail(index.row())
+            return None
+        if role in [Qt.DisplayRole, Qt.ToolTipRole]:
+            return self.get_text(index.row(), index.column())
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+
+class VariablesTable(QTableView):
+    """Table to display the variables of a dataset
+
+    The table is a view of a :class:`VariablesModel`"""
+
+    #: A signal that is emitted when the selection changed
+    itemSelectionChanged = QtCore.pyqtSignal()
+
+    @property
+    def variables(self):
+        """The variables in the dataset"""
+        return self.variables_model.variables
+
+    @property
+    def filtered_variables(self):
+        """The variables that are displayed after filtering"""
+        return self.variables_model.filtered_variables
+
+    @property
+    def column_labels(self):
+        """The attributes that are displayed as columns"""
+        return self.variables_model.column_labels
 
     @property
     def selected_variables(self):
         """The currently selected variables"""
-        return [
-            self.variables[i] for i in map(
-                list(map(asstring, self.variables)).index,
-                sorted(set(item.text() for item in self.selectedItems()
-                           if item.column() == 0)))]
+        model = self.variables_model
+        rows = sorted(set(
+            index.row() for index in self.selectionModel().selectedIndexes()))
+        return sorted((model.variables[model.rows[row]] for row in rows),
+                      key=asstring)
 
     def __init__(self, get_func, columns=['long_name', 'dims', 'shape'],
                  *args, **kwargs):
@@ -244,42 +793,65 @@ class VariablesTable(QTableWidget):
         columns: list of str
             The attribute that will be used as columns for the variables"""
         super(VariablesTable, self).__init__(*args, **kwargs)
-        self.variables = []
         self.get_ds = get_func
-        self.set_columns(columns)
+        self.variables_model = VariablesModel(columns, self)
+        self.setModel(self.variables_model)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.verticalHeader().setVisible(False)
+        self._row_height = self.verticalHeader().defaultSectionSize()
+        self.selectionModel().selectionChanged.connect(
+            lambda *args: self.itemSelectionChanged.emit())
 
     def set_columns(self, columns=None):
-        if columns is None:
-            columns = self.column_labels
+        if columns is not None:
+            self.variables_model.set_columns(columns)
+
+    def set_filter(self, text):
+        """Filter the variables
+
+        See Also
+        --------
+        VariablesModel.set_filter"""
+        self.variables_model.set_filter(text)
+
+    def set_thumbnails(self, show, size=None):
+        """Show or hide the thumbnails of the variables
+
+        See Also
+        --------
+        VariablesModel.set_thumbnails"""
+        if size is None:
+            size = rcParams['plotcreator.thumbnail_size']
+        self.variables_model.set_thumbnails(show, size)
+        if show:
+            self.setIconSize(QtCore.QSize(size, size))
+            self.verticalHeader().setDefaultSectionSize(size + 4)
         else:
-            self.column_labels = columns
-        self.setColumnCount(len(columns) + 1)
-        self.setHorizontalHeaderLabels(['variable'] + columns)
+            self.verticalHeader().setDefaultSectionSize(self._row_height)
 
     def fill_from_ds(self, ds=None):
-        """Clear the table and insert items from the given `dataset`"""
-        self.clear()
-        self.set_columns()
+        """Clear the table and show the variables of the given `dataset`"""
         if ds is None:
             ds = self.get_ds()
-        if ds is None:
-            return
-        coords = list(ds.coords)
-        self.variables = vnames = [v for v in ds.variables if v not in coords]
-        self.setRowCount(len(vnames))
-        for i, vname in enumerate(vnames):
-            variable = ds.variables[vname]
-            self.setItem(i, 0, QTableWidgetItem(asstring(vname)))
-            for j, attr in enumerate(self.column_labels, 1):
-                if attr == 'dims':
-                    self.setItem(i, j, QTableWidgetItem(
-                        ', '.join(variable.dims)))
-                else:
-                    self.setItem(i, j, QTableWidgetItem(
-                        str(variable.attrs.get(attr, getattr(
-                            variable, attr, '')))))
+        self.variables_model.set_dataset(ds)
+
+    def select_variables(self, variables):
+        """Select the given variables
+
+        Parameters
+        ----------
+        variables: list of str
+            The names of the variables to select"""
+        model = self.variables_model
+        variables = set(variables)
+        selection_model = self.selectionModel()
+        selection_model.clearSelection()
+        for row, ivar in enumerate(model.rows):
+            if model.variables[ivar] in variables:
+                selection_model.select(
+                    model.index(row, 0),
+                    selection_model.Select | selection_model.Rows)
 
 
 class CoordsTable(QTableWidget):
@@ -341,9 +913,509 @@ class CoordsTable(QTableWidget):
             self.horizontalHeader().height() + self.rowHeight(0))
 
 
-class DragDropTable(QTableWidget):
+class RegionSelector(QWidget):
+    """A widget to select a bounding box and a time window of a dataset
+
+    The bounds refer to the x-, y- and t-coordinates that are identified by
+    the :class:`psyplot.data.CFDecoder` (see
+    :func:`psyplot_gui.datasets.roi_indexers`)"""
+
+    #: The coordinates and their labels
+    COORDS = [('x', 'x: '), ('y', 'y: '), ('t', 'time: ')]
+
+    def __init__(self, *args, **kwargs):
+        super(RegionSelector, self).__init__(*args, **kwargs)
+        self.edits = OrderedDict()
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.addWidget(QLabel('Region: ', self))
+        for coord, label in self.COORDS:
+            start = QLineEdit(self)
+            stop = QLineEdit(self)
+            if coord == 't':
+                start.setPlaceholderText('start')
+                stop.setPlaceholderText('end')
+            else:
+                start.setPlaceholderText('min')
+                stop.setPlaceholderText('max')
+            start.setToolTip('The lower bound of the %s-coordinate' % coord)
+            stop.setToolTip('The upper bound of the %s-coordinate' % coord)
+            self.edits[coord] = (start, stop)
+            hbox.addWidget(QLabel(label, self))
+            hbox.addWidget(start)
+            hbox.addWidget(stop)
+        self.bt_apply = QToolButton(self)
+        self.bt_apply.setIcon(QIcon(get_icon('run_arrow.png')))
+        self.bt_apply.setToolTip(
+            'Select the region from the current dataset. Only the data of '
+            'the region is read when the plots are created')
+        hbox.addWidget(self.bt_apply)
+        self.setLayout(hbox)
+
+    @property
+    def bounds(self):
+        """The mapping from coordinate to ``(start, stop)`` for all
+        coordinates with at least one bound"""
+        ret = OrderedDict()
+        for coord, edits in six.iteritems(self.edits):
+            start, stop = (asstring(e.text()).strip() or None for e in edits)
+            if start is not None or stop is not None:
+                ret[coord] = (start, stop)
+        return ret
+
+    def set_bounds(self, bounds):
+        """Set the bounds of the coordinates
+
+        Parameters
+        ----------
+        bounds: dict
+            A mapping from ``'x', 'y'`` or ``'t'`` to a tuple
+            ``(start, stop)``. The bounds of the other coordinates are
+            cleared"""
+        for coord, edits in six.iteritems(self.edits):
+            for edit, val in zip(edits, bounds.get(coord, (None, None))):
+                edit.setText('' if val is None else str(val))
+
+
+class OverviewSelector(QWidget):
+    """A widget to set up a coarsened overview of a dataset
+
+    See Also
+    --------
+    psyplot_gui.datasets.coarsen_dataset"""
+
+    def __init__(self, *args, **kwargs):
+        super(OverviewSelector, self).__init__(*args, **kwargs)
+        self.how_combo = QComboBox(self)
+        self.how_combo.addItems(['', 'mean', 'max'])
+        self.how_combo.setToolTip(
+            'Open the datasets as coarsened overview with the mean or the '
+            'maximum of the coarsened cells')
+        self.size_edit = QLineEdit(self)
+        self.size_edit.setValidator(QIntValidator(1, 1000000, parent=self))
+        self.size_edit.setPlaceholderText(
+            str(rcParams['plotcreator.overview_size']))
+        self.size_edit.setToolTip(
+            'The maximum number of cells per dimension. Larger dimensions '
+            'are coarsened by an integer factor')
+        self.freq_edit = QLineEdit(self)
+        self.freq_edit.setPlaceholderText('resample, e.g. 1D')
+        self.freq_edit.setToolTip(
+            'The frequency to resample the time dimension (e.g. <em>1D</em> '
+            'for daily or <em>MS</em> for monthly values)')
+        self.bt_apply = QToolButton(self)
+        self.bt_apply.setIcon(QIcon(get_icon('run_arrow.png')))
+        self.bt_apply.setToolTip(
+            'Create an overview of the current dataset. New datasets are '
+            'opened as overview if a reduction is selected')
+
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.addWidget(QLabel('Overview: ', self))
+        hbox.addWidget(self.how_combo)
+        hbox.addWidget(QLabel('max. size: ', self))
+        hbox.addWidget(self.size_edit)
+        hbox.addWidget(QLabel('time: ', self))
+        hbox.addWidget(self.freq_edit)
+        hbox.addWidget(self.bt_apply)
+        self.setLayout(hbox)
+
+    @property
+    def settings(self):
+        """The keyword arguments for the
+        :func:`psyplot_gui.datasets.coarsen_dataset` function or None, if no
+        reduction is selected"""
+        how = asstring(self.how_combo.currentText())
+        if not how:
+            return None
+        size = asstring(self.size_edit.text()).strip()
+        freq = asstring(self.freq_edit.text()).strip()
+        return {'how': how, 'size': int(size) if size else None,
+                'freq': freq or None}
+
+
+class ArrayTableModel(QtCore.QAbstractTableModel):
+    """A columnar model for the :class:`ArrayTable`
+
+    Every row has a unique id and each column is stored as a dictionary
+    mapping from the row id to the text of the cell. The order of the rows is
+    given by the :attr:`row_ids`, such that rows can be inserted, updated and
+    moved in batches without copying the content of the cells"""
+
+    #: A signal that is emitted with the old and the new names when the
+    #: entries in the :attr:`count_label` column changed
+    names_changed = QtCore.pyqtSignal(object, object)
+
+    @property
+    def count_col(self):
+        """The index of the column whose entries are counted"""
+        return self._label_index.get(self.count_label)
+
+    @property
+    def check_col(self):
+        """The index of the column that holds the check results"""
+        return self._label_index.get(self.check_label)
+
+    def __init__(self, columns=[], count_label=None, check_label=None,
+                 readonly_labels=[], parent=None):
+        """
+        Parameters
+        ----------
+        columns: list of str
+            The column labels
+        count_label: str
+            The label of the column whose entries are counted in the
+            :attr:`name_counts`
+        check_label: str
+            The label of the column that displays the results of
+            :meth:`set_check`
+        readonly_labels: list of str
+            The labels of further columns that cannot be edited by the user
+        parent: PyQt5.QtCore.QObject
+            The parent of the model"""
+        super(ArrayTableModel, self).__init__(parent)
+        self.count_label = count_label
+        self.check_label = check_label
+        self.readonly_labels = set(readonly_labels)
+        #: The ids of the rows in the order of the table
+        self.row_ids = []
+        #: The check results (``(valid, msg)`` tuples) of the rows
+        self.checks = {}
+        #: A :class:`collections.Counter` of the entries in the
+        #: :attr:`count_label` column
+        self.name_counts = Counter()
+        self.header_tooltips = {}
+        self._ids = count()
+        self._icons = {}
+        self.column_labels = []
+        self.values = []
+        self._label_index = {}
+        self.set_columns(columns)
+
+    def set_columns(self, columns, tooltips={}):
+        """Set the columns of the model
+
+        The entries of columns that exist already are kept
+
+        Parameters
+        ----------
+        columns: list of str
+            The column labels
+        tooltips: dict
+            A mapping from column label to the tooltip of the header"""
+        self.beginResetModel()
+        old = dict(zip(self.column_labels, self.values))
+        self.column_labels = list(columns)
+        self._label_index = {label: i for i, label in enumerate(columns)}
+        self.values = [old.get(label, {}) for label in columns]
+        self.header_tooltips = dict(tooltips)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.row_ids)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.column_labels)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self.column_labels[section]
+            elif role == Qt.ToolTipRole:
+                return self.header_tooltips.get(self.column_labels[section])
+        elif role == Qt.DisplayRole:
+            return str(section + 1)
+
+    def text(self, row, column):
+        """Get the text of a cell
+
+        Parameters
+        ----------
+        row: int
+            The row in the model
+        column: int
+            The column in the model
+
+        Returns
+        -------
+        str
+            The text of the cell"""
+        return self.values[column].get(self.row_ids[row], '')
+
+    def column_texts(self, column):
+        """Get the texts of all cells in one column"""
+        col_values = self.values[column]
+        return [col_values.get(rid, '') for rid in self.row_ids]
+
+    def rows_with(self, column, texts):
+        """Get the rows whose text in `column` is one of `texts`"""
+        col_values = self.values[column]
+        return [row for row, rid in enumerate(self.row_ids)
+                if col_values.get(rid) in texts]
+
+    def _icon(self, name):
+        try:
+            return self._icons[name]
+        except KeyError:
+            icon = self._icons[name] = QIcon(get_icon(name))
+            return icon
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if column == self.check_col:
+            valid, msg = self.checks.get(self.row_ids[index.row()],
+                                         (False, None))
+            if msg is None:  # not yet checked
+                return None
+            if role == Qt.DecorationRole:
+                if valid:
+                    return self._icon('valid.png')
+                elif valid is None:
+                    return self._icon('warning.png')
+                return self._icon('invalid.png')
+            elif role == Qt.ToolTipRole and not valid:
+                return msg
+        elif role in [Qt.DisplayRole, Qt.EditRole]:
+            return self.text(index.row(), column)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsEnabled | Qt.ItemIsDropEnabled
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+        column = index.column()
+        if (column != self.check_col and
+                self.column_labels[column] not in self.readonly_labels):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or (
+                index.column() == self.check_col):
+            return False
+        self.set_values(index.column(), {index.row(): asstring(value)})
+        return True
+
+    def _update_counts(self, old, new):
+        counts = self.name_counts
+        for name in old:
+            counts[name] -= 1
+            if counts[name] <= 0:
+                del counts[name]
+        counts.update(new)
+
+    def set_values(self, column, values):
+        """Update multiple cells of one column at once
+
+        Parameters
+        ----------
+        column: int
+            The column in the model
+        values: dict
+            A mapping from row to the new text of the cell"""
+        col_values = self.values[column]
+        old = []
+        new = []
+        rows = []
+        for row, text in six.iteritems(values):
+            rid = self.row_ids[row]
+            prev = col_values.get(rid)
+            if prev == text:
+                continue
+            col_values[rid] = text
+            rows.append(row)
+            if prev is not None:
+                old.append(prev)
+            new.append(text)
+        if not rows:
+            return
+        if column == self.count_col:
+            self._update_counts(old, new)
+        # one signal for each contiguous block of rows
+        rows.sort()
+        start = rows[0]
+        for prev, row in zip(rows, rows[1:] + [None]):
+            if row != prev + 1:
+                self.dataChanged.emit(self.index(start, column),
+                                      self.index(prev, column))
+                start = row
+        if column == self.count_col:
+            self.names_changed.emit(old, new)
+
+    def set_check(self, row, valid, msg):
+        """Set the check result of a row
+
+        Parameters
+        ----------
+        row: int
+            The row in the model
+        valid: bool or None
+            True if the array is valid, None if there is a warning and False
+            if the array is invalid
+        msg: str
+            The message for a warning or an invalid array"""
+        self.checks[self.row_ids[row]] = (valid, msg or '')
+        column = self.check_col
+        if column is not None:
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index)
+
+    def insert_rows(self, rows, position=None):
+        """Insert multiple rows at once
+
+        Parameters
+        ----------
+        rows: list of dict
+            For each row a mapping from column label to the text of the cell
+        position: int
+            The row where to insert the new rows. If None, they are appended
+
+        Returns
+        -------
+        list of int
+            The ids of the new rows"""
+        if not rows:
+            return []
+        if position is None:
+            position = len(self.row_ids)
+        ids = [next(self._ids) for d in rows]
+        new = []
+        self.beginInsertRows(QtCore.QModelIndex(), position,
+                             position + len(rows) - 1)
+        self.row_ids[position:position] = ids
+        for rid, d in zip(ids, rows):
+            for label, text in six.iteritems(d):
+                self.values[self._label_index[label]][rid] = text
+                if label == self.count_label:
+                    new.append(text)
+        self._update_counts([], new)
+        self.endInsertRows()
+        if new:
+            self.names_changed.emit([], new)
+        return ids
+
+    def remove_rows(self, rows):
+        """Remove multiple rows
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to remove"""
+        rows = sorted(set(rows))
+        count_col = self.count_col
+        old = []
+        # remove contiguous blocks starting from the end
+        blocks = []
+        for row in rows:
+            if blocks and blocks[-1][1] == row - 1:
+                blocks[-1][1] = row
+            else:
+                blocks.append([row, row])
+        for first, last in reversed(blocks):
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            for rid in self.row_ids[first:last + 1]:
+                for i, col_values in enumerate(self.values):
+                    text = col_values.pop(rid, None)
+                    if i == count_col and text is not None:
+                        old.append(text)
+                self.checks.pop(rid, None)
+            del self.row_ids[first:last + 1]
+            self.endRemoveRows()
+        if old:
+            self._update_counts(old, [])
+            self.names_changed.emit(old, [])
+
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self.row_ids = []
+        self.values = [{} for label in self.column_labels]
+        self.checks.clear()
+        self.name_counts.clear()
+        self.endResetModel()
+
+    def move_rows(self, rows, position):
+        """Move rows to another position
+
+        Only the :attr:`row_ids` are reordered, the content of the cells is
+        not copied.
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to move
+        position: int
+            The row before which the `rows` shall be inserted (with respect to
+            the order before the move)"""
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        self.layoutAboutToBeChanged.emit()
+        old_ids = self.row_ids
+        moved = set(rows)
+        position -= sum(1 for row in rows if row < position)
+        remaining = [rid for row, rid in enumerate(old_ids)
+                     if row not in moved]
+        self.row_ids = (remaining[:position] + [old_ids[r] for r in rows] +
+                        remaining[position:])
+        new_rows = {rid: row for row, rid in enumerate(self.row_ids)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [
+            self.index(new_rows[old_ids[index.row()]], index.column())
+            for index in persistent])
+        self.layoutChanged.emit()
+
+
+class ArrayTableItem(object):
+    """A cell of the :class:`ArrayTable`
+
+    This class provides the most important methods of a
+    :class:`QTableWidgetItem` for the cells of the :class:`ArrayTableModel`.
+    The item follows its cell when the rows are moved"""
+
+    def __init__(self, table, row, column):
+        self.table = table
+        self._index = QtCore.QPersistentModelIndex(
+            table.model().index(row, column))
+
+    def row(self):
+        return self._index.row()
+
+    def column(self):
+        return self._index.column()
+
+    def index(self):
+        """The :class:`QtCore.QModelIndex` of the cell"""
+        return self.table.model().index(self.row(), self.column())
+
+    def text(self):
+        return self.table.model().text(self.row(), self.column())
+
+    def setText(self, text):
+        self.table.model().setData(self.index(), asstring(text))
+
+    def toolTip(self):
+        return self.index().data(Qt.ToolTipRole) or ''
+
+    def isSelected(self):
+        return self.table.selectionModel().isSelected(self.index())
+
+    def setSelected(self, select):
+        selection_model = self.table.selectionModel()
+        selection_model.select(
+            self.index(),
+            selection_model.Select if select else selection_model.Deselect)
+
+
+class DragDropTable(QTableView):
     """Table that allows to exchange rows via drag and drop
 
+    The model of the table must implement a ``move_rows`` method (see
+    :meth:`ArrayTableModel.move_rows`).
     This class was mainly taken from
     http://stackoverflow.com/questions/26227885/drag-and-drop-rows-within-qtablewidget
     """
@@ -372,36 +1444,12 @@ class DragDropTable(QTableWidget):
 
     def moveRows(self, row, remove=False):
         """Move all selected rows to the given `row`"""
-        selRows = sorted({ind.row() for ind in self.selectedIndexes()})
-        top = selRows[0]
-
-        dropRow = row
-        if dropRow == -1:
-            dropRow = self.rowCount()
-        offset = dropRow - top
-
-        for i, row in enumerate(selRows):
-            r = row + offset
-            if r > self.rowCount() or r < 0:
-                r = 0
-            self.insertRow(r)
-
-        selRows = sorted({ind.row() for ind in self.selectedIndexes()})
-
-        top = selRows[0]
-        offset = dropRow - top
-        for i, row in enumerate(selRows):
-            r = row + offset
-            if r > self.rowCount() or r < 0:
-                r = 0
-
-            for j in range(self.columnCount()):
-                source = QTableWidgetItem(self.item(row, j))
-                self.setItem(r, j, source)
-
-        if remove:
-            for row in reversed(selRows):
-                self.removeRow(row)
+        rows = sorted({ind.row() for ind in self.selectedIndexes()})
+        if not rows:
+            return
+        if row == -1:
+            row = self.model().rowCount()
+        self.model().move_rows(rows, row)
 
     def droppingOnItself(self, event, index):
         dropAction = event.dropAction()
@@ -489,7 +1537,9 @@ class ArrayTable(DragDropTable):
     4. The check column. Checks for variable names, array names, axes and
        dimensions via the :meth:`psyplot.project._PlotterInterface.check_data`
        method
-    5. Columns containing the dimension informations"""
+    5. The size column. The estimated memory of the array and the bytes that
+       are read from the disk (see :meth:`estimate_rows`)
+    6. Columns containing the dimension informations"""
 
     #: Pattern to interprete subplots
     subplot_patt = re.compile(r'\((?P<fig>\d+),\s*'  # figure
@@ -527,19 +1577,20 @@ class ArrayTable(DragDropTable):
                "</ul>"
                "where the latter is equivalent to '1, 3, 5'")
 
-    def dropEvent(self, event):
-        """Reimplemented to call the :meth:`check_arrays` after the call"""
-        # apparently the row deletion occurs after the call of this method.
-        # therefore our call of `check_arrays` leads to the (wrong) result
-        # of a duplicated entry. We therefore filter them out here and make
-        # sure that those arrays are not considered when checking for
-        # duplicates
-        messages = dict(
-            zip(self.current_names, [msg for b, msg in self.check_arrays()]))
-        super(ArrayTable, self).dropEvent(event)
-        ignores = [arr_name for arr_name, msg in messages.items()
-                   if not msg.startswith('Found duplicated entry of')]
-        self.check_arrays(ignore_duplicates=ignores)
+    #: The delay in milliseconds after the last edit until the changed arrays
+    #: are checked (see :meth:`schedule_check`)
+    CHECK_DELAY = 100
+
+    batch_check = _temp_bool_prop(
+        'batch_check', """check multiple arrays at once without resizing the
+        check column for each of them""")
+
+    #: A signal that is emitted when the selection changed
+    itemSelectionChanged = QtCore.pyqtSignal()
+
+    #: A signal that is emitted when the size estimates changed (see
+    #: :meth:`estimate_rows`)
+    sizes_changed = QtCore.pyqtSignal()
 
     @property
     def prefer_list(self):
@@ -551,16 +1602,19 @@ class ArrayTable(DragDropTable):
         """The names that are currently in use"""
         if self.prefer_list:
             return []
-        arr_col = self.arr_col
-        return [asstring(item.text()) for item in filter(None, map(
-            lambda i: self.item(i, arr_col), range(self.rowCount())))]
+        return list(map(asstring, self.array_model.column_texts(
+            self.arr_col)))
+
+    @property
+    def name_counts(self):
+        """A :class:`collections.Counter` of the array names in the table"""
+        return self.array_model.name_counts
 
     @property
     def vnames(self):
         """The list of variable names per array"""
-        var_col = self.var_col
-        return [self.item(i, var_col).text().split(';;')
-                for i in range(self.rowCount())]
+        return [text.split(';;') for text in self.array_model.column_texts(
+            self.var_col)]
 
     @property
     def arr_names_dict(self):
@@ -568,9 +1622,8 @@ class ArrayTable(DragDropTable):
         `arr_names` parameter in the
         :meth:`psyplot.data.ArrayList.from_dataset` method """
         ret = OrderedDict()
-        arr_col = self.arr_col
-        for irow in range(self.rowCount()):
-            arr_name = asstring(self.item(irow, arr_col).text())
+        arr_names = self.array_model.column_texts(self.arr_col)
+        for irow, arr_name in enumerate(map(asstring, arr_names)):
             if self.plot_method and self.plot_method._prefer_list:
                 d = ret.setdefault(arr_name, defaultdict(list))
                 d['name'].append(self._get_variables(irow))
@@ -585,11 +1638,13 @@ class ArrayTable(DragDropTable):
     @property
     def axes(self):
         """A list of axes settings corresponding to the arrays in the
-        :attr:`arr_names_dict`"""
+        :attr:`arr_names_dict`
+
+        The axes are created at once with the :func:`create_axes_batch`
+        function"""
         ret = []
         d = set()
-        arr_col = self.arr_col
-        axes_col = self.axes_col
+        model = self.array_model
         # get the projection
         pm = self.plot_method
         kwargs = {}
@@ -597,19 +1652,13 @@ class ArrayTable(DragDropTable):
             projection = self.plot_method.plotter_cls._get_sample_projection()
             if projection is not None:
                 kwargs['projection'] = projection
-        for irow in range(self.rowCount()):
-            arr_name = self.item(irow, arr_col).text()
+        for arr_name, axes in zip(model.column_texts(self.arr_col),
+                                  model.column_texts(self.axes_col)):
             if arr_name in d:
                 continue
             d.add(arr_name)
-            axes_type, args = self.axes_info(self.item(irow, axes_col))
-            if axes_type == 'subplot':
-                ret.append(SubplotCreator.create_subplot(*args, **kwargs))
-            elif axes_type == 'axes':
-                ret.append(AxesCreator.create_axes(*args, **kwargs))
-            else:
-                ret.append(None)
-        return ret
+            ret.append(self.axes_info(axes))
+        return create_axes_batch(ret, **kwargs)
 
     @property
     def var_col(self):
@@ -631,6 +1680,17 @@ class ArrayTable(DragDropTable):
         """The index of the check column"""
         return self.desc_cols.index(self.CHECK_LABEL)
 
+    @property
+    def size_col(self):
+        """The index of the size column"""
+        return self.desc_cols.index(self.SIZE_LABEL)
+
+    @property
+    def total_bytes(self):
+        """The estimated memory and the bytes to read of all arrays"""
+        sizes = list(self.row_sizes.values())
+        return (sum(t[0] for t in sizes), sum(t[1] for t in sizes))
+
     def __init__(self, get_func, columns=[], *args, **kwargs):
         """
         Parameters
@@ -646,9 +1706,14 @@ class ArrayTable(DragDropTable):
         self.ARRAY_LABEL = 'array name'
         self.AXES_LABEL = 'axes'
         self.CHECK_LABEL = 'check'
+        self.SIZE_LABEL = 'size'
         self.desc_cols = [self.VARIABLE_LABEL, self.ARRAY_LABEL,
-                          self.AXES_LABEL, self.CHECK_LABEL]
+                          self.AXES_LABEL, self.CHECK_LABEL, self.SIZE_LABEL]
         self.plot_method = None
+        self.array_model = ArrayTableModel(
+            count_label=self.ARRAY_LABEL, check_label=self.CHECK_LABEL,
+            readonly_labels=[self.SIZE_LABEL], parent=self)
+        self.setModel(self.array_model)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.showAxesCreator)
@@ -656,8 +1721,63 @@ class ArrayTable(DragDropTable):
         self.setItemDelegateForColumn(self.var_col, VariableItemDelegate(self))
         self.setItemDelegateForColumn(
             self.arr_col, ArrayNameItemDelegate(self))
-        self.itemChanged.connect(self.check_item)
-        self.itemChanged.connect(self.update_other_items)
+        self._dirty_ids = set()
+        self._check_timer = QtCore.QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(self.CHECK_DELAY)
+        self._check_timer.timeout.connect(self.check_dirty_rows)
+        self.selectionModel().selectionChanged.connect(
+            lambda *args: self.itemSelectionChanged.emit())
+        self.array_model.dataChanged.connect(self._data_changed)
+        self.array_model.names_changed.connect(self._names_changed)
+        self.array_model.rowsInserted.connect(self._rows_inserted)
+
+        #: The :class:`psyplot_gui.datasets.Prefetcher` that loads the data of
+        #: the valid arrays in the background
+        self.prefetcher = Prefetcher()
+        #: A mapping from row id to the keys of the :attr:`prefetcher`
+        self.prefetch_keys = {}
+        #: A mapping from row id to the estimated memory and the bytes to
+        #: read of the array (see :meth:`estimate_rows`)
+        self.row_sizes = {}
+        self.array_model.rowsAboutToBeRemoved.connect(
+            self._rows_about_to_be_removed)
+        self.array_model.rowsRemoved.connect(
+            lambda *args: self.sizes_changed.emit())
+
+    def rowCount(self):
+        """The number of arrays in the table"""
+        return self.array_model.rowCount()
+
+    def columnCount(self):
+        """The number of columns in the table"""
+        return self.array_model.columnCount()
+
+    def item(self, row, column):
+        """Get the item of a cell
+
+        Parameters
+        ----------
+        row: int
+            The row of the cell
+        column: int
+            The column of the cell
+
+        Returns
+        -------
+        ArrayTableItem
+            The item or None, if the cell does not exist"""
+        if 0 <= row < self.rowCount() and 0 <= column < self.columnCount():
+            return ArrayTableItem(self, row, column)
+
+    def indexFromItem(self, item):
+        """Get the model index of an :class:`ArrayTableItem`"""
+        return item.index()
+
+    def selectedItems(self):
+        """The :class:`ArrayTableItem` instances of the selected cells"""
+        return [ArrayTableItem(self, index.row(), index.column())
+                for index in self.selectedIndexes()]
 
     def set_columns(self, columns):
         """Set the columns of the table
@@ -670,11 +1790,9 @@ class ArrayTable(DragDropTable):
             columns = self.column_labels
         else:
             self.column_labels = columns
-        self.setColumnCount(len(columns) + len(self.desc_cols))
-        self.setHorizontalHeaderLabels(self.desc_cols + columns)
-        for i, col in enumerate(columns, len(self.desc_cols)):
-            self.horizontalHeaderItem(i).setToolTip(self.DIMS_TT % col)
-        self.horizontalHeaderItem(self.var_col).setToolTip(self.VARIABLE_TT)
+        tooltips = {col: self.DIMS_TT % col for col in columns}
+        tooltips[self.VARIABLE_LABEL] = self.VARIABLE_TT
+        self.array_model.set_columns(self.desc_cols + list(columns), tooltips)
 
     def setup_from_ds(self, ds=None, plot_method=None):
         """Fill the table based upon the given dataset.
@@ -686,8 +1804,12 @@ class ArrayTable(DragDropTable):
         plot_method: psyplot.project._PlotterInterface or None
             The plot method of the :class:`psyplot.project.ProjectPlotter`
             class or None if no plot shall be made"""
-        self.clear()
-        self.setRowCount(0)
+        self.array_model.clear()
+        self._dirty_ids.clear()
+        self.prefetch_keys.clear()
+        self.prefetcher.cancel()
+        self.row_sizes.clear()
+        self.sizes_changed.emit()
         if ds is None:
             ds = self.get_ds()
         if plot_method is not None:
@@ -705,29 +1827,57 @@ class ArrayTable(DragDropTable):
             pass
         self.set_columns(dims)
 
-    def next_available_name(self, *args, **kwargs):
-        """Gives the next possible name to use"""
-        counter = iter(range(1000))
-        current_names = self.current_names
+    def iter_available_names(self, *args, **kwargs):
+        """Iterate over the names that are not used in the table or project
+
+        ``*args`` and ``**kwargs`` are passed to the
+        :meth:`psyplot.project.Project.next_available_name` method of the
+        current main project"""
+        counter = count()
+        current_names = () if self.prefer_list else self.name_counts
         mp = psy.gcp(True)
         while True:
             name = mp.next_available_name(*args, counter=counter, **kwargs)
             if name not in current_names:
-                return name
+                yield name
+
+    def next_available_name(self, *args, **kwargs):
+        """Gives the next possible name to use"""
+        return next(self.iter_available_names(*args, **kwargs))
 
     def insert_array(self, name, check=True, **kwargs):
         """Appends the settings for an array the the list in a new row"""
-        dims = set(self.get_ds().variables[name].dims)
-        irow = self.rowCount()
-        self.setRowCount(irow + 1)
-        self.setItem(irow, 0, QTableWidgetItem(asstring(name)))
-        self.setItem(irow, 1, QTableWidgetItem(self.next_available_name()))
-        self.setItem(irow, 2, QTableWidgetItem(''))
-        for dim in dims.intersection(kwargs):
-            icol = len(self.desc_cols) + self.dims.index(dim)
-            self.setItem(irow, icol, QTableWidgetItem(kwargs[dim]))
+        self.insert_arrays([name], kwargs, check=check)
+
+    def insert_arrays(self, names, dims={}, check=True):
+        """Append multiple arrays to the table at once
+
+        Parameters
+        ----------
+        names: list of str
+            The variable names of the arrays
+        dims: dict or list of dict
+            The mapping from dimension to the (string) value for the arrays.
+            If a list, one dictionary for each name in `names`
+        check: bool
+            whether the new arrays shall be checked afterwards"""
+        if isinstance(dims, dict):
+            dims = repeat(dims)
+        ds = self.get_ds()
+        arr_names = self.iter_available_names()
+        rows = []
+        for name, kwargs in zip(names, dims):
+            d = {self.VARIABLE_LABEL: asstring(name),
+                 self.ARRAY_LABEL: next(arr_names),
+                 self.AXES_LABEL: ''}
+            var_dims = set(ds.variables[name].dims)
+            for dim in var_dims.intersection(kwargs):
+                d[dim] = kwargs[dim]
+            rows.append(d)
+        nrows = self.rowCount()
+        self.array_model.insert_rows(rows)
         if check:
-            self.check_array(irow)
+            self.check_rows(range(nrows, self.rowCount()))
 
     def remove_arrays(self, selected=True):
         """Remove array rows from the list
@@ -737,11 +1887,10 @@ class ArrayTable(DragDropTable):
         selected: bool
             If True, only the selected rows are removed"""
         if selected:
-            irows = sorted({ind.row() for ind in self.selectedIndexes()})
+            irows = {ind.row() for ind in self.selectedIndexes()}
         else:
-            irows = list(range(self.rowCount()))
-        for irow in irows[::-1]:
-            self.removeRow(irow)
+            irows = range(self.rowCount())
+        self.array_model.remove_rows(irows)
 
     def update_selected(self, check=True, dims={}):
         """Updates the dimensions of the selectiond arrays with the given
@@ -755,22 +1904,24 @@ class ArrayTable(DragDropTable):
             a mapping from coordinate names to string values that shall be
             appended to the current text"""
         ds = self.get_ds()
-        irows = {item.row() for item in self.selectedItems()}
-        var_col = self.desc_cols.index(self.VARIABLE_LABEL)
+        model = self.array_model
+        irows = sorted({index.row() for index in self.selectedIndexes()})
+        var_col = self.var_col
+        updates = defaultdict(dict)
         for irow in irows:
             vname = asstring(
-                self.item(irow, var_col).text()).split(self.sep)[0].strip()
+                model.text(irow, var_col)).split(self.sep)[0].strip()
             var_dims = set(ds.variables[vname].dims)
             for dim in var_dims.intersection(dims):
                 icol = len(self.desc_cols) + self.dims.index(dim)
-                item = self.item(irow, icol)
-                curr_text = asstring(item.text())
+                curr_text = asstring(model.text(irow, icol))
                 if curr_text:
                     curr_text += ', '
-                item.setText(curr_text + dims[dim])
+                updates[icol][irow] = curr_text + dims[dim]
+        for icol, values in six.iteritems(updates):
+            model.set_values(icol, values)
         if check:
-            for irow in irows:
-                self.check_array(irow)
+            self.check_rows(irows)
 
     def add_subplots(self, rows, cols, maxn=None):
         """Add multiple subplots to the selected arrays"""
@@ -782,18 +1933,18 @@ class ArrayTable(DragDropTable):
             [i] * maxn for i in range(1, 1000) if i not in plt.get_fignums()))
         nums = cycle(range(1, maxn + 1))
         seen = set()
-        axes_col = self.desc_cols.index(self.AXES_LABEL)
-        arr_col = self.desc_cols.index(self.ARRAY_LABEL)
+        model = self.array_model
+        arr_col = self.arr_col
+        values = {}
         for irow in irows:
-            arr_item = self.item(irow, arr_col)
-            if arr_item is None or arr_item.text() in seen:
+            arr_name = model.text(irow, arr_col)
+            if arr_name in seen:
                 continue
-            seen.add(arr_item.text())
+            seen.add(arr_name)
             num = next(nums)
-            text = '(%i, %i, %i, %i, %i)' % (
+            values[irow] = '(%i, %i, %i, %i, %i)' % (
                 next(figs), rows, cols, num, num)
-            item = QTableWidgetItem(text)
-            self.setItem(irow, axes_col, item)
+        model.set_values(self.axes_col, values)
 
     def add_single_subplot(self, rows, cols, row, col):
         """Add one subplot to the selected arrays on multiple figures"""
@@ -803,17 +1954,17 @@ class ArrayTable(DragDropTable):
         figs = (num for num in range(1, 1000) if num not in plt.get_fignums())
         num = (row - 1) * rows + col
         seen = set()
-        axes_col = self.desc_cols.index(self.AXES_LABEL)
-        arr_col = self.desc_cols.index(self.ARRAY_LABEL)
+        model = self.array_model
+        arr_col = self.arr_col
+        values = {}
         for irow in irows:
-            arr_item = self.item(irow, arr_col)
-            if arr_item is None or arr_item.text() in seen:
+            arr_name = model.text(irow, arr_col)
+            if arr_name in seen:
                 continue
-            seen.add(arr_item.text())
-            text = '(%i, %i, %i, %i, %i)' % (
+            seen.add(arr_name)
+            values[irow] = '(%i, %i, %i, %i, %i)' % (
                 next(figs), rows, cols, num, num)
-            item = QTableWidgetItem(text)
-            self.setItem(irow, axes_col, item)
+        model.set_values(self.axes_col, values)
 
     def showAxesCreator(self, pos):
         """Context menu for right-click on a row"""
@@ -899,68 +2050,123 @@ class ArrayTable(DragDropTable):
         self.plot_method = getattr(psy.plot, s, None)
         self.check_arrays()
 
-    def check_item(self, item):
-        """Check the array corresponding to the given item"""
-        if item.column() == self.desc_cols.index(self.CHECK_LABEL):
+    def _data_changed(self, top_left, bottom_right, *args):
+        """Schedule the check of the changed rows"""
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        if list(columns) in [[self.check_col], [self.size_col]]:
             return
-        for irow in range(self.rowCount()):
-            other_item = self.item(
-                irow, self.desc_cols.index(self.ARRAY_LABEL))
-            if other_item is not None:
-                self.check_array(irow)
-
-    def update_other_items(self, item):
-        """Updates the axes information of the other items corresponding
-        that have the same array name as the array corresponding to the given
-        `item`"""
-        axes_col = self.desc_cols.index(self.AXES_LABEL)
-        if not self.prefer_list or item.column() != axes_col:
-            return
-        this_row = item.row()
-        arr_col = self.desc_cols.index(self.ARRAY_LABEL)
-        arr_item = self.item(this_row, arr_col)
-        if arr_item is None:
+        rows = range(top_left.row(), bottom_right.row() + 1)
+        self.schedule_check(rows)
+        if self.axes_col in columns:
+            self.update_other_items(rows)
+
+    def _names_changed(self, old, new):
+        """Schedule the check of the rows with duplicated array names"""
+        counts = self.name_counts
+        # rows with the old or new name might (not) be duplicates anymore
+        if any(counts.get(name) for name in old) or any(
+                counts[name] > 1 for name in new):
+            self.schedule_check(self.array_model.rows_with(
+                self.arr_col, set(old) | set(new)))
+
+    def _rows_inserted(self, parent, first, last):
+        self.schedule_check(range(first, last + 1))
+
+    def check_item(self, item):
+        """Schedule the check of the array corresponding to the given item"""
+        if item.column() != self.check_col:
+            self.schedule_check([item.row()])
+
+    def schedule_check(self, rows=None):
+        """Check the given rows after the :attr:`CHECK_DELAY`
+
+        Multiple calls within the delay are merged into one call of
+        :meth:`check_dirty_rows`
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to check. If None, all rows are checked"""
+        row_ids = self.array_model.row_ids
+        if rows is None:
+            self._dirty_ids.update(row_ids)
+        else:
+            self._dirty_ids.update(row_ids[row] for row in rows)
+        self._check_timer.start()
+
+    def check_dirty_rows(self):
+        """Check the rows that have been changed since the last check
+
+        Returns
+        -------
+        list of int
+            The rows that have been checked"""
+        self._check_timer.stop()
+        dirty = self._dirty_ids
+        rows = [row for row, rid in enumerate(self.array_model.row_ids)
+                if rid in dirty]
+        self._dirty_ids = set()
+        self.check_rows(rows)
+        return rows
+
+    def check_rows(self, rows):
+        """Check multiple rows at once
+
+        Rows with the same array name (if the plot method prefers lists) are
+        checked only once
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to check"""
+        checked = set()
+        with self.batch_check:
+            for row in rows:
+                if row in checked:
+                    continue
+                checked.update(self.get_all_rows(row))
+                self.check_array(row)
+        row_ids = self.array_model.row_ids
+        self._dirty_ids.difference_update(row_ids[row] for row in checked)
+        if checked:
+            self.resizeColumnToContents(self.check_col)
+            self.estimate_rows(sorted(checked))
+            self.prefetch_rows(sorted(checked))
+
+    def update_other_items(self, rows):
+        """Updates the axes information of the other arrays that have the same
+        array name as the arrays in the given `rows`"""
+        if not self.prefer_list:
             return
-        arr_name = arr_item.text()
-        self.blockSignals(True)
-        for row in range(self.rowCount()):
-            if row != this_row:
-                arr_item2 = self.item(row, arr_col)
-                if arr_item2 is not None and arr_item2.text() == arr_name:
-                    self.item(row, axes_col).setText(item.text())
-        self.blockSignals(False)
+        model = self.array_model
+        arr_col = self.arr_col
+        axes_col = self.axes_col
+        axes = OrderedDict(
+            (model.text(row, arr_col), model.text(row, axes_col))
+            for row in rows)
+        values = {}
+        for row, arr_name in enumerate(model.column_texts(arr_col)):
+            if arr_name in axes:
+                values[row] = axes[arr_name]
+        model.set_values(axes_col, values)
 
     def get_all_rows(self, row):
         """Return all the rows that have the same array name as the given `row`
         """
-        def check_item(row):
-            item = self.item(row, arr_col)
-            return item is not None and item.text() == arr_name
-
         if self.plot_method is None or not self.plot_method._prefer_list:
             return [row]
-        arr_col = self.desc_cols.index(self.ARRAY_LABEL)
-        arr_name = self.item(row, arr_col).text()
-        return [r for r in range(self.rowCount()) if check_item(r)]
+        return self.array_model.rows_with(
+            self.arr_col, {self.array_model.text(row, self.arr_col)})
 
     def check_array(self, row, ignore_duplicates=[]):
         """check whether the array variables are valid, the array name is
         valid, the axes info is valid and the dimensions"""
         def set_check(row, valid, msg):
-            check_item = QTableWidgetItem()
-            check_item.setFlags(check_item.flags() ^ Qt.ItemIsEditable)
-            if valid:
-                check_item.setIcon(QIcon(get_icon('valid.png')))
-            elif valid is None:
-                check_item.setIcon(QIcon(get_icon('warning.png')))
-                check_item.setToolTip(msg)
-            else:
-                check_item.setIcon(QIcon(get_icon('invalid.png')))
-                check_item.setToolTip(msg)
-            self.setItem(row, check_col, check_item)
-            self.resizeColumnToContents(check_col)
+            model.set_check(row, valid, msg)
+            if not self.batch_check:
+                self.resizeColumnToContents(self.check_col)
 
-        check_col = self.desc_cols.index(self.CHECK_LABEL)
+        model = self.array_model
         valid = True
         msg = ''
 
@@ -968,8 +2174,7 @@ class ArrayTable(DragDropTable):
         # ----------------- check if a variable is provided -------------------
         # ---------------------------------------------------------------------
 
-        var_item = self.item(row, self.desc_cols.index(self.VARIABLE_LABEL))
-        if var_item is not None and not asstring(var_item.text()).strip():
+        if not asstring(model.text(row, self.var_col)).strip():
             valid = False
             msg = 'At least one variable name must be provided!'
 
@@ -977,16 +2182,14 @@ class ArrayTable(DragDropTable):
         # ----------------- check for duplicates of array names ---------------
         # ---------------------------------------------------------------------
 
-        arr_col = self.desc_cols.index(self.ARRAY_LABEL)
-        arr_item = self.item(row, arr_col)
-        if valid and arr_item is not None:
-            arr_name = arr_item.text()
+        if valid:
+            arr_name = asstring(model.text(row, self.arr_col))
             if arr_name not in ignore_duplicates:
                 if not arr_name:
                     msg = 'An array name must be provided'
                     valid = False
-                elif (len([name for name in self.current_names
-                          if name == arr_name]) > 1):
+                elif (not self.prefer_list and
+                      self.name_counts[arr_name] > 1):
                     valid = False
                     msg = "Found duplicated entry of '%s'" % arr_name
 
@@ -1012,38 +2215,234 @@ class ArrayTable(DragDropTable):
     def check_arrays(self, **kwargs):
         """Convenience function to check all arrays using the
         :meth:`check_array` method"""
-        return list(map(partial(self.check_array, **kwargs),
-                        range(self.rowCount())))
+        self._check_timer.stop()
+        self._dirty_ids.clear()
+        with self.batch_check:
+            ret = list(map(partial(self.check_array, **kwargs),
+                           range(self.rowCount())))
+        self.resizeColumnToContents(self.check_col)
+        self.estimate_rows(range(self.rowCount()))
+        self.prefetch_rows(range(self.rowCount()))
+        return ret
+
+    def _selections(self, row):
+        """Get the variables and the indexers that are plotted for a row
+
+        Returns
+        -------
+        list of tuple
+            For each variable of the row, the variable name and the indexers
+            including the defaults of the plot method (see
+            :meth:`psyplot.project._PlotterInterface.check_data`)"""
+        from psyplot.data import CFDecoder
+        ds = self.get_ds()
+        names = self._get_variables(row)
+        if isstring(names):
+            names = [names]
+        dims = self._get_dims(row)
+        pm = self.plot_method
+        if pm is None:
+            return [(name, dims) for name in names]
+        ret = []
+        for name in names:
+            var = ds[name]
+            var_dims = CFDecoder.get_decoder(ds, var).correct_dims(
+                var, dict(chain(six.iteritems(pm._default_dims),
+                                six.iteritems(dims))))
+            if pm._default_slice is not None:
+                for dim in var.dims:
+                    var_dims.setdefault(dim, pm._default_slice)
+            ret.append((name, var_dims))
+        return ret
+
+    def prefetch_rows(self, rows):
+        """Load the data of the valid `rows` in the background
+
+        The data is loaded by the :attr:`prefetcher` and used by
+        :meth:`fill_from_prefetch`. Previous requests of the rows that are
+        not needed anymore are cancelled.
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to prefetch"""
+        ds = self.get_ds()
+        if ds is None or self.prefetcher.max_bytes <= 0:
+            return
+        model = self.array_model
+        old = set()
+        for row in rows:
+            rid = model.row_ids[row]
+            old.update(self.prefetch_keys.pop(rid, []))
+            if not model.checks.get(rid, (False, ))[0]:
+                continue
+            try:
+                selections = self._selections(row)
+                # arrays of multiple variables are not prefetched
+                if len(selections) == 1:
+                    self.prefetch_keys[rid] = [
+                        self.prefetcher.request(ds, *selections[0])]
+            except Exception:
+                logger.debug('Could not prefetch row %s', row, exc_info=True)
+        self._cancel_prefetch(old)
+
+    def _cancel_prefetch(self, keys):
+        """Cancel the prefetching of the `keys` that are not used anymore"""
+        if keys:
+            keys = set(keys).difference(
+                chain.from_iterable(self.prefetch_keys.values()))
+            self.prefetcher.cancel(keys)
+
+    def _rows_about_to_be_removed(self, parent, first, last):
+        row_ids = self.array_model.row_ids
+        self._cancel_prefetch(list(chain.from_iterable(
+            self.prefetch_keys.pop(rid, []) for rid in
+            row_ids[first:last + 1])))
+        for rid in row_ids[first:last + 1]:
+            self.row_sizes.pop(rid, None)
+
+    def estimate_rows(self, rows):
+        """Estimate the memory and the I/O of the arrays in the given `rows`
+
+        The estimates are computed from the metadata of the dataset (see
+        :func:`psyplot_gui.datasets.estimate_bytes`), displayed in the size
+        column and stored in the :attr:`row_sizes`.
+
+        Parameters
+        ----------
+        rows: list of int
+            The rows to estimate"""
+        ds = self.get_ds()
+        if ds is None:
+            return
+        model = self.array_model
+        texts = {}
+        for row in rows:
+            rid = model.row_ids[row]
+            self.row_sizes.pop(rid, None)
+            try:
+                sizes = [estimate_bytes(ds, name, dims)
+                         for name, dims in self._selections(row)]
+            except Exception:
+                texts[row] = ''
+                continue
+            nbytes = sum(t[0] for t in sizes)
+            read = sum(t[1] for t in sizes)
+            self.row_sizes[rid] = (nbytes, read)
+            texts[row] = format_bytes(nbytes)
+            if read != nbytes:
+                texts[row] += ' (read %s)' % format_bytes(read)
+        model.set_values(self.size_col, texts)
+        self.sizes_changed.emit()
+
+    def fill_from_prefetch(self, project):
+        """Use the prefetched data for the arrays of a project
+
+        Parameters
+        ----------
+        project: psyplot.project.Project
+            The project that has been created from the :attr:`arr_names_dict`
+            of this table
+
+        Returns
+        -------
+        int
+            The number of arrays whose data has been taken from the
+            :attr:`prefetcher`"""
+        from psyplot.data import InteractiveList
+        model = self.array_model
+        ret = 0
+        for arr in project:
+            arrays = list(arr) if isinstance(arr, InteractiveList) else [arr]
+            rows = model.rows_with(self.arr_col, {arr.psy.arr_name})
+            if len(rows) != len(arrays):
+                continue
+            for row, sub in zip(rows, arrays):
+                keys = self.prefetch_keys.get(model.row_ids[row])
+                cached = self.prefetcher.get(keys[0]) if keys else None
+                if cached is not None and self._same_selection(cached, sub):
+                    sub.variable.data = cached.variable.data
+                    ret += 1
+        return ret
+
+    @staticmethod
+    def _same_selection(cached, arr):
+        """Check whether a prefetched array holds the data of `arr`
+
+        Parameters
+        ----------
+        cached: xarray.DataArray
+            The array from the :attr:`prefetcher`
+        arr: xarray.DataArray
+            The array that is plotted
+
+        Returns
+        -------
+        bool
+            True, if the dimensions, the shape and the dimension coordinates
+            of both arrays are the same"""
+        if cached.dims != arr.dims or cached.shape != arr.shape:
+            return False
+        for dim in arr.dims:
+            if (dim in cached.coords) != (dim in arr.coords):
+                return False
+            if dim in arr.coords and not np.array_equal(
+                    cached.coords[dim].values, arr.coords[dim].values):
+                return False
+        return True
 
     def _str2slice(self, s):
+        """Convert a string into an integer or a slice
+
+        Parameters
+        ----------
+        s: str
+            An integer (e.g. ``'1'``) or a slice (e.g. ``'1:6:2'``, where
+            start, stop and step are optional)
+
+        Returns
+        -------
+        int or slice or None
+            The index or None, if `s` is empty"""
         s = s.strip()
         if not s:
-            return []
+            return None
         s = s.split(':')
         if len(s) > 1:
-            return range(*map(int, s[:3]))
-        return [int(s[0])]
+            return slice(*(int(v) if v.strip() else None for v in s[:3]))
+        return int(s[0])
 
     def _get_dims(self, row):
+        """Get the indexers of the dimensions for a row
+
+        A single entry is kept as integer or slice, such that contiguous (and
+        strided) selections are read as one hyperslab. Multiple entries,
+        separated by a comma, are expanded into a list of integers"""
         start = len(self.desc_cols)
+        model = self.array_model
+        ds = None
         ret = {}
-        for dim, item in zip(self.dims,
-                             map(lambda col: self.item(row, col),
-                                 range(start, self.columnCount()))):
-            if item:
-                text = asstring(item.text())
-                if text:
-                    slices = list(
-                        chain(*map(self._str2slice, text.split(','))))
-                    if len(slices) == 1:
-                        slices = slices[0]
-                    ret[dim] = slices
+        for col, dim in enumerate(self.dims, start):
+            text = asstring(model.text(row, col))
+            if text:
+                slices = [sl for sl in map(self._str2slice, text.split(','))
+                          if sl is not None]
+                if not slices:
+                    continue
+                elif len(slices) == 1:
+                    ret[dim] = slices[0]
+                    continue
+                if ds is None:
+                    ds = self.get_ds()
+                n = ds.sizes[dim]
+                ret[dim] = list(chain.from_iterable(
+                    range(*sl.indices(n)) if isinstance(sl, slice) else [sl]
+                    for sl in slices))
         return ret
 
     def _get_variables(self, row):
-        var_col = self.desc_cols.index(self.VARIABLE_LABEL)
         ret = [s.strip() for s in asstring(
-                   self.item(row, var_col).text()).split(self.sep)]
+                   self.array_model.text(row, self.var_col)).split(self.sep)]
         ds = self.get_ds()
         for i, name in enumerate(ret):
             ret[i] = next(v for v in ds if asstring(v) == name)
@@ -1449,6 +2848,99 @@ class AxesCreator(QWidget):
                 for fig in figs)
 
 
+def create_axes_batch(specs, **kwargs):
+    """Create the axes for multiple arrays at once
+
+    This function gives the same axes as calling the
+    :meth:`SubplotCreator.create_subplot` or :meth:`AxesCreator.create_axes`
+    method for each specification, but every figure is looked up (or created)
+    only once, all subplots of one figure with the same geometry share one
+    gridspec and the docks of the new figures are laid out when all figures
+    have been created (see :func:`psyplot_gui.backend.batch_figures`).
+
+    Parameters
+    ----------
+    specs: list
+        For each array None or a tuple of the axes type (``'subplot'`` or
+        ``'axes'``) and the arguments for the
+        :meth:`SubplotCreator.create_subplot` or
+        :meth:`AxesCreator.create_axes` method (see
+        :meth:`ArrayTable.axes_info`)
+    ``**kwargs``
+        Any other keyword argument for the
+        :meth:`matplotlib.figure.Figure.add_subplot` and
+        :meth:`matplotlib.figure.Figure.add_axes` methods
+
+    Returns
+    -------
+    list
+        The axes (or None) for each of the `specs`"""
+    import matplotlib.pyplot as plt
+    from psyplot_gui.backend import batch_figures
+
+    def subplot_key(fig=None, rows=1, cols=1, num1=1, num2=None):
+        return rows, cols, num1 - 1, (num2 or num1) - 1
+
+    def axes_key(fig, x0, y0, x1, y1):
+        bbox = mpl.transforms.Bbox.from_extents(
+            x0, y0, max([x0, x1]), max([y0, y1]))
+        return tuple(np.round(bbox.get_points(), 5).ravel()), bbox
+
+    specs = list(specs)
+    ret = [None] * len(specs)
+    # group the specifications by figure
+    figs = OrderedDict()
+    for i, (axes_type, args) in enumerate(spec or (None, None)
+                                          for spec in specs):
+        if axes_type in ['subplot', 'axes']:
+            fig = args[0] if args else None
+            # every subplot without figure number gets its own figure
+            figs.setdefault(fig if fig else ('new', i), []).append(
+                (i, axes_type, args))
+    if not figs:
+        return ret
+    used = set(plt.get_fignums()).union(
+        fig for fig in figs if isinstance(fig, int))
+    free = (num for num in count(1) if num not in used)
+    with batch_figures():
+        for fig, items in figs.items():
+            if not isinstance(fig, mpl.figure.Figure):
+                fig = plt.figure(fig if isinstance(fig, int) else next(free))
+            # index the existing axes of the figure
+            subplots = {}
+            boxes = {}
+            for ax in fig.axes:
+                ss = getattr(ax, 'get_subplotspec', lambda: None)()
+                if ss is not None:
+                    num2 = ss.num1 if ss.num2 is None else ss.num2
+                    subplots.setdefault(
+                        ss.get_gridspec().get_geometry() + (ss.num1, num2),
+                        ax)
+                boxes.setdefault(tuple(np.round(
+                    ax.get_position().get_points(), 5).ravel()), ax)
+            grids = {}
+            for i, axes_type, args in items:
+                if axes_type == 'subplot':
+                    key = subplot_key(*args)
+                    ax = subplots.get(key)
+                    if ax is None:
+                        rows, cols, num1, num2 = key
+                        gs = grids.get((rows, cols))
+                        if gs is None:
+                            gs = grids[rows, cols] = mpl.gridspec.GridSpec(
+                                rows, cols)
+                        ax = subplots[key] = fig.add_subplot(
+                            mpl.gridspec.SubplotSpec(gs, num1, num2),
+                            **kwargs)
+                else:
+                    key, bbox = axes_key(*args)
+                    ax = boxes.get(key)
+                    if ax is None:
+                        ax = boxes[key] = fig.add_axes(bbox, **kwargs)
+                ret[i] = ax
+    return ret
+
+
 class AxesSelector(QWidget):
     """Widget to select an already created axes
 
@@ -1667,9 +3159,29 @@ class PlotCreator(QDialog):
         self.bt_open_file = QToolButton(parent=w)
         self.bt_open_file.setIcon(QIcon(get_icon('run_arrow.png')))
         self.bt_open_file.setToolTip('Open a new dataset from the hard disk')
+        self.bt_open_file.setPopupMode(QToolButton.MenuButtonPopup)
+        open_menu = QMenu(self.bt_open_file)
+        self.action_open_zarr = open_menu.addAction(
+            'Open zarr directory store...')
+        self.bt_open_file.setMenu(open_menu)
         self.bt_get_ds = LoadFromConsoleButton(xarray.Dataset, parent=w)
         self.bt_get_ds.setToolTip(
             'Use a dataset already defined in the console')
+        self.open_progress = QProgressBar(w)
+        self.open_progress.setVisible(False)
+        self.bt_cancel_open = QToolButton(parent=w)
+        self.bt_cancel_open.setIcon(QIcon(get_icon('invalid.png')))
+        self.bt_cancel_open.setToolTip('Cancel opening the dataset')
+        self.bt_cancel_open.setVisible(False)
+        self.region_selector = RegionSelector(w)
+        self.overview_selector = OverviewSelector(w)
+
+        #: The :class:`psyplot_gui.common.WorkerThread` that opens a dataset
+        self.open_worker = None
+
+        #: The :class:`psyplot_gui.common.WorkerThread` that loads the data
+        #: for the plots
+        self.load_worker = None
 
         self.pm_label = QLabel('Plot method: ', w)
         self.pm_combo = QComboBox(w)
@@ -1680,6 +3192,17 @@ class PlotCreator(QDialog):
 
         self.variables_table = VariablesTable(self.get_ds, parent=w)
         self.variables_table.fill_from_ds()
+        self.variables_filter = QLineEdit(w)
+        self.variables_filter.setPlaceholderText('Filter variables')
+        self.variables_filter.setToolTip(
+            'Only show the variables whose name or long_name contains this '
+            'text')
+        self.cbox_thumbnails = QCheckBox('previews', w)
+        self.cbox_thumbnails.setToolTip(
+            'Show quick-look thumbnails of the variables. They are rendered '
+            'in the background from a coarse slice of each variable')
+        self.cbox_thumbnails.setChecked(rcParams['plotcreator.thumbnails'])
+        self.variables_table.set_thumbnails(self.cbox_thumbnails.isChecked())
 
         self.coords_table = CoordsTable(self.get_ds, parent=w)
         self.coords_table.fill_from_ds()
@@ -1690,8 +3213,14 @@ class PlotCreator(QDialog):
         self.cbox_load = QCheckBox('load')
         self.cbox_load.setToolTip(
             'Load the selected data arrays into memory when clicking on '
-            '<em>Ok</em>. Note that this might cause problems for large '
-            'arrays!')
+            '<em>Ok</em>. The arrays are loaded in parallel. The plots '
+            'cannot be created if the estimated size of the arrays exceeds '
+            'the available memory')
+
+        self.size_label = QLabel(w)
+        self.size_label.setToolTip(
+            'The estimated memory of the arrays and the bytes that are read '
+            'from the disk')
 
         self.cbox_close_popups = QCheckBox('close dropdowns', w)
         self.cbox_close_popups.setChecked(True)
@@ -1714,7 +3243,7 @@ class PlotCreator(QDialog):
         self.bt_add_all = QToolButton(w)
         self.bt_add_all.setIcon(QIcon(get_icon('plusplus.png')))
         self.bt_add_all.setToolTip(
-            'Add arrays for all variables in the dataset')
+            'Add arrays for all displayed variables in the dataset')
 
         self.rows_axis_label = QLabel('No. of rows', w)
         self.rows_axis_edit = QLineEdit(w)
@@ -1756,11 +3285,19 @@ class PlotCreator(QDialog):
 
         # ----------------- dataset combo connections ------------------------
         self.bt_open_file.clicked.connect(lambda: self.open_dataset())
+        self.action_open_zarr.triggered.connect(lambda: self.open_zarr())
+        self.region_selector.bt_apply.clicked.connect(
+            lambda: self.subset_ds())
+        self.overview_selector.bt_apply.clicked.connect(
+            lambda: self.overview_ds())
+        self.bt_cancel_open.clicked.connect(self.cancel_open)
         self.bt_get_ds.object_loaded.connect(self.add_new_ds)
         self.ds_combo.currentIndexChanged[int].connect(self.set_ds)
 
         self.ds_combo.currentIndexChanged[int].connect(
             lambda i: self.variables_table.fill_from_ds())
+        self.ds_combo.currentIndexChanged[int].connect(
+            lambda i: self.variables_filter.clear())
         self.ds_combo.currentIndexChanged[int].connect(
             lambda i: self.coords_table.fill_from_ds())
         self.ds_combo.currentIndexChanged[int].connect(
@@ -1769,6 +3306,9 @@ class PlotCreator(QDialog):
             lambda i: self.connect_combo_boxes())
 
         # ------------------- plot method connections -------------------------
+        # rechunk the dataset before the arrays are checked and prefetched
+        self.pm_combo.currentIndexChanged[str].connect(
+            lambda s: self.rechunk_ds())
         self.pm_combo.currentIndexChanged[str].connect(
             lambda s: self.pm_combo.setToolTip(
                 getattr(psy.plot, s)._summary) if s else self.NO_PM_TT)
@@ -1788,7 +3328,7 @@ class PlotCreator(QDialog):
             variables=self.variables_table.selected_variables))
         self.bt_add_all.clicked.connect(
             lambda b: self.insert_array(
-                variables=self.variables_table.variables))
+                variables=self.variables_table.filtered_variables))
         self.bt_remove_all.clicked.connect(
             lambda b: self.array_table.remove_arrays(False))
         self.bt_remove.clicked.connect(
@@ -1808,6 +3348,12 @@ class PlotCreator(QDialog):
                                             QDialogButtonBox.Cancel)
         bbox.accepted.connect(self.create_plots)
         bbox.rejected.connect(self.reject)
+        self.bt_save_recipe = bbox.addButton('Save recipe',
+                                             QDialogButtonBox.ActionRole)
+        self.bt_save_recipe.setToolTip(
+            'Save the arrays, the plot method, the formatoptions and the axes '
+            'as a recipe to create the same plots for other files')
+        self.bt_save_recipe.clicked.connect(lambda: self.save_recipe())
 
         # -------------------- other connections ------------------------------
         # allow only to select either variables or newly created arrays in
@@ -1817,6 +3363,12 @@ class PlotCreator(QDialog):
             self.variables_table.clearSelection)
         self.variables_table.itemSelectionChanged.connect(
             self.array_table.clearSelection)
+        self.variables_filter.textChanged.connect(
+            self.variables_table.set_filter)
+        self.cbox_thumbnails.toggled.connect(
+            self.variables_table.set_thumbnails)
+        self.array_table.sizes_changed.connect(self.update_size_estimate)
+        self.cbox_load.toggled.connect(self.update_size_estimate)
 
         # ---------------------------------------------------------------------
         # ---------------------------- layouts --------------------------------
@@ -1826,6 +3378,8 @@ class PlotCreator(QDialog):
         self.ds_box.addWidget(self.ds_combo)
         self.ds_box.addWidget(self.bt_open_file)
         self.ds_box.addWidget(self.bt_get_ds)
+        self.ds_box.addWidget(self.open_progress)
+        self.ds_box.addWidget(self.bt_cancel_open)
 
         self.pm_box = QHBoxLayout()
         self.pm_box.addStretch(0)
@@ -1835,6 +3389,7 @@ class PlotCreator(QDialog):
 
         self.tree_box = QHBoxLayout()
         self.tree_box.addStretch(0)
+        self.tree_box.addWidget(self.size_label)
         self.tree_box.addWidget(self.cbox_load)
         self.tree_box.addWidget(self.cbox_close_popups)
         self.tree_box.addWidget(self.cbox_use_coords)
@@ -1859,8 +3414,15 @@ class PlotCreator(QDialog):
 
         self.vbox = QVBoxLayout()
         self.vbox.addLayout(self.ds_box)
+        self.vbox.addWidget(self.region_selector)
+        self.vbox.addWidget(self.overview_selector)
         self.vbox.addLayout(self.pm_box)
         self.vbox.addLayout(self.tree_box)
+        self.filter_box = QHBoxLayout()
+        self.filter_box.addWidget(self.variables_filter)
+        self.filter_box.addWidget(self.cbox_thumbnails)
+
+        self.vbox.addLayout(self.filter_box)
         self.vbox.addWidget(self.variables_table)
         self.vbox.addWidget(self.coords_table)
         self.vbox.addWidget(self.array_table)
@@ -1986,9 +3548,19 @@ class PlotCreator(QDialog):
             pm = self.open_data
             kwargs = {}
         fig_nums = plt.get_fignums()[:]
+        load = self.cbox_load.isChecked()
+        # use the data that has been prefetched by the array table
+        prefetched = bool(self.array_table.prefetch_keys)
+        delay_plot = (load or prefetched) and pm is not self.open_data
+        if delay_plot:
+            # create the plots without the data, fill in the (prefetched or
+            # loaded) data and make the plots afterwards
+            kwargs['make_plot'] = False
+            kwargs['draw'] = False
         try:
-            pm(self.ds, arr_names=names, load=self.cbox_load.isChecked(),
-               **kwargs)
+            sp = pm(self.ds, arr_names=names, **kwargs)
+            if prefetched:
+                self.array_table.fill_from_prefetch(sp)
         except Exception:
             for num in set(plt.get_fignums()).difference(fig_nums):
                 plt.close(num)
@@ -1996,23 +3568,178 @@ class PlotCreator(QDialog):
             logger.debug('Error while creating the plots with %s!',
                          names, exc_info=True)
         else:
-            self.close()
+            if load:
+                self.load_arrays(sp, fig_nums)
+            elif not delay_plot or self._make_plots(sp, fig_nums):
+                self.close()
+
+    def _make_plots(self, sp, fig_nums):
+        """Make the plots of a project that has been created without plotting
+
+        Returns
+        -------
+        bool
+            True, if the plots have been made, False if an error occured and
+            the new figures have been closed"""
+        try:
+            for plotter in sp.plotters:
+                plotter.reinit(draw=False)
+        except Exception:
+            self._close_new_figures(sp, fig_nums)
+            self.error_msg.showTraceback('<b>Failed to create the plots!</b>')
+            return False
+        if psy.rcParams['auto_draw']:
+            sp.draw()
+        return True
+
+    def load_arrays(self, sp, fig_nums=[]):
+        """Load the data of a project in parallel and make the plots
+
+        The data is loaded in a :class:`~psyplot_gui.common.WorkerThread` (see
+        :func:`psyplot_gui.datasets.load_arrays`) and the progress is shown
+        in the status bar of the main window. Cancelling the job closes the
+        figures that have been created for the project.
+
+        Parameters
+        ----------
+        sp: psyplot.project.Project
+            The project whose arrays to load and plot
+        fig_nums: list of int
+            The numbers of the figures that existed before the project has
+            been created
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread
+            The worker that loads the data"""
+        if self.load_worker is not None and self.load_worker.isRunning():
+            self.error_msg.showMessage(
+                'Please wait until the current data has been loaded!')
+            return
+
+        def job(worker):
+            return load_arrays(list(sp), progress=worker.report_progress)
+
+        def finished(arrays):
+            self._show_status('')
+            if self._make_plots(sp, fig_nums):
+                self.close()
+
+        def failed(exc_info):
+            self._close_new_figures(sp, fig_nums)
+            self._show_status('')
+            self.error_msg.showTraceback(
+                '<b>Failed to load the data!</b>', exc_info=exc_info)
+
+        def cancelled():
+            self._close_new_figures(sp, fig_nums)
+            self._show_status('Loading the data has been cancelled', 5000)
+
+        self.load_worker = worker = WorkerThread(job)
+        worker.progress_changed.connect(self._update_load_progress)
+        for signal in [worker.result_ready, worker.job_cancelled,
+                       worker.job_error]:
+            signal.connect(self._load_finished)
+        worker.result_ready.connect(finished)
+        worker.job_error.connect(failed)
+        worker.job_cancelled.connect(cancelled)
+        self.bbox.button(QDialogButtonBox.Ok).setEnabled(False)
+        self._show_status('Loading the data...')
+        worker.run_job()
+        return worker
+
+    def cancel_load(self):
+        """Cancel loading the data for the plots"""
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+
+    def _close_new_figures(self, sp, fig_nums):
+        """Remove the arrays of `sp` and close the figures that are new"""
+        import matplotlib.pyplot as plt
+        try:
+            sp.close(figs=True, data=True, ds=False)
+        except Exception:
+            logger.debug('Could not close the project', exc_info=True)
+        for num in set(plt.get_fignums()).difference(fig_nums):
+            plt.close(num)
+
+    def _show_status(self, msg, timeout=0):
+        from psyplot_gui.main import mainwindow
+        if mainwindow is not None:
+            mainwindow.statusBar().showMessage(msg, timeout)
+
+    def _update_load_progress(self, i, n):
+        self._show_status('Loading the data... %i/%i tasks' % (i, n))
+
+    def _load_finished(self, *args):
+        self.bbox.button(QDialogButtonBox.Ok).setEnabled(True)
+        self.update_size_estimate()
+
+    def update_size_estimate(self):
+        """Update the total size of the arrays in the :attr:`size_label`
+
+        If the arrays need more memory than available, a warning is shown
+        and, if the `load` option is checked, the plots cannot be created"""
+        nbytes, read = self.array_table.total_bytes
+        available = available_memory()
+        too_large = available is not None and nbytes > available
+        if not nbytes:
+            text = ''
+        else:
+            text = 'Total: ' + format_bytes(nbytes)
+            if read != nbytes:
+                text += ' (read %s)' % format_bytes(read)
+            if too_large:
+                text = '<font color="red">%s, available: %s</font>' % (
+                    text, format_bytes(available))
+        self.size_label.setText(text)
+        loading = self.load_worker is not None and \
+            self.load_worker.isRunning()
+        self.bbox.button(QDialogButtonBox.Ok).setEnabled(
+            not loading and not (too_large and self.cbox_load.isChecked()))
+
+    def reject(self):
+        """Reimplemented to cancel the loading of the data first"""
+        if self.load_worker is not None and self.load_worker.isRunning():
+            self.cancel_load()
+        else:
+            super(PlotCreator, self).reject()
 
     def open_dataset(self, fnames=None, *args, **kwargs):
-        """Opens a file dialog and the dataset that has been inserted"""
+        """Opens a file dialog and the dataset that has been inserted
 
-        def open_ds():
-            if len(fnames) == 1:
-                kwargs.pop('concat_dim', None)
-                return psy.open_dataset(fnames[0], *args, **kwargs)
-            else:
-                return psy.open_mfdataset(fnames, *args, **kwargs)
+        The files are opened in a :class:`~psyplot_gui.common.WorkerThread`
+        (see :func:`psyplot_gui.datasets.open_dataset`) and the progress is
+        shown next to the dataset combobox.
+
+        Parameters
+        ----------
+        fnames: list of str or xarray.Dataset
+            The files or zarr stores to open (see
+            :func:`psyplot_gui.datasets.is_zarr`). If None, a file dialog is
+            opened
+        on_open: callable
+            A function that is called with the new dataset after it has been
+            added to the :attr:`ds_combo`
+        ``*args, **kwargs``
+            Any other argument for the
+            :func:`psyplot_gui.datasets.open_dataset` function. If not
+            specified, the `overview` is taken from the
+            :attr:`overview_selector`
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that opens the dataset or None, if no files are opened
+        """
+        on_open = kwargs.pop('on_open', None)
 
         if fnames is None:
             fnames = QFileDialog.getOpenFileNames(
                 self, 'Open dataset', os.getcwd(),
                 'NetCDF files (*.nc *.nc4);;'
                 'Shape files (*.shp);;'
+                'Zarr zip stores (*.zarr.zip *.zip);;'
                 'All files (*)'
                 )
             if with_qt5:  # the filter is passed as well
@@ -2020,30 +3747,219 @@ class PlotCreator(QDialog):
         if isinstance(fnames, xarray.Dataset):
             ds = fnames
             self.add_new_ds('ds', ds)
+            if on_open is not None:
+                on_open(ds)
+            return
         elif not fnames:
             return
-        else:
-            try:
-                ds = open_ds()
-            except Exception:
-                kwargs['decode_times'] = False
-                try:
-                    ds = open_ds()
-                except Exception:
-                    self.error_msg.showTraceback(
-                        '<b>Could not open dataset %s</b>' % (fnames, ))
-                    return
-            fnames_str = ', '.join(fnames)
+        elif self.open_worker is not None and self.open_worker.isRunning():
+            self.error_msg.showMessage(
+                'Please wait until the current dataset has been opened!')
+            return
+        fnames = list(fnames)
+        fnames_str = ', '.join(fnames)
+        kwargs.setdefault('overview', self.overview_selector.settings)
+
+        def job(worker):
+            return open_dataset(fnames, *args,
+                                progress=worker.report_progress, **kwargs)
+
+        def finished(ds):
             self.add_new_ds(fnames_str, ds, fnames_str)
+            if on_open is not None:
+                on_open(self.get_ds())
+
+        self.open_worker = worker = WorkerThread(job)
+        worker.progress_changed.connect(self._update_open_progress)
+        for signal in [worker.result_ready, worker.job_cancelled,
+                       worker.job_error]:
+            signal.connect(self._open_finished)
+        worker.result_ready.connect(finished)
+        worker.job_error.connect(partial(
+            self.error_msg.showTraceback,
+            '<b>Could not open dataset %s</b>' % (fnames, )))
+        self.bt_open_file.setEnabled(False)
+        self.open_progress.setRange(0, 0)
+        self.open_progress.setVisible(True)
+        self.bt_cancel_open.setVisible(True)
+        worker.run_job()
+        return worker
+
+    def open_zarr(self, *args, **kwargs):
+        """Open a zarr directory store
+
+        Since zarr stores are directories, they cannot be selected in the file
+        dialog of the :meth:`open_dataset` method. Instead, a directory dialog
+        is opened here
+
+        Parameters
+        ----------
+        ``*args, **kwargs``
+            Any other argument for the :meth:`open_dataset` method
+
+        Returns
+        -------
+        psyplot_gui.common.WorkerThread or None
+            The worker that opens the dataset or None, if no store has been
+            selected"""
+        dirname = QFileDialog.getExistingDirectory(
+            self, 'Open zarr store', os.getcwd())
+        if not dirname:
+            return
+        return self.open_dataset([dirname], *args, **kwargs)
+
+    def cancel_open(self):
+        """Cancel opening the current dataset"""
+        if self.open_worker is not None:
+            self.open_worker.cancel()
+
+    def _update_open_progress(self, i, n):
+        self.open_progress.setRange(0, n)
+        self.open_progress.setValue(i)
+
+    def _open_finished(self, *args):
+        self.bt_open_file.setEnabled(True)
+        self.open_progress.setVisible(False)
+        self.bt_cancel_open.setVisible(False)
 
-    def add_new_ds(self, oname, ds, fname=None):
-        d = {'ds': ds}
+    def add_new_ds(self, oname, ds, fname=None, rechunk=None):
+        """Add a new dataset to the :attr:`ds_combo`
+
+        Parameters
+        ----------
+        oname: str
+            The name to display
+        ds: xarray.Dataset
+            The dataset
+        fname: str
+            The path to the file(s) of `ds`
+        rechunk: bool
+            Whether the dataset may be rechunked for the current plot method
+            (see :meth:`rechunk_ds`). If None, only datasets with an `fname`
+            are rechunked, datasets from the console are kept"""
+        d = {'ds': ds, 'rechunk': bool(fname) if rechunk is None else rechunk}
         if fname:
             d['fname'] = fname
         self.ds_descs.insert(0, d)
+        self.rechunk_ds(0)
         self.ds_combo.insertItem(0, 'New: ' + oname)
         self.ds_combo.setCurrentIndex(0)
 
+    def rechunk_ds(self, i=None):
+        """Rechunk a new dataset for the access pattern of the plot method
+
+        Every chunk then contains the data of one plot (see
+        :func:`psyplot_gui.datasets.infer_chunks`). This is only done for
+        datasets that have been opened in the plot creator and if the
+        ``'plotcreator.auto_chunk'`` item of the
+        :attr:`~psyplot_gui.config.rcsetup.rcParams` is True
+
+        Parameters
+        ----------
+        i: int
+            The index of the dataset in the :attr:`ds_descs`. If None, the
+            current dataset is used
+
+        Returns
+        -------
+        xarray.Dataset or None
+            The rechunked dataset or None, if it has not been rechunked"""
+        if i is None:
+            i = self.ds_combo.currentIndex()
+        pm = getattr(psy.plot, asstring(self.pm_combo.currentText()), None)
+        if (pm is None or not rcParams['plotcreator.auto_chunk'] or
+                not 0 <= i < len(self.ds_descs) or
+                not self.ds_descs[i].get('rechunk')):
+            return
+        desc = self.ds_descs[i]
+        # always start from the original dataset to not stack the rechunking
+        # of multiple plot methods
+        try:
+            ds = rechunk_for_plot(desc.setdefault('orig', desc['ds']), pm)
+        except Exception:
+            logger.debug('Could not rechunk the dataset', exc_info=True)
+            return
+        desc['ds'] = ds
+        if i == self.ds_combo.currentIndex():
+            self.ds = ds
+        return ds
+
+    def subset_ds(self, bounds=None):
+        """Select a region of interest from the current dataset
+
+        The subset is added as a new dataset to the :attr:`ds_combo`
+
+        Parameters
+        ----------
+        bounds: dict
+            The bounds of the region (see
+            :func:`psyplot_gui.datasets.roi_indexers`). If None, the bounds of
+            the :attr:`region_selector` are used
+
+        Returns
+        -------
+        xarray.Dataset or None
+            The subset or None, if no region has been selected"""
+        if bounds is None:
+            bounds = self.region_selector.bounds
+        if not bounds:
+            return
+        return self._derive_ds(
+            partial(subset_dataset, bounds=bounds), ', '.join(
+                '%s=%s:%s' % (coord, '' if start is None else start,
+                              '' if stop is None else stop)
+                for coord, (start, stop) in six.iteritems(bounds)),
+            'Could not select the region!')
+
+    def overview_ds(self, settings=None):
+        """Create a coarsened overview of the current dataset
+
+        The overview is added as a new dataset to the :attr:`ds_combo`
+
+        Parameters
+        ----------
+        settings: dict
+            The keyword arguments for the
+            :func:`psyplot_gui.datasets.coarsen_dataset` function. If None,
+            the settings of the :attr:`overview_selector` are used
+
+        Returns
+        -------
+        xarray.Dataset or None
+            The overview or None, if no reduction has been selected"""
+        if settings is None:
+            settings = self.overview_selector.settings
+        if not settings:
+            return
+        return self._derive_ds(
+            partial(coarsen_dataset, **settings),
+            'overview: ' + settings.get('how', 'mean'),
+            'Could not create the overview!')
+
+    def _derive_ds(self, func, label, error):
+        """Add a dataset that is derived from the current one
+
+        Parameters
+        ----------
+        func: callable
+            The function that creates the new dataset from the current one
+        label: str
+            The label that is appended to the name of the current dataset
+        error: str
+            The message if `func` fails"""
+        ds = self.get_ds()
+        if ds is None:
+            return
+        try:
+            ds = func(ds)
+        except Exception:
+            self.error_msg.showTraceback('<b>%s</b>' % error)
+            return
+        desc = self.ds_descs[self.ds_combo.currentIndex()]
+        fname = desc.get('fname') or asstring(self.ds_combo.currentText())
+        self.add_new_ds('%s [%s]' % (fname, label), ds, rechunk=True)
+        return self.get_ds()
+
     def set_ds(self, i):
         """Set the current dataset"""
         self.ds = self.ds_descs[i]['ds']
@@ -2053,8 +3969,7 @@ class PlotCreator(QDialog):
         """
         self.ds_combo.clear()
         self.ds_combo.setInsertPolicy(QComboBox.InsertAtBottom)
-        ds_descs = project._get_ds_descriptions(
-            project.array_info(ds_description='all'))
+        ds_descs = dataset_registry.descriptions(project)
         self.ds_combo.addItems(
             ['%i: %s' % (i, ds_desc['fname']) for i, ds_desc in six.iteritems(
                 ds_descs)])
@@ -2077,17 +3992,25 @@ class PlotCreator(QDialog):
             for ind in cb.view().selectionModel().selectedIndexes()
             if ind.row() > 0)
         dims.pop(dim)
+        names = []
+        all_dims = []
         for name, val in product(variables, inserts):
-            dims[dim] = val
-            self.array_table.insert_array(name, check=False, **dims)
+            names.append(name)
+            all_dims.append(dims.copy())
+            all_dims[-1][dim] = val
+        atab = self.array_table
+        nrows = atab.rowCount()
+        atab.insert_arrays(names, all_dims, check=False)
         if len(inserts) > 1:
             inserts = '%s:%s' % (min(inserts), max(inserts))
         elif inserts:
             inserts = inserts[0]
         else:
             return
-        self.array_table.update_selected(check=False, dims={dim: inserts})
-        self.array_table.check_arrays()
+        atab.update_selected(check=False, dims={dim: inserts})
+        # check the new and the updated rows only once
+        irows = {index.row() for index in atab.selectedIndexes()}
+        atab.check_rows(sorted(irows.union(range(nrows, atab.rowCount()))))
 
     def insert_array(self, variables=None):
         """Inserts an array for the given variables (or the ones selected in
@@ -2099,9 +4022,7 @@ class PlotCreator(QDialog):
         for other_cb in self.coords_table.combo_boxes:
             ind = other_cb.currentIndex()
             dims[other_cb.dim] = str((ind - 1) if ind not in [-1, 0] else '')
-        for name in variables:
-            self.array_table.insert_array(name, check=False, **dims)
-        self.array_table.check_arrays()
+        self.array_table.insert_arrays(variables, dims)
 
     def get_ds(self, i=None):
         """Get the dataset
@@ -2125,16 +4046,77 @@ class PlotCreator(QDialog):
 
     def close(self, *args, **kwargs):
         """Reimplemented to make sure that the data sets are deleted"""
+        for worker in [self.open_worker, self.load_worker]:
+            if worker is not None and worker.isRunning():
+                worker.cancel()
+                worker.wait()
+        self.variables_table.variables_model.shutdown()
+        self.array_table.prefetcher.shutdown()
         super(PlotCreator, self).close(*args, **kwargs)
         if hasattr(self, 'ds_descs'):
             del self.ds_descs
 
+    def get_recipe(self):
+        """Get the current settings as a recipe
+
+        Returns
+        -------
+        dict
+            The recipe with the plot method, the arrays (including their axes)
+            and the formatoptions (see the :mod:`psyplot_gui.recipes` module)
+        """
+        from psyplot_gui.recipes import encode_dims
+        atab = self.array_table
+        model = atab.array_model
+        axes = dict(zip(model.column_texts(atab.arr_col),
+                        model.column_texts(atab.axes_col)))
+        arrays = []
+        for arr_name, d in six.iteritems(atab.arr_names_dict):
+            d = dict(d)
+            name = d.pop('name')
+            axes_type, args = atab.axes_info(axes.get(arr_name, ''))
+            arrays.append({'arr_name': asstring(arr_name), 'name': name,
+                           'dims': encode_dims(d),
+                           'axes': [axes_type, args] if axes_type else None})
+        pm = asstring(self.pm_combo.currentText()) or None
+        return {'plot_method': pm, 'arrays': arrays,
+                'fmt': dict(self.fmt_tree.changed_rc()) if pm else {}}
+
+    def save_recipe(self, fname=None):
+        """Save the current settings as a recipe
+
+        Parameters
+        ----------
+        fname: str
+            The path of the yaml file. If None, a file dialog is opened
+
+        See Also
+        --------
+        get_recipe, psyplot_gui.recipes.batch_export"""
+        from psyplot_gui.recipes import save_recipe
+        if fname is None:
+            fname = QFileDialog.getSaveFileName(
+                self, 'Save recipe', os.getcwd(),
+                'YAML files (*.yml *.yaml);;'
+                'All files (*)'
+                )
+            if with_qt5:  # the filter is passed as well
+                fname = fname[0]
+        if not fname:
+            return
+        try:
+            save_recipe(self.get_recipe(), fname)
+        except Exception:
+            self.error_msg.showTraceback(
+                '<b>Could not save the recipe!</b>')
+
     def open_data(self, *args, **kwargs):
         """Convenience method to create a sub project without a plotter
 
         This method is used when the :attr:`pm_combo` is empty"""
         p = psy.Project.from_dataset(*args, main=psy.gcp(True), **kwargs)
         psy.scp(p)
+        return p
 
     def switch2ds(self, ds):
         """Switch to the given dataset
@@ -0,0 +1,299 @@
+"""Recipes to create the same plots for multiple datasets
+
+A recipe describes the arrays, the plot method, the formatoptions and the
+axes layout that have been set up in the
+:class:`~psyplot_gui.plot_creator.PlotCreator` (see
+:meth:`~psyplot_gui.plot_creator.PlotCreator.get_recipe`). It is stored as a
+yaml file and can be applied to other files without the graphical user
+interface, e.g. via::
+
+    $ psyplot run1.nc run2.nc -o '{stem}.pdf' -recipe recipe.yml
+
+The files are then processed in parallel by a pool of processes (see
+:func:`batch_export`)."""
+import os
+import os.path as osp
+import logging
+import six
+from psyplot.compat.pycompat import OrderedDict
+from psyplot_gui.config.rcsetup import rcParams
+
+
+logger = logging.getLogger(__name__)
+
+
+def encode_dims(dims):
+    """Convert the indexers of an array into a yaml compatible format
+
+    Slices are converted to strings like ``'start:stop:step'``
+
+    Parameters
+    ----------
+    dims: dict
+        A mapping from dimension to an integer, a slice or a list of them
+
+    Returns
+    -------
+    dict
+        The encoded `dims`
+
+    See Also
+    --------
+    decode_dims: The inverse function"""
+    def encode(val):
+        if isinstance(val, slice):
+            return ':'.join('' if v is None else str(v)
+                            for v in [val.start, val.stop, val.step])
+        elif isinstance(val, (list, tuple, range)):
+            return list(map(encode, val))
+        return int(val)
+    return {dim: encode(val) for dim, val in six.iteritems(dims)}
+
+
+def decode_dims(dims):
+    """Convert the indexers from :func:`encode_dims` back into slices
+
+    Parameters
+    ----------
+    dims: dict
+        The encoded indexers
+
+    Returns
+    -------
+    dict
+        A mapping from dimension to an integer, a slice or a list of them"""
+    def decode(val):
+        if isinstance(val, six.string_types):
+            return slice(*(int(v) if v.strip() else None
+                           for v in val.split(':')))
+        elif isinstance(val, list):
+            return list(map(decode, val))
+        return val
+    return {dim: decode(val) for dim, val in six.iteritems(dims)}
+
+
+def save_recipe(recipe, fname):
+    """Save a recipe to a yaml file
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe (see
+        :meth:`psyplot_gui.plot_creator.PlotCreator.get_recipe`)
+    fname: str
+        The path of the yaml file"""
+    import yaml
+    with open(fname, 'w') as f:
+        yaml.safe_dump(recipe, f, default_flow_style=False)
+
+
+def load_recipe(fname):
+    """Load a recipe from a yaml file
+
+    Parameters
+    ----------
+    fname: str
+        The path of the yaml file
+
+    Returns
+    -------
+    dict
+        The recipe"""
+    import yaml
+    with open(fname) as f:
+        return yaml.safe_load(f)
+
+
+def create_axes(axes, projection=None):
+    """Create the axes of a recipe
+
+    Parameters
+    ----------
+    axes: list
+        For each array ``None`` or a tuple of the axes type (``'subplot'`` or
+        ``'axes'``) and the arguments for the
+        :meth:`~psyplot_gui.plot_creator.SubplotCreator.create_subplot` or
+        :meth:`~psyplot_gui.plot_creator.AxesCreator.create_axes` method.
+        The axes are created with the
+        :func:`~psyplot_gui.plot_creator.create_axes_batch` function
+    projection: object
+        The projection for the axes
+
+    Returns
+    -------
+    list
+        The created axes (or None)"""
+    from psyplot_gui.plot_creator import create_axes_batch
+    kwargs = {} if projection is None else {'projection': projection}
+    return create_axes_batch(axes, **kwargs)
+
+
+def apply_recipe(recipe, ds, **kwargs):
+    """Create the plots of a recipe for a dataset
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe (see
+        :meth:`psyplot_gui.plot_creator.PlotCreator.get_recipe`)
+    ds: xarray.Dataset
+        The dataset to plot
+    ``**kwargs``
+        Any other keyword argument for the plot method
+
+    Returns
+    -------
+    psyplot.project.Project
+        The new project"""
+    import psyplot.project as psy
+    arrays = recipe['arrays']
+    arr_names = OrderedDict()
+    for d in arrays:
+        arr_names[d['arr_name']] = dims = decode_dims(d.get('dims', {}))
+        dims['name'] = d['name']
+    pm = recipe.get('plot_method')
+    if not pm:
+        kwargs.pop('draw', None)
+        return psy.Project.from_dataset(ds, arr_names=arr_names, **kwargs)
+    pm = getattr(psy.plot, pm)
+    for dims in arr_names.values():
+        for dim, val in six.iteritems(pm._default_dims):
+            dims.setdefault(dim, val)
+    axes = [d.get('axes') for d in arrays]
+    if any(axes):
+        kwargs.setdefault('ax', create_axes(
+            axes, pm.plotter_cls._get_sample_projection()))
+    kwargs.setdefault('fmt', recipe.get('fmt') or {})
+    return pm(ds, arr_names=arr_names, **kwargs)
+
+
+def output_name(output, fname, i=0):
+    """Get the name of the exported file for an input file
+
+    Parameters
+    ----------
+    output: str
+        The pattern for the output file. ``'{stem}'`` is replaced by the
+        basename of `fname` without extension and ``'{i}'`` by `i`
+    fname: str
+        The path to the input file
+    i: int
+        The number of the input file
+
+    Returns
+    -------
+    str
+        The path to the output file"""
+    stem = osp.splitext(osp.basename(fname.split(',')[0]))[0]
+    return output.replace('{stem}', stem).replace('{i}', str(i))
+
+
+def export_recipe(recipe, fname, output, engine=None, **kwargs):
+    """Apply a recipe to one file and export the figures
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe (see :func:`load_recipe`)
+    fname: str
+        The path to the file. Multiple files of one dataset can be separated
+        by a comma
+    output: str
+        The path to the output file (see
+        :meth:`psyplot.project.Project.export`)
+    engine: str
+        The engine to open the dataset
+    ``**kwargs``
+        Any other keyword argument for the
+        :func:`psyplot_gui.datasets.open_dataset` function
+
+    Returns
+    -------
+    str
+        The `output`"""
+    from psyplot_gui.datasets import open_dataset
+    if not recipe.get('plot_method'):
+        raise ValueError('The recipe does not define a plot method!')
+    ds = open_dataset(fname.split(','), engine=engine, **kwargs)
+    sp = apply_recipe(recipe, ds, draw=False)
+    try:
+        sp.export(output)
+    finally:
+        sp.close(True, True, True)
+    return output
+
+
+def _export_in_worker(*args, **kwargs):
+    """Call :func:`export_recipe` in a process of the :func:`batch_export`
+    pool with the non-interactive Agg backend"""
+    import matplotlib as mpl
+    mpl.use('Agg')
+    return export_recipe(*args, **kwargs)
+
+
+def batch_export(recipe, fnames, output, processes=None, progress=None,
+                 **kwargs):
+    """Apply a recipe to multiple files in a pool of processes
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe (see :func:`load_recipe`)
+    fnames: list of str
+        The files to plot. Every file is plotted separately
+    output: str
+        The pattern for the output files (see :func:`output_name`). If it
+        does not contain ``'{stem}'`` or ``'{i}'`` and multiple files are
+        given, ``'-{stem}'`` is inserted before the extension
+    processes: int
+        The number of processes. If None, the ``'main.batch_processes'`` item
+        of the :attr:`~psyplot_gui.config.rcsetup.rcParams` is used and if
+        this is 0, the number of CPUs. If 1, the files are exported in the
+        current process
+    progress: callable
+        A function that is called with the number of exported files and the
+        total number of files
+    ``**kwargs``
+        Any other keyword argument for the :func:`export_recipe` function
+
+    Returns
+    -------
+    list of str
+        The paths of the exported files
+
+    Raises
+    ------
+    ValueError
+        If multiple files would be exported to the same output file"""
+    fnames = list(fnames)
+    n = len(fnames)
+    if n > 1 and '{stem}' not in output and '{i}' not in output:
+        base, ext = osp.splitext(output)
+        output = base + '-{stem}' + ext
+    outputs = [output_name(output, fname, i) for i, fname in enumerate(
+        fnames)]
+    duplicates = sorted(set(out for out in outputs if outputs.count(out) > 1))
+    if duplicates:
+        raise ValueError(
+            "Multiple files would be exported to %s! Use '{i}' in the "
+            "output pattern to distinguish them." % ', '.join(duplicates))
+    if processes is None:
+        processes = rcParams['main.batch_processes']
+    processes = min(processes or os.cpu_count() or 1, n)
+    if processes <= 1:
+        for i, (fname, out) in enumerate(zip(fnames, outputs), 1):
+            export_recipe(recipe, fname, out, **kwargs)
+            if progress is not None:
+                progress(i, n)
+        return outputs
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    # the initializer argument of the pool requires python 3.7
+    with ProcessPoolExecutor(processes) as pool:
+        futures = [pool.submit(_export_in_worker, recipe, fname, out,
+                               **kwargs)
+                   for fname, out in zip(fnames, outputs)]
+        for i, future in enumerate(as_completed(futures), 1):
+            future.result()
+            if progress is not None:
+                progress(i, n)
+    return outputs
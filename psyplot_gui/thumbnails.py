@@ -0,0 +1,170 @@
+"""Quick-look thumbnails of the variables in a dataset
+
+The functions in this module render small previews of variables with the
+Agg backend of matplotlib without using :mod:`matplotlib.pyplot`. They do not
+create any widgets and can therefore be called from a thread pool (see the
+:class:`~psyplot_gui.plot_creator.ThumbnailLoader`).
+
+Only one slice of each variable is read and the plotted dimensions are
+strided such that not more than roughly one value per pixel is loaded. The
+rendered PNG images are cached on disk, keyed by the path, the modification
+time and the size of the file and the name of the variable."""
+import os.path as osp
+import hashlib
+import logging
+from io import BytesIO
+import numpy as np
+from psyplot_gui.common import (
+    get_cache_dir, file_identity, prune_cache_dir, touch_cache_file)
+
+
+logger = logging.getLogger(__name__)
+
+
+def thumbnail_indexers(var, size):
+    """Get the indexers to read a coarse slice of a variable
+
+    Parameters
+    ----------
+    var: xarray.Variable or xarray.DataArray
+        The variable to preview
+    size: int
+        The size of the thumbnail in pixels
+
+    Returns
+    -------
+    dict or None
+        A mapping from dimension to an integer (for the first step of the
+        dimensions that are not plotted) or a strided slice (for the last two
+        dimensions). None, if the variable is a scalar"""
+    if not var.ndim:
+        return None
+    ret = {}
+    nplot = min(var.ndim, 2)
+    for dim, n in zip(var.dims[:-nplot], var.shape[:-nplot]):
+        ret[dim] = 0
+    for dim, n in zip(var.dims[-nplot:], var.shape[-nplot:]):
+        ret[dim] = slice(None, None, max(1, n // size))
+    return ret
+
+
+def thumbnail_data(var, size):
+    """Read the data for a thumbnail
+
+    Parameters
+    ----------
+    var: xarray.Variable or xarray.DataArray
+        The variable to preview
+    size: int
+        The size of the thumbnail in pixels
+
+    Returns
+    -------
+    numpy.ma.MaskedArray or None
+        The one- or two-dimensional data with masked invalid values or None,
+        if the variable cannot be previewed"""
+    indexers = thumbnail_indexers(var, size)
+    if indexers is None or not np.issubdtype(var.dtype, np.number):
+        return None
+    data = np.asarray(var[indexers].values, dtype=float)
+    if not data.size:
+        return None
+    return np.ma.masked_invalid(data)
+
+
+def render_thumbnail(data, size):
+    """Render the data of a thumbnail
+
+    Parameters
+    ----------
+    data: numpy.ndarray
+        The data from :func:`thumbnail_data`. Two-dimensional data is shown as
+        an image and one-dimensional data as a line
+    size: int
+        The size of the thumbnail in pixels
+
+    Returns
+    -------
+    bytes
+        The PNG image"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    dpi = 72.
+    fig = Figure(figsize=(size / dpi, size / dpi), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_axis_off()
+    if data.ndim == 2:
+        ax.imshow(data, origin='lower', aspect='auto',
+                  interpolation='nearest')
+    else:
+        ax.plot(data)
+        ax.margins(0.02)
+    buf = BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi)
+    return buf.getvalue()
+
+
+def _thumbnail_file(fname, vname, var, size):
+    key = file_identity(fname) + (vname, var.dims, var.shape, size)
+    return osp.join(get_cache_dir('thumbnails'), hashlib.sha1(
+        repr(key).encode('utf-8')).hexdigest() + '.png')
+
+
+def get_thumbnail(ds, vname, size):
+    """Get the thumbnail of a variable from the disk cache or render it
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        The dataset containing the variable
+    vname: str
+        The name of the variable
+    size: int
+        The size of the thumbnail in pixels
+
+    Returns
+    -------
+    bytes or None
+        The PNG image or None, if the variable cannot be previewed
+
+    Notes
+    -----
+    The disk cache is only used for variables as they are stored in a single
+    file. Subsets (e.g. a region of interest), overviews and multi-file
+    datasets do not have the shape of the file variable and are rendered
+    every time. The cache keeps the ``'main.cache_size'`` most recently used
+    thumbnails (see :func:`psyplot_gui.common.prune_cache_dir`)"""
+    var = ds.variables[vname]
+    fname = var.encoding.get('source') or ds.encoding.get('source')
+    cache_file = None
+    # the original shape differs for subsets, overviews and concatenated files
+    if (fname and osp.isfile(fname) and
+            tuple(var.encoding.get('original_shape', ())) == var.shape):
+        try:
+            cache_file = _thumbnail_file(fname, vname, var, size)
+        except (IOError, OSError):
+            pass
+        else:
+            try:
+                with open(cache_file, 'rb') as f:
+                    ret = f.read()
+            except (IOError, OSError):
+                pass
+            else:
+                touch_cache_file(cache_file)
+                return ret
+    data = thumbnail_data(var, size)
+    if data is None:
+        return None
+    ret = render_thumbnail(data, size)
+    if cache_file is not None:
+        try:
+            with open(cache_file, 'wb') as f:
+                f.write(ret)
+            prune_cache_dir('thumbnails')
+        except (IOError, OSError):
+            # the disk cache is optional
+            logger.debug('Could not cache the thumbnail of %s', vname,
+                         exc_info=True)
+    return ret
@@ -55,6 +55,7 @@ setup(name='psyplot-gui',
           'psyplot>1.0.1',
           'qtconsole',
           'fasteners',
+          'packaging',
           'sphinx',
           'sphinx_rtd_theme',
       ],
@@ -36,6 +36,7 @@ def setup_rcparams():
     rcParams.defaultParams['main.listen_to_port'][0] = False
     rcParams.defaultParams['help_explorer.render_docs_parallel'][0] = False
     rcParams.defaultParams['help_explorer.use_intersphinx'][0] = False
+    rcParams.defaultParams['main.background_jobs'][0] = False
     rcParams.defaultParams['plugins.include'][0] = ['psyplot_gui_test.plugin']
     rcParams.defaultParams['plugins.exclude'][0] = 'all'
     rcParams.update_from_defaultParams()
@@ -53,11 +53,25 @@ class DataFrameEditorTest(bt.PsyPlotGuiTestCase):
         return self.table.model()
 
     def setUp(self):
+        import tempfile
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
         super(DataFrameEditorTest, self).setUp()
         self.editor = self.window.new_data_frame_editor()
+        # do not use the cache of the user
+        self.config_dir = tempfile.mkdtemp()
+        self._config_patch = mock.patch(
+            'psyplot.config.rcsetup.get_configdir',
+            return_value=self.config_dir)
+        self._config_patch.start()
 
     def tearDown(self):
+        import shutil
         self.editor = None
+        self._config_patch.stop()
+        shutil.rmtree(self.config_dir, ignore_errors=True)
 
     def test_dtypes(self):
         df = pd.DataFrame([
@@ -101,6 +115,38 @@ class DataFrameEditorTest(bt.PsyPlotGuiTestCase):
         self.assertTrue(self.model.index_editable)
         self.assertTrue(self.editor.cb_index_editable.isChecked())
 
+    def test_grouped_multiindex(self):
+        """Test the grouped view of a MultiIndex"""
+        from psyplot_gui.dataframeeditor import GroupedDataFrameModel
+        df = pd.DataFrame(
+            {'v': np.arange(6.)},
+            index=pd.MultiIndex.from_product([['a', 'b'], [1, 2, 3]]))
+        self.editor.set_df(df)
+        self.assertTrue(self.editor.cb_group_index.isEnabled())
+        self.editor.cb_group_index.setChecked(True)
+        model = self.model
+        self.assertIsInstance(model, GroupedDataFrameModel)
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.data(model.index(1, 0)), '+ b (3)')
+
+        # expand the second group
+        self.table.toggle_group(model.index(1, 0))
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(model.data(model.index(3, 1)), '4')
+
+        # aggregate
+        self.editor.combo_aggregate.setCurrentText('max')
+        self.assertEqual(model.data(model.index(0, 1)), '2')
+
+        # collapse the group from one of its rows
+        self.table.toggle_group(model.index(3, 0))
+        self.assertEqual(model.rowCount(), 2)
+
+        # go back to the normal view
+        self.editor.cb_group_index.setChecked(False)
+        self.assertNotIsInstance(self.model, GroupedDataFrameModel)
+        self.assertEqual(self.model.rowCount(), 6)
+
     def test_sort(self):
         """Test the sorting"""
         df = pd.DataFrame([[4, 5, 6+1j], [1, object, 3]], columns=list('abc'))
@@ -251,6 +297,121 @@ class DataFrameEditorTest(bt.PsyPlotGuiTestCase):
         self.editor.open_dataframe(u'NONEXISTENT.csv')
         self.assertIsNone(df_equals(self.model.df, df))
 
+    @unittest.skipIf(sys.platform == 'win32',
+                     'Avoid potential troubles with temporary csv files.')
+    def test_open_dataframe_usecols(self):
+        """Test the opening of selected columns with a cached schema"""
+        import os
+        from tempfile import NamedTemporaryFile
+        import psyplot_gui.dataframeeditor as dfe
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=list('abc'))
+        f = NamedTemporaryFile(suffix='.csv')
+        df.to_csv(f.name, index=False)
+        self.editor.open_dataframe(f.name, usecols=['a', 'c'])
+        self.assertIsNone(df_equals(self.model.df, df[['a', 'c']]))
+        schema = dfe.get_csv_schema(f.name)
+        self.assertEqual(schema['columns'], ['a', 'b', 'c'])
+        self.assertIn(dfe._csv_schema_key(f.name, {}), dfe._csv_schemas)
+        # test the cached schema
+        self.editor.open_dataframe(f.name)
+        self.assertIsNone(df_equals(self.model.df, df))
+        # the caches are limited
+        from psyplot_gui import rcParams
+        rcParams['main.cache_size'] = 1
+        dfe.get_csv_schema(f.name, usecols=['a'])
+        self.assertEqual(list(dfe._csv_schemas),
+                         [dfe._csv_schema_key(f.name, {'usecols': ['a']})])
+        self.assertEqual(
+            len(os.listdir(dfe.get_cache_dir('csv_schemas'))), 1)
+
+    @unittest.skipIf(sys.platform == 'win32',
+                     'Avoid potential troubles with temporary csv files.')
+    def test_export_csv(self):
+        """Test the export of a sorted dataframe to a compressed csv file"""
+        from tempfile import NamedTemporaryFile
+        df = pd.DataFrame([[3, 2, 3], [1, 5, 6], [2, 1, 0]],
+                          columns=list('abc'))
+        self.editor.set_df(df)
+        self.model.sort(1)
+        f = NamedTemporaryFile(suffix='.csv.gz')
+        worker = self.editor.export_df(f.name, chunksize=2)
+        self.assertTrue(worker.result)
+        self.assertFalse(self.editor.progress_bar.isVisible())
+        df2 = pd.read_csv(f.name, index_col=0)
+        self.assertEqual(df2['a'].tolist(), [1, 2, 3])
+        self.assertIsNone(df_equals(df2, df))
+
+    def test_export_parquet(self):
+        """Test the export to a parquet file"""
+        from tempfile import NamedTemporaryFile
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=list('abc'))
+        self.editor.set_df(df)
+        f = NamedTemporaryFile(suffix='.parquet')
+        self.editor.export_df(f.name)
+        self.assertIsNone(df_equals(pd.read_parquet(f.name), df))
+
+    def test_find(self):
+        """Test the find bar"""
+        df = pd.DataFrame([[1.5, 'ab'], [2, 'xAb'], [1.52, 'c']],
+                          columns=list('ab'))
+        self.editor.set_df(df)
+        self.editor.find('ab', case=False)
+        self.assertEqual(self.editor.hits.tolist(), [[0, 2], [1, 2]])
+        self.assertEqual(self.table.currentIndex().row(), 0)
+        self.assertEqual(self.table.currentIndex().column(), 2)
+        self.editor.txt_find.setText('1.5')
+        self.editor.txt_tolerance.setText('0.05')
+        self.editor.find_next()
+        self.assertEqual(self.editor.hits.tolist(), [[0, 1], [2, 1]])
+        self.editor.find_next()
+        self.assertEqual(self.table.currentIndex().row(), 2)
+        self.editor.find_next()
+        self.assertEqual(self.table.currentIndex().row(), 0)
+        self.editor.find_previous()
+        self.assertEqual(self.table.currentIndex().row(), 2)
+        self.editor.find('nothing')
+        self.assertEqual(len(self.editor.hits), 0)
+
+    def test_replace_all(self):
+        """Test the replacement of values"""
+        df = pd.DataFrame([[1.5, 'ab'], [2, 'xAb'], [1.52, 'c']],
+                          columns=list('ab'))
+        self.editor.set_df(df)
+        self.editor.replace_all('z', 'ab', case=False)
+        self.assertEqual(df['b'].tolist(), ['z', 'xz', 'c'])
+        self.editor.replace_all('3', '1.5', tol=0.05)
+        self.assertEqual(df['a'].tolist(), [3, 2, 3])
+
+    def test_replace_literal(self):
+        """Test case insensitive literal replacements in several columns"""
+        from psyplot_gui.dataframeeditor import replace_in_df
+        df = pd.DataFrame([['A.b', 'xa.B'], ['acb', 'a.b']],
+                          columns=list('ab'))
+        columns, nreplaced = replace_in_df(df, 'a.b', r'\1\d', case=False)
+        self.assertEqual(nreplaced, 3)
+        self.assertEqual(columns[0].tolist(), [r'\1\d', 'acb'])
+        self.assertEqual(columns[1].tolist(), [r'x\1\d', r'\1\d'])
+        self.assertEqual(df['a'].tolist(), ['A.b', 'acb'])
+
+    def test_add_column(self):
+        """Test the computation of new columns"""
+        df = pd.DataFrame([[1., 4.], [2., 5.]], columns=list('ab'))
+        self.editor.set_df(df)
+        self.editor.add_column('ratio = a / b * 100')
+        self.assertEqual(df['ratio'].tolist(), [25., 40.])
+        self.assertEqual(self.model.columnCount(), 4)
+        self.assertEqual(self.model.headerData(3, Qt.Horizontal), 'ratio')
+        self.assertEqual(self.model.data(self.model.index(1, 3)), '40')
+        self.assertTrue(self.table.frozen_table_view.isColumnHidden(3))
+        # update an existing column
+        self.editor.add_column('ratio = a + b')
+        self.assertEqual(df['ratio'].tolist(), [5., 7.])
+        self.assertEqual(self.model.columnCount(), 4)
+
     def test_close(self):
         self.editor.close()
         self.assertFalse(self.window.dataframeeditors)
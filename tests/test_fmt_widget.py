@@ -58,13 +58,11 @@ class FormatoptionWidgetTest(bt.PsyPlotGuiTestCase):
         fmt_w.dim_widget.coord_combo.load_coord()
         model = fmt_w.dim_widget.coord_combo.model()
         selection_model = fmt_w.dim_widget.coord_combo.view().selectionModel()
-        item = model.item(2)
-        selection_model.select(model.indexFromItem(item), ClearAndSelect)
+        selection_model.select(model.index(2, 0), ClearAndSelect)
         fmt_w.dim_widget.insert_from_combo()
         self.assertEqual(fmt_w.get_text(), '[1]')
         # select a second item
-        item = model.item(3)
-        selection_model.select(model.indexFromItem(item), ClearAndSelect)
+        selection_model.select(model.index(3, 0), ClearAndSelect)
         fmt_w.dim_widget.insert_from_combo()
         self.assertEqual(fmt_w.get_text(), '[1, 2]')
 
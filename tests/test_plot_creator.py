@@ -36,11 +36,387 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
         ds = psy.open_dataset(fname)
         self.assertIn(fname, self.pc.ds_combo.currentText())
         self.assertEqual(
-            {asstring(vtab.item(irow, 0).text()) for irow in range(
-                vtab.rowCount())},
+            {asstring(vtab.model().index(irow, 0).data()) for irow in range(
+                vtab.model().rowCount())},
             set(ds.variables) - set(ds.coords))
         ds.close()
 
+    def test_load_multiple_files(self):
+        """Test opening multiple files with progress and cancelling"""
+        from psyplot_gui.datasets import OpenCancelled, open_dataset
+        fname = self.get_file('test-t2m-u-v.nc')
+        steps = []
+        opened = []
+        self.pc.open_dataset([fname, fname], concat_dim='time',
+                             on_open=opened.append)
+        self.assertEqual(len(opened), 1)
+        self.assertIs(opened[0], self.pc.get_ds())
+        self.assertFalse(self.pc.open_progress.isVisible())
+        self.assertTrue(self.pc.bt_open_file.isEnabled())
+
+        # cancel after the probe of the first file
+        def progress(i, n):
+            steps.append((i, n))
+            return i < 1
+        with self.assertRaises(OpenCancelled):
+            open_dataset([fname, fname], concat_dim='time',
+                         progress=progress)
+        self.assertEqual(steps[:2], [(0, 3), (1, 3)])
+
+    def test_load_parallel(self):
+        """Test opening multiple files in parallel with cached coordinates"""
+        from psyplot_gui.datasets import open_dataset, coords_consistent
+        fname = self.get_file('test-t2m-u-v.nc')
+        ref = open_dataset([fname, fname], concat_dim='time', parallel=False)
+        ds = open_dataset([fname, fname], concat_dim='time', parallel=True,
+                          workers=2)
+        self.assertTrue(coords_consistent([fname, fname], 'time'))
+        self.assertEqual(dict(ds.dims), dict(ref.dims))
+        ds.close()
+        ref.close()
+
+    def test_fingerprint_cache(self):
+        """Test the bounded cache of the coordinate fingerprints"""
+        import os
+        from psyplot_gui import rcParams
+        from psyplot_gui.common import get_cache_dir
+        from psyplot_gui.datasets import (
+            get_coord_fingerprint, save_coord_fingerprint,
+            _coord_fingerprints)
+        fname = self.get_file('test-t2m-u-v.nc')
+        rcParams['main.cache_size'] = 1
+        save_coord_fingerprint(fname, 'time', 'a')
+        save_coord_fingerprint(fname, 'lev', 'b')
+        self.assertEqual(get_coord_fingerprint(fname, 'lev'), 'b')
+        self.assertEqual(len(_coord_fingerprints), 1)
+        self.assertEqual(len(os.listdir(get_cache_dir('coord_fingerprints'))),
+                         1)
+
+    def test_load_arrays(self):
+        """Test loading the data of the arrays in parallel"""
+        from psyplot_gui.datasets import LoadCancelled, load_arrays
+        fname = self.get_file('test-t2m-u-v.nc')
+        self.pc.open_dataset([fname])
+        self.pc.pm_combo.setCurrentIndex(self.pc.pm_combo.findText(''))
+        QTest.mouseClick(self.pc.bt_add_all, Qt.LeftButton)
+        self.pc.cbox_load.setChecked(True)
+        self.pc.create_plots()
+        sp = psy.gcp()
+        self.assertEqual(len(sp), self.pc.array_table.rowCount())
+        for arr in sp:
+            self.assertTrue(arr.variable._in_memory, msg=arr.psy.arr_name)
+
+        # cancel loading dask arrays
+        ds = psy.open_dataset(fname, chunks={'time': 1})
+        steps = []
+
+        def progress(i, n):
+            steps.append((i, n))
+            return i < 1
+        with self.assertRaises(LoadCancelled):
+            load_arrays([ds.t2m, ds.u], progress=progress)
+        self.assertTrue(steps)
+        self.assertGreater(steps[0][1], 1)
+        self.assertFalse(ds.t2m.variable._in_memory)
+        ds.close()
+
+    def test_prefetch(self):
+        """Test the prefetching of the valid arrays"""
+        fname = self.get_file('test-t2m-u-v.nc')
+        self.pc.open_dataset([fname])
+        self.pc.pm_combo.setCurrentIndex(self.pc.pm_combo.findText(''))
+        QTest.mouseClick(self.pc.bt_add_all, Qt.LeftButton)
+        atab = self.pc.array_table
+        prefetcher = atab.prefetcher
+        keys = list(chain.from_iterable(atab.prefetch_keys.values()))
+        self.assertEqual(len(keys), atab.rowCount())
+        for key in keys:
+            self.assertIsNotNone(prefetcher.get(key))
+
+        # the prefetched data is only used for the same selection
+        cached = prefetcher.get(keys[0])
+        self.assertTrue(atab._same_selection(cached, cached.copy()))
+        if cached.ndim > 1:
+            self.assertFalse(atab._same_selection(cached, cached.T))
+        self.assertFalse(atab._same_selection(
+            cached, cached.isel(**{cached.dims[-1]: slice(1, None)})))
+
+        # removing a row cancels the request
+        removed = atab.prefetch_keys[atab.array_model.row_ids[0]][0]
+        atab.selectRow(0)
+        atab.remove_arrays()
+        self.assertIsNone(prefetcher.get(removed))
+
+        # the memory cap
+        prefetcher.max_bytes = 0
+        prefetcher.cancel()
+        atab.check_arrays()
+        self.assertEqual(prefetcher.nbytes, 0)
+        prefetcher.max_bytes = None
+
+        atab.check_arrays()
+        self.pc.create_plots()
+        sp = psy.gcp()
+        self.assertEqual(len(sp), 2)
+        for arr in sp:
+            self.assertTrue(arr.variable._in_memory, msg=arr.psy.arr_name)
+
+    def test_size_estimate(self):
+        """Test the estimates of the memory of the arrays"""
+        from psyplot_gui.datasets import estimate_bytes, format_bytes
+        import psyplot_gui.plot_creator as pc_mod
+        fname = self.get_file('test-t2m-u-v.nc')
+        self.pc.open_dataset([fname])
+        self.pc.pm_combo.setCurrentIndex(self.pc.pm_combo.findText(''))
+        QTest.mouseClick(self.pc.bt_add_all, Qt.LeftButton)
+        atab = self.pc.array_table
+        ds = self.pc.get_ds()
+        nbytes = [estimate_bytes(ds, name)[0] for name in chain.from_iterable(
+            atab.vnames)]
+        self.assertEqual(atab.total_bytes[0], sum(nbytes))
+        self.assertEqual(
+            atab.array_model.text(0, atab.size_col).split()[:2],
+            format_bytes(nbytes[0]).split())
+        self.assertIn(format_bytes(sum(nbytes)), self.pc.size_label.text())
+
+        # block the creation of the plots if the memory is not sufficient
+        ok = self.pc.bbox.button(pc_mod.QDialogButtonBox.Ok)
+        orig = pc_mod.available_memory
+        pc_mod.available_memory = lambda: 1
+        try:
+            self.pc.cbox_load.setChecked(True)
+            self.assertFalse(ok.isEnabled())
+            self.pc.cbox_load.setChecked(False)
+            self.assertTrue(ok.isEnabled())
+        finally:
+            pc_mod.available_memory = orig
+
+        atab.selectRow(0)
+        atab.remove_arrays()
+        self.assertEqual(atab.total_bytes[0], sum(nbytes[1:]))
+
+    def test_region(self):
+        """Test the selection of a region of interest"""
+        from psyplot_gui.datasets import roi_indexers, subset_dataset
+        self.test_load_external_file()
+        ds = self.pc.get_ds()
+        lon = ds.lon.values
+        lat = ds.lat.values
+        bounds = {'x': (lon[2], lon[5]),
+                  'lat': (min(lat[1], lat[3]), max(lat[1], lat[3])),
+                  't': (str(ds.time.values[1]), None)}
+        self.assertEqual(roi_indexers(ds, bounds),
+                         {'lon': slice(2, 6), 'lat': slice(1, 4),
+                          'time': slice(1, ds.time.size)})
+        with self.assertRaisesRegex(ValueError, 'lon'):
+            subset_dataset(ds, {'lon': (lon.max() + 1, None)})
+
+        # select the region in the plot creator
+        self.pc.region_selector.set_bounds({'x': (lon[2], lon[5])})
+        self.assertEqual(self.pc.region_selector.bounds,
+                         {'x': (str(lon[2]), str(lon[5]))})
+        self.pc.region_selector.bt_apply.click()
+        self.assertIn('x=', self.pc.ds_combo.currentText())
+        self.assertEqual(self.pc.get_ds().lon.values.tolist(),
+                         lon[2:6].tolist())
+
+    def test_overview(self):
+        """Test the coarsened overview of a dataset"""
+        import numpy as np
+        from psyplot_gui.datasets import coarsen_dataset, overview_factors
+        self.test_load_external_file()
+        ds = self.pc.get_ds()
+        nlon = ds.lon.size
+        self.assertEqual(overview_factors(ds, nlon // 2)['lon'], 2)
+        coarse = coarsen_dataset(ds, size=nlon // 2, how='max')
+        self.assertEqual(coarse.lon.size, nlon // 2)
+        self.assertEqual(coarse.t2m.attrs, ds.t2m.attrs)
+        ref = ds.t2m.values
+        ref = np.maximum(ref[..., ::2], ref[..., 1::2])
+        ref = np.maximum(ref[..., ::2, :], ref[..., 1::2, :])
+        np.testing.assert_allclose(coarse.t2m.values, ref)
+        # resample the time
+        coarse = coarsen_dataset(ds, freq='100D')
+        self.assertEqual(
+            coarse.time.size, ds.t2m.resample(time='100D').mean().time.size)
+
+        # create an overview in the plot creator
+        self.pc.overview_selector.how_combo.setCurrentIndex(1)
+        self.pc.overview_selector.size_edit.setText(str(nlon // 2))
+        self.pc.overview_selector.bt_apply.click()
+        self.assertIn('overview: mean', self.pc.ds_combo.currentText())
+        self.assertEqual(self.pc.get_ds().lon.size, nlon // 2)
+
+    def test_time_cache(self):
+        """Test the cache for the decoded times"""
+        import numpy as np
+        import xarray as xr
+        from psyplot_gui.datasets import open_dataset, _decoded_times
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+        fname = self.get_file('test-t2m-u-v.nc')
+        ref = psy.open_dataset(fname)
+        _decoded_times.clear()
+        ds = open_dataset([fname])
+        np.testing.assert_array_equal(ds.time.values, ref.time.values)
+        self.assertEqual(ds.time.encoding['units'],
+                         ref.time.encoding['units'])
+        self.assertEqual(len(_decoded_times), 1)
+        ds.close()
+        # the times are not decoded again (also not from the disk cache)
+        for clear in [False, True]:
+            if clear:
+                _decoded_times.clear()
+            with mock.patch.object(xr, 'decode_cf',
+                                   side_effect=AssertionError):
+                ds = open_dataset([fname, fname], concat_dim='time',
+                                  combine='nested', parallel=False)
+            self.assertEqual(ds.time.size, 2 * ref.time.size)
+            np.testing.assert_array_equal(ds.time.values[:ref.time.size],
+                                          ref.time.values)
+            ds.close()
+        ref.close()
+
+        # data variables with times and timedeltas are decoded as usual
+        import os
+        import tempfile
+        import shutil
+        import os.path as osp
+        from psyplot_gui.common import get_cache_dir
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        fname = osp.join(tmpdir, 'times.nc')
+        units = 'days since 2000-01-01'
+        xr.Dataset(
+            {'tvar': ('time', [3, 4], {'units': units}),
+             'dt': ('time', [1, 2], {'units': 'hours'})},
+            {'time': ('time', [0, 1], {'units': units})}).to_netcdf(fname)
+        ref = psy.open_dataset(fname)
+        ds = open_dataset([fname])
+        for name in ['time', 'tvar', 'dt']:
+            self.assertEqual(ds[name].dtype, ref[name].dtype, msg=name)
+            np.testing.assert_array_equal(ds[name].values, ref[name].values)
+        ds.close()
+        ref.close()
+
+        # the caches are limited
+        from psyplot_gui import rcParams
+        rcParams['main.cache_size'] = 1
+        fname = osp.join(tmpdir, 'new_times.nc')
+        xr.Dataset(coords={'time': ('time', np.random.rand(3),
+                                    {'units': units})}).to_netcdf(fname)
+        ds = open_dataset([fname])
+        ds.close()
+        self.assertEqual(len(_decoded_times), 1)
+        self.assertEqual(len(os.listdir(get_cache_dir('decoded_times'))), 1)
+
+    def test_zarr(self):
+        """Test opening zarr stores"""
+        import os
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+        import os.path as osp
+        import tempfile
+        from psyplot_gui.datasets import (
+            is_zarr, zarr_path, zarr_consolidated, zarr_kwargs)
+        tmpdir = tempfile.mkdtemp()
+        store = osp.join(tmpdir, 'test')
+        os.makedirs(store)
+        self.assertFalse(is_zarr(store))
+        with open(osp.join(store, '.zgroup'), 'w') as f:
+            f.write('{"zarr_format": 2}')
+        self.assertTrue(is_zarr(store))
+        self.assertEqual(zarr_path(osp.join(store, '.zgroup')), store)
+        self.assertFalse(zarr_consolidated(store))
+        self.assertFalse(is_zarr(self.get_file('test-t2m-u-v.nc')))
+        # zip stores without the .zarr suffix
+        import zipfile
+        zipped = osp.join(tmpdir, 'test.zip')
+        with zipfile.ZipFile(zipped, 'w') as f:
+            f.writestr('.zgroup', '{"zarr_format": 2}')
+        self.assertTrue(is_zarr(zipped))
+        other = osp.join(tmpdir, 'other.zip')
+        with zipfile.ZipFile(other, 'w') as f:
+            f.writestr('data.txt', '')
+        self.assertFalse(is_zarr(other))
+        # other files are not opened
+        with mock.patch('zipfile.is_zipfile') as is_zipfile:
+            self.assertFalse(is_zarr(self.get_file('test-t2m-u-v.nc')))
+        is_zipfile.assert_not_called()
+        # the identity changes with the files in the subdirectories
+        from psyplot_gui.common import file_identity
+        os.makedirs(osp.join(store, 'var'))
+        identity = file_identity(store)
+        with open(osp.join(store, 'var', '.zarray'), 'w') as f:
+            f.write('{"zarr_format": 2, "shape": [10]}')
+        self.assertNotEqual(file_identity(store), identity)
+        with self.assertRaisesRegex(ValueError, 'cannot be combined'):
+            zarr_kwargs([store, self.get_file('test-t2m-u-v.nc')], {})
+        try:
+            import zarr  # noqa: F401
+        except ImportError:
+            self.skipTest('zarr is not installed')
+        fname = self.get_file('test-t2m-u-v.nc')
+        ds = psy.open_dataset(fname)
+        store = osp.join(tmpdir, 'test.zarr')
+        ds.to_zarr(store, consolidated=True)
+        self.assertTrue(zarr_consolidated(store))
+        kwargs = {}
+        zarr_kwargs([store], kwargs)
+        self.assertEqual(kwargs['engine'], 'zarr')
+        self.assertTrue(kwargs['backend_kwargs']['consolidated'])
+        self.pc.open_dataset([store])
+        self.assertIn(store, self.pc.ds_combo.currentText())
+        self.assertEqual(set(self.pc.get_ds().variables), set(ds.variables))
+        ds.close()
+
+    def test_auto_chunk(self):
+        """Test the chunking for the access pattern of a plot method"""
+        from psyplot_gui.datasets import (
+            infer_chunks, plotted_dims, rechunk_for_plot)
+        from psyplot_gui.content_widget import DatasetTreeItem
+
+        class MapPlot(object):
+            """Mimic the defaults of a plot method for maps"""
+            _default_dims = {'x': slice(None), 'y': slice(None)}
+            _default_slice = 0
+
+        ds = psy.open_dataset(self.get_file('test-t2m-u-v.nc'))
+        self.assertEqual(plotted_dims(ds, 't2m', MapPlot), ['lat', 'lon'])
+        nlat = ds.lat.size
+        nlon = ds.lon.size
+        ntime = ds.time.size
+        nlev = ds.lev.size
+        nbytes = nlat * nlon * ds.t2m.dtype.itemsize
+        self.assertEqual(infer_chunks(ds, MapPlot, max_bytes=nbytes),
+                         {'time': 1, 'lev': 1, 'lat': nlat, 'lon': nlon})
+        # the outermost plotted dimension is split for too large chunks
+        chunks = infer_chunks(ds, MapPlot, max_bytes=nbytes // 2)
+        self.assertEqual(chunks['lat'], -(-nlat // 2))
+        self.assertEqual(chunks['lon'], nlon)
+        # and multiple steps of the other dimensions are grouped
+        self.assertEqual(infer_chunks(ds, MapPlot, max_bytes=nbytes * 2),
+                         {'time': 1, 'lev': 2, 'lat': nlat, 'lon': nlon})
+        self.assertEqual(
+            infer_chunks(ds, MapPlot, max_bytes=nbytes * nlev * 2),
+            {'time': 2, 'lev': nlev, 'lat': nlat, 'lon': nlon})
+        chunked = rechunk_for_plot(ds, MapPlot)
+        self.assertEqual(
+            DatasetTreeItem.format_chunks(chunked.t2m.variable),
+            'time: %i, lev: %i, lat: %i, lon: %i' % (ntime, nlev, nlat, nlon))
+        ds.close()
+
+        # datasets in the plot creator are rechunked for the plot method
+        self.test_load_external_file()
+        self.assertIsNone(self.pc.get_ds().t2m.chunks)
+        self.pc.pm_combo.setCurrentIndex(
+            self.pc.pm_combo.findText('gui_test_plotter'))
+        self.assertIsNotNone(self.pc.get_ds().t2m.chunks)
+
     def test_load_from_console(self):
         """Test whether a dataset can be loaded that is defined in the
         console"""
@@ -54,12 +430,102 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
         self.pc.bt_get_ds.get_from_shell('ds')
         self.assertIn('ds', self.pc.ds_combo.currentText())
         self.assertEqual(
-            {asstring(vtab.item(irow, 0).text()) for irow in range(
-                vtab.rowCount())},
+            {asstring(vtab.model().index(irow, 0).data()) for irow in range(
+                vtab.model().rowCount())},
             set(ds.variables) - set(ds.coords))
         ds.close()
         self.window.console.execute("ds.close()")
 
+    def test_coord_combo(self):
+        """Test the lazy loading and searching of the coordinate values"""
+        self.test_load_external_file()
+        ds = self.pc.get_ds()
+        cb = next(cb for cb in self.pc.coords_table.combo_boxes
+                  if cb.dim == 'lev')
+        model = cb.model()
+        self.assertEqual(model.rowCount(), 0)
+        cb.load_coord()
+        self.assertEqual(model.rowCount(), ds.lev.size + 1)
+        self.assertEqual(cb.itemText(2), '1')
+        self.assertEqual(model.find_row('1'), 2)
+        # now the coordinates
+        cb.clear()
+        cb.use_coords = True
+        cb.load_coord()
+        self.assertEqual(cb.itemText(2), str(ds.lev.values[1]))
+        self.assertEqual(model.find_row(str(ds.lev.values[1])), 2)
+        cb.search_edit.setText(str(ds.lev.values[-1]))
+        self.assertEqual(cb.view().currentIndex().row(), ds.lev.size)
+
+    def test_variables_filter(self):
+        """Test the filtering of the variables table"""
+        vtab = self.pc.variables_table
+        # filtering without a dataset
+        vtab.variables_model.set_dataset(None)
+        self.pc.variables_filter.setText('t')
+        self.assertEqual(vtab.variables_model.filtered_variables, [])
+        self.pc.variables_filter.setText('')
+        self.test_load_external_file()
+        nvar = vtab.model().rowCount()
+        self.pc.variables_filter.setText('t')
+        self.assertIn('t2m', vtab.variables_model.filtered_variables)
+        self.pc.variables_filter.setText('t2')
+        self.assertEqual(vtab.variables_model.filtered_variables, ['t2m'])
+        self.assertEqual(vtab.model().rowCount(), 1)
+        vtab.selectAll()
+        self.assertEqual(vtab.selected_variables, ['t2m'])
+        self.pc.variables_filter.setText('')
+        self.assertEqual(vtab.model().rowCount(), nvar)
+
+    def test_thumbnails(self):
+        """Test the thumbnails of the variables table"""
+        import os
+        import os.path as osp
+        from psyplot_gui.thumbnails import (
+            _thumbnail_file, thumbnail_indexers, get_thumbnail)
+        self.test_load_external_file()
+        vtab = self.pc.variables_table
+        model = vtab.variables_model
+        ncols = model.columnCount()
+        self.pc.cbox_thumbnails.setChecked(True)
+        self.assertEqual(model.columnCount(), ncols + 1)
+        row = model.filtered_variables.index('t2m')
+        pixmap = model.index(row, model.thumbnail_col).data(
+            Qt.DecorationRole)
+        self.assertIsNotNone(pixmap)
+        self.assertFalse(pixmap.isNull())
+        self.assertEqual(pixmap.width(), model.thumbnail_size)
+        ds = self.pc.get_ds()
+        fname = self.get_file('test-t2m-u-v.nc')
+        self.assertTrue(osp.exists(_thumbnail_file(
+            fname, 't2m', ds.variables['t2m'], model.thumbnail_size)))
+        # subsets are not taken from the disk cache
+        sub = ds.isel(lon=slice(0, 10))
+        self.assertNotEqual(
+            get_thumbnail(sub, 't2m', model.thumbnail_size),
+            get_thumbnail(ds, 't2m', model.thumbnail_size))
+        self.assertFalse(osp.exists(_thumbnail_file(
+            fname, 't2m', sub.variables['t2m'], model.thumbnail_size)))
+        # the disk cache is limited
+        from psyplot_gui import rcParams
+        from psyplot_gui.common import get_cache_dir
+        rcParams['main.cache_size'] = 1
+        cache_file = _thumbnail_file(fname, 't2m', ds.variables['t2m'],
+                                     model.thumbnail_size + 1)
+        if osp.exists(cache_file):
+            os.remove(cache_file)
+        get_thumbnail(ds, 't2m', model.thumbnail_size + 1)
+        self.assertEqual(os.listdir(get_cache_dir('thumbnails')),
+                         [osp.basename(cache_file)])
+        # only the last two dimensions are read with a stride
+        var = ds['t2m']
+        indexers = thumbnail_indexers(var, 2)
+        self.assertEqual([indexers[d] for d in var.dims[:-2]],
+                         [0] * (var.ndim - 2))
+        self.assertEqual(indexers[var.dims[-1]].step, var.shape[-1] // 2)
+        self.pc.cbox_thumbnails.setChecked(False)
+        self.assertEqual(model.columnCount(), ncols)
+
     def test_plusplus(self):
         """Test the add all button"""
         # loag a dataset
@@ -70,8 +536,19 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
         self.assertEqual(
             [asstring(atab.item(irow, 0).text()) for irow in range(
                 atab.rowCount())],
-            [asstring(vtab.item(irow, 0).text()) for irow in range(
-                vtab.rowCount())])
+            [asstring(vtab.model().index(irow, 0).data()) for irow in range(
+                vtab.model().rowCount())])
+        # only the filtered variables are added
+        atab.remove_arrays(False)
+        self.pc.variables_filter.setText('t2')
+        QTest.mouseClick(self.pc.bt_add_all, Qt.LeftButton)
+        self.assertEqual(
+            [asstring(atab.item(irow, 0).text()) for irow in range(
+                atab.rowCount())], ['t2m'])
+        self.pc.variables_filter.setText('')
+        atab.remove_arrays(False)
+        QTest.mouseClick(self.pc.bt_add_all, Qt.LeftButton)
+        self.assertEqual(atab.rowCount(), vtab.model().rowCount())
 
     def test_minusminus(self):
         """Test the remove all button"""
@@ -84,15 +561,16 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
         self.test_load_external_file()
         vtab = self.pc.variables_table
         atab = self.pc.array_table
-        nvar = vtab.rowCount()
+        nvar = vtab.model().rowCount()
         rows = [nvar - 2, nvar - 1]
-        for row in rows:
-            vtab.item(row, 0).setSelected(True)
+        variables = [asstring(vtab.model().index(irow, 0).data())
+                     for irow in rows]
+        vtab.select_variables(variables)
         QTest.mouseClick(self.pc.bt_add, Qt.LeftButton)
         self.assertEqual(
             [asstring(atab.item(irow, 0).text()) for irow in range(
                 atab.rowCount())],
-            [asstring(vtab.item(irow, 0).text()) for irow in rows])
+            variables)
 
     def test_minus(self):
         """Test the minus button"""
@@ -104,13 +582,141 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
         for row in rows:
             atab.item(row, 0).setSelected(True)
         QTest.mouseClick(self.pc.bt_remove, Qt.LeftButton)
-        variables = [asstring(vtab.item(row, 0).text())
-                     for row in range(vtab.rowCount()) if row not in rows]
+        variables = [asstring(vtab.model().index(row, 0).data())
+                     for row in range(vtab.model().rowCount())
+                     if row not in rows]
         self.assertEqual(
             [asstring(atab.item(irow, 0).text()) for irow in range(
                 atab.rowCount())],
             variables)
 
+    def test_check_duplicates(self):
+        """Test the debounced check of duplicated array names"""
+        self.test_plusplus()
+        atab = self.pc.array_table
+        names = atab.current_names
+        self.assertEqual(set(atab.name_counts.values()), {1})
+        # rename the second array to the first one
+        atab.item(1, atab.arr_col).setText(names[0])
+        self.assertEqual(atab.name_counts[names[0]], 2)
+        self.assertNotIn(names[1], atab.name_counts)
+        self.assertEqual(atab.check_dirty_rows(), [0, 1])
+        self.assertIn('duplicated',
+                      asstring(atab.item(1, atab.check_col).toolTip()))
+        self.assertNotIn(atab.next_available_name(), atab.name_counts)
+        # rename it back
+        atab.item(1, atab.arr_col).setText(names[1])
+        self.assertEqual(atab.check_dirty_rows(), [0, 1])
+        self.assertEqual(set(atab.name_counts.values()), {1})
+
+    def test_insert_arrays(self):
+        """Test the batch insertion and moving of arrays"""
+        self.test_load_external_file()
+        atab = self.pc.array_table
+        model = atab.model()
+        ntimes = self.pc.get_ds().time.size
+        atab.insert_arrays(['t2m'] * ntimes,
+                           [{'time': str(i)} for i in range(ntimes)])
+        self.assertEqual(atab.rowCount(), ntimes)
+        self.assertEqual(len(atab.name_counts), ntimes)
+        icol = len(atab.desc_cols) + atab.dims.index('time')
+        self.assertEqual(model.column_texts(icol),
+                         list(map(str, range(ntimes))))
+        # update multiple arrays
+        atab.selectAll()
+        atab.update_selected(dims={'lev': '0'})
+        icol2 = len(atab.desc_cols) + atab.dims.index('lev')
+        self.assertEqual(model.column_texts(icol2), ['0'] * ntimes)
+        # one dataChanged signal per contiguous block of rows
+        changed = []
+        model.dataChanged.connect(
+            lambda i1, i2, *args: changed.append((i1.row(), i2.row())))
+        model.set_values(icol2, {0: '1', 1: '1', 3: '1'})
+        self.assertEqual(changed, [(0, 1), (3, 3)])
+        # move the last row to the top
+        item = atab.item(ntimes - 1, icol)
+        names = atab.current_names
+        model.move_rows([ntimes - 1], 0)
+        self.assertEqual(item.row(), 0)
+        self.assertEqual(asstring(item.text()), str(ntimes - 1))
+        self.assertEqual(atab.current_names, names[-1:] + names[:-1])
+
+    def test_slice_dims(self):
+        """Test that slices in the array table are kept as slices"""
+        self.test_load_external_file()
+        atab = self.pc.array_table
+        texts = ['0:3', '1:5:2', '2', '3:', '0, 2:4']
+        expected = [slice(0, 3), slice(1, 5, 2), 2, slice(3, None),
+                    [0, 2, 3]]
+        atab.insert_arrays(['t2m'] * len(texts),
+                           [{'time': text} for text in texts])
+        self.assertEqual([atab._get_dims(row)['time']
+                          for row in range(len(texts))], expected)
+        self.assertEqual(
+            [d['time'] for d in atab.arr_names_dict.values()], expected)
+
+    def test_recipe(self):
+        """Test saving a recipe and applying it to the dataset"""
+        import tempfile
+        import os.path as osp
+        from psyplot_gui import recipes
+        self.test_load_external_file()
+        atab = self.pc.array_table
+        atab.insert_arrays(['t2m', 't2m'], [{'time': '1:3'}, {'time': '2'}])
+        recipe = self.pc.get_recipe()
+        self.assertIsNone(recipe['plot_method'])
+        self.assertEqual([d['dims'] for d in recipe['arrays']],
+                         [{'time': '1:3:'}, {'time': 2}])
+        self.assertEqual(recipes.decode_dims(recipe['arrays'][0]['dims']),
+                         {'time': slice(1, 3)})
+        # save and load the recipe
+        fname = osp.join(tempfile.mkdtemp(), 'recipe.yml')
+        self.pc.save_recipe(fname)
+        self.assertEqual(recipes.load_recipe(fname), recipe)
+        # apply it to the dataset
+        sp = recipes.apply_recipe(recipe, self.pc.ds)
+        self.assertEqual(sp.arr_names,
+                         [d['arr_name'] for d in recipe['arrays']])
+        self.assertEqual(sp[0].time.size, 2)
+        self.assertEqual(sp[1].time.ndim, 0)
+        # exporting requires a plot method
+        with self.assertRaisesRegex(ValueError, 'plot method'):
+            recipes.batch_export(recipe, [self.get_file('test-t2m-u-v.nc')],
+                                 osp.join(osp.dirname(fname), 'test.pdf'),
+                                 processes=1)
+
+    def test_batch_export(self):
+        """Test exporting a recipe for multiple files"""
+        import tempfile
+        import shutil
+        import os.path as osp
+        from psyplot_gui import recipes
+        self.test_load_external_file()
+        self.pc.pm_combo.setCurrentIndex(
+            self.pc.pm_combo.findText('gui_test_plotter'))
+        self.pc.array_table.insert_arrays(['t2m'], [{'time': '0'}])
+        recipe = self.pc.get_recipe()
+        # only the changed formatoptions are stored
+        self.assertEqual(recipe['fmt'], {})
+        tmpdir = tempfile.mkdtemp()
+        fnames = []
+        for stem in ['a', 'b']:
+            fnames.append(osp.join(tmpdir, stem + '.nc'))
+            shutil.copyfile(self.get_file('test-t2m-u-v.nc'), fnames[-1])
+        for processes in [1, 2]:
+            output = osp.join(tmpdir, '{stem}-%i.png' % processes)
+            outputs = recipes.batch_export(recipe, fnames, output,
+                                           processes=processes)
+            self.assertEqual(
+                outputs, [osp.join(tmpdir, s + '-%i.png' % processes)
+                          for s in ['a', 'b']])
+            for out in outputs:
+                self.assertTrue(osp.exists(out), msg=out)
+        # files with the same name would overwrite each other
+        with self.assertRaisesRegex(ValueError, 'Multiple files'):
+            recipes.batch_export(recipe, [fnames[0], fnames[0]],
+                                 osp.join(tmpdir, '{stem}.png'), processes=1)
+
     def test_update_with_dims(self):
         """Test the update with the given dimensions"""
         self.test_plusplus()
@@ -176,6 +782,32 @@ class PlotCreatorTest(bt.PsyPlotGuiTestCase):
             range(1, nvar + 1)))
         plt.close('all')
 
+    def test_axes_batch(self):
+        """Test the creation of multiple axes per figure at once"""
+        import matplotlib.pyplot as plt
+        from psyplot_gui.plot_creator import create_axes_batch
+        nfigs = len(self.window.figures)
+        specs = [('subplot', [1, 2, 2, i, i]) for i in range(1, 5)]
+        specs += [('subplot', [1, 2, 2, 1]), None,
+                  ('axes', [2, 0.1, 0.1, 0.5, 0.5]),
+                  ('axes', [2, 0.1, 0.1, 0.5, 0.5])]
+        axes = create_axes_batch(specs)
+        self.assertEqual(len(axes), len(specs))
+        self.assertIs(axes[0], axes[4])
+        self.assertIsNone(axes[5])
+        self.assertIs(axes[6], axes[7])
+        self.assertEqual(len({ax.get_figure() for ax in axes[:5]}), 1)
+        self.assertEqual(axes[0].get_figure().number, 1)
+        self.assertEqual(axes[6].get_figure().number, 2)
+        ss = [ax.get_subplotspec() for ax in axes[:4]]
+        self.assertEqual([s.num1 for s in ss], list(range(4)))
+        self.assertEqual(len({s.get_gridspec() for s in ss}), 1)
+        # the docks of the new figures have been added to the main window
+        self.assertEqual(len(self.window.figures), nfigs + 2)
+        # existing axes are reused
+        self.assertEqual(create_axes_batch(specs[:4]), axes[:4])
+        plt.close('all')
+
     def test_axescreator_subplots(self):
         """Test the :class:`psyplot_gui.plot_creator.SubplotCreator`"""
         import matplotlib.pyplot as plt
@@ -116,6 +116,47 @@ class ProjectContentTest(bt.PsyPlotGuiTestCase):
         self.assertIs(psy.gcp()[0], sp[0], msg='Reselection failed!')
         self.assertIs(psy.gcp()[1], sp[1], msg='Reselection failed!')
 
+    def test_incremental_update(self):
+        """Test whether only the changed items are updated"""
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+        fname = self.get_file('test-t2m-u-v.nc')
+        sp = psy.plot.gui_test_plotter(fname, name='t2m', time=[0, 1, 2])
+        l = self.get_list('All')
+        items = list(map(l.item, range(l.count())))
+        self.assertEqual([item.arr() for item in items],
+                         [arr.psy for arr in sp])
+        # remove the array in the middle
+        sp[1:2].close(True, True)
+        self.assertEqual(list(map(l.item, range(l.count()))),
+                         [items[0], items[2]])
+        # add a new array
+        sp2 = psy.plot.gui_test_plotter(fname, name='t2m', time=3)
+        self.assertEqual(l.count(), 3)
+        self.assertIs(l.item(0), items[0])
+        self.assertIs(l.item(2).arr(), sp2[0].psy)
+        self.assertEqual(self._selected_rows('All'), [2])
+        # resort the items
+        mp = psy.gcp(True)
+        mp.insert(0, mp.pop(2))
+        l.update_from_project(mp)
+        self.assertEqual([l.item(i).arr() for i in range(l.count())],
+                         [arr.psy for arr in mp])
+        # select the items without checking the array names
+        from psyplot.data import ArrayList
+        import psyplot_gui.content_widget as cw
+        with mock.patch.object(ArrayList, 'rename') as rename, \
+                mock.patch.object(ArrayList, '_contains_array') as contains, \
+                mock.patch.object(cw, 'scp') as scp:
+            items[0].setSelected(True)
+        rename.assert_not_called()
+        contains.assert_not_called()
+        psy.scp(scp.call_args[0][0])
+        self.assertEqual(psy.gcp().arr_names,
+                         [sp2[0].psy.arr_name, sp[0].psy.arr_name])
+
 
 class FiguresTreeTest(bt.PsyPlotGuiTestCase):
     """Test to check whether the figures tree behaves correctly"""
@@ -191,6 +232,51 @@ class DatasetTreeTest(bt.PsyPlotGuiTestCase):
                          '*%i: %s' % (count - 1, fname))
         self.assertEqual(self.tree.topLevelItemCount(), 1)
 
+    def test_registry(self):
+        """Test the incremental updates of the dataset registry"""
+        from psyplot_gui.content_widget import dataset_registry
+        fname = self.get_file('test-t2m-u-v.nc')
+        sp1 = psy.plot.gui_test_plotter(fname, name=['t2m', 'u'])
+        sp2 = psy.plot.gui_test_plotter(fname, name='t2m')
+        ds1 = sp1[0].psy.base
+        ds2 = sp2[0].psy.base
+        descs = dataset_registry.descriptions(psy.gcp())
+        self.assertEqual(list(descs), [ds1.psy.num, ds2.psy.num])
+        self.assertIs(descs[ds1.psy.num]['ds'], ds1)
+        self.assertEqual(len(descs[ds1.psy.num]['arr']), 2)
+        arr2 = sp2[0]
+        self.assertIn(arr2, dataset_registry)
+        self.assertEqual(
+            descs[ds2.psy.num]['fname'],
+            sp2.array_info(ds_description={'fname'})[sp2[0].psy.arr_name][
+                'fname'])
+        self.assertEqual(self.tree.topLevelItemCount(), 2)
+
+        # remove one array and a complete dataset
+        sp1[1:].close(True, True)
+        sp2.close(True, True)
+        descs = dataset_registry.descriptions(psy.gcp())
+        self.assertEqual(list(descs), [ds1.psy.num])
+        self.assertEqual(descs[ds1.psy.num]['arr'], [sp1[0]])
+        self.assertNotIn(arr2, dataset_registry)
+        self.assertEqual(self.tree.topLevelItemCount(), 1)
+
+        # changes of the main project without a signal
+        mp = psy.gcp(True)
+        arr1 = mp.pop(0)
+        self.assertEqual(dataset_registry.descriptions(mp), {})
+        mp.append(arr1)
+        self.assertEqual(list(dataset_registry.descriptions(mp)),
+                         [ds1.psy.num])
+
+        # base change of an array that has already been garbage collected
+        key = id(arr1)
+        num, callback = dataset_registry._arrays[key][1:]
+        dataset_registry._arrays[key] = (lambda: None, num, callback)
+        dataset_registry._base_changed(key)
+        self.assertNotIn(key, dataset_registry._arrays)
+        self.assertIsNone(dataset_registry.get(num))
+
     def _get_toplevel_item(self, ds):
         toplevel = None
         for item in map(self.tree.topLevelItem,